@@ -1,4 +1,5 @@
 from infrastructure.embeddings.gemini.client import EmbeddingClient
+from infrastructure.embeddings.cached_embedding_service import CachedEmbeddingService
 
 import domain as dom
 import application as app
@@ -8,6 +9,7 @@ from domain.specifications.eligibility_policy import CategoryEligibilityPolicy
 from infrastructure.persistence.postgresql.session import SessionLocal
 from infrastructure.prompts import Prompt
 from infrastructure.llm.gemini import LLMClient
+from infrastructure.llm.cache import InMemoryLLMCache, SQLiteLLMCache, TieredLLMCache
 
 from application.use_cases.categories.load_categories_from_file import (
     LoadCategoriesFromFileUseCase,
@@ -338,7 +340,10 @@ def test_load_tree_policy():
         cat_repository = pg.CategoryRepositoryPG(session)
         prof_repository = pg.CategoryProfileRepositoryPG(session)
         emb_repository = pg.EmbeddingRepositoryPG(session, expected_dimension=768)
-        llm_service = LLMClient()
+        cached_embedding = CachedEmbeddingService(embedding, repository=emb_repository)
+        llm_service = LLMClient(
+            cache=TieredLLMCache(InMemoryLLMCache(), SQLiteLLMCache()),
+        )
         prompt_service = Prompt(
             file_path="./src/prompts/predict_sheet_data.yaml"
         )
@@ -348,13 +353,15 @@ def test_load_tree_policy():
             category_repository=cat_repository,
             profiles_repository=prof_repository,
             embedding_repository=emb_repository,
-            embedding_service=embedding,
+            embedding_service=cached_embedding,
             llm_service=llm_service,
             prompt_service=prompt_service,
         )
 
         use_case.execute(cmd)
 
+        print(f"Embedding cache: {cached_embedding.stats()}")
+
 
 def test_create_product():
 
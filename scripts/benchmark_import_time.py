@@ -0,0 +1,88 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+DEFAULT_MODULES = [
+    "domain",
+    "config.settings",
+    "application",
+    "infrastructure.embeddings.gemini.client",
+    "infrastructure.llm.gemini.client",
+]
+
+
+def time_import(module: str) -> float | None:
+    """Wall time of a fresh interpreter importing `module` (None if it fails)."""
+
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if completed.returncode != 0:
+        last_line = (completed.stderr.strip().splitlines() or ["unknown error"])[-1]
+        print(f"{module}: import failed ({last_line})")
+        return None
+
+    return elapsed
+
+
+def baseline() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time per module.")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    empty = min(baseline() for _ in range(args.repeat))
+
+    print(f"{'module':<40} {'min ms':>8} {'median ms':>10}")
+    for module in args.modules:
+        samples = []
+        for _ in range(args.repeat):
+            elapsed = time_import(module)
+            if elapsed is None:
+                break
+            samples.append(elapsed - empty)
+
+        if not samples:
+            continue
+
+        print(
+            f"{module:<40} {min(samples) * 1000:>8.1f} "
+            f"{statistics.median(samples) * 1000:>10.1f}"
+        )
+
+    print(f"\n(interpreter start-up of {empty * 1000:.1f} ms subtracted; "
+          f"use `python -X importtime -c 'import <module>'` for a breakdown)")
+
+
+if __name__ == "__main__":
+    main()
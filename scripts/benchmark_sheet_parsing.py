@@ -0,0 +1,66 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import os
+import time
+import argparse
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from application.use_cases.categories.sheet_parser import CategorySheetParser
+
+
+def worker_counts(max_workers: int):
+    count = 1
+    while count < max_workers:
+        yield count
+        count *= 2
+    yield max_workers
+
+
+def run(parser: CategorySheetParser, file_path: str, workers: int, use_processes: bool):
+    start = time.perf_counter()
+    parsed = parser.parse_workbook(file_path, workers=workers, use_processes=use_processes)
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(categories) for _, categories in parsed)
+    return elapsed, len(parsed), total
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare thread vs process sheet parsing by worker count."
+    )
+    parser.add_argument("file_path", help="Category workbook (.xlsx)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    sheet_parser = CategorySheetParser()
+    rows = []
+
+    for workers in worker_counts(args.max_workers):
+        for mode, use_processes in (("threads", False), ("processes", True)):
+            best = None
+            for _ in range(args.repeat):
+                elapsed, sheets, total = run(sheet_parser, args.file_path, workers, use_processes)
+                best = elapsed if best is None else min(best, elapsed)
+            rows.append((mode, workers, best, sheets, total))
+
+    baseline = rows[0][2]
+
+    print(f"\n{'mode':<10} {'workers':>7} {'seconds':>9} {'speedup':>8} {'sheets':>7} {'categories':>11}")
+    for mode, workers, elapsed, sheets, total in rows:
+        print(
+            f"{mode:<10} {workers:>7} {elapsed:>9.2f} "
+            f"{baseline / elapsed:>7.2f}x {sheets:>7} {total:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import argparse
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from infrastructure.persistence.postgresql.session import SessionLocal
+from infrastructure.persistence.postgresql.vector_index import (
+    VECTOR_INDEX_METHODS,
+    VectorIndexConfig,
+    VectorIndexManager,
+)
+
+
+def create_index(args):
+    config = VectorIndexConfig(
+        method=args.method,
+        m=args.m,
+        ef_construction=args.ef_construction,
+        lists=args.lists,
+    )
+
+    with SessionLocal() as session:
+        name = VectorIndexManager(session).create(config)
+        session.commit()
+
+    print(f"Index {name} created.")
+
+
+def rebuild_index(args):
+    with SessionLocal() as session:
+        names = VectorIndexManager(session).rebuild()
+        session.commit()
+
+    print(f"Rebuilt: {', '.join(names) or 'no ANN index found'}")
+
+
+def drop_index(args):
+    with SessionLocal() as session:
+        names = VectorIndexManager(session).drop()
+        session.commit()
+
+    print(f"Dropped: {', '.join(names) or 'no ANN index found'}")
+
+
+def report_index(args):
+    with SessionLocal() as session:
+        report = VectorIndexManager(session).report(
+            k=args.k,
+            sample_size=args.samples,
+            ef_search=args.ef_search,
+            probes=args.probes,
+        )
+        session.rollback()
+
+    print(f"Rows: {report['rows']}")
+
+    for name, size in report["indexes"].items():
+        print(f"Index {name}: {size / (1024 * 1024):.1f} MiB")
+
+    print(
+        f"Recall@{args.k}: {report['recall']:.3f} over {report['samples']} queries "
+        f"(ANN {report['ann_ms']:.2f} ms, exact {report['exact_ms']:.2f} ms)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Manage the embeddings ANN index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="Create (or replace) the ANN index.")
+    create.add_argument("--method", choices=VECTOR_INDEX_METHODS, default="hnsw")
+    create.add_argument("--m", type=int, default=16)
+    create.add_argument("--ef-construction", type=int, default=64)
+    create.add_argument("--lists", type=int, default=100)
+    create.set_defaults(handler=create_index)
+
+    rebuild = commands.add_parser("rebuild", help="REINDEX the ANN index.")
+    rebuild.set_defaults(handler=rebuild_index)
+
+    drop = commands.add_parser("drop", help="Drop the ANN index.")
+    drop.set_defaults(handler=drop_index)
+
+    report = commands.add_parser("report", help="Index size and recall vs exact search.")
+    report.add_argument("--k", type=int, default=10)
+    report.add_argument("--samples", type=int, default=100)
+    report.add_argument("--ef-search", type=int, default=None)
+    report.add_argument("--probes", type=int, default=None)
+    report.set_defaults(handler=report_index)
+
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    args.handler(args)
@@ -0,0 +1,74 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Sequence, Tuple
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from domain.entities.embeddings.embedding import Embedding
+
+
+class CategoryIndex(ABC):
+    """
+    Memory-resident similarity index over category embeddings.
+
+    Rows are addressed by position; `category_ids` gives the row order
+    and masks passed to `search` must follow it.
+    """
+
+    @abstractmethod
+    def load(
+        self,
+        embeddings: Sequence[Embedding]
+    ) -> None:
+        """Replaces the index contents with the given embeddings."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def is_loaded(self) -> bool:
+        """Returns True once the index has been loaded."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def category_ids(self) -> List[str]:
+        """Returns the category IDs in row order."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def mask_for(
+        self,
+        category_ids: Iterable[str]
+    ):
+        """Builds a boolean row mask selecting the given category IDs."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def search(
+        self,
+        query_vector: Sequence[float],
+        top_k: int = 5,
+        mask=None,
+    ) -> List[Tuple[str, float]]:
+        """Returns the top-k (category_id, score) pairs by cosine similarity."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        top_k: int = 5,
+        masks: Sequence | None = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """Runs `search` for many queries at once; one result list per query."""
+        raise NotImplementedError
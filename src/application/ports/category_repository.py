@@ -34,6 +34,16 @@ class CategoryRepository(ABC):
         raise NotImplementedError
 
 
+    @abstractmethod
+    def bulk_save(
+        self,
+        categories: list[Category],
+        chunk_size: int | None = None,
+    ) -> list[Category]:
+        """Saves a large batch of categories, chunking as needed."""
+        raise NotImplementedError
+
+
     @abstractmethod
     def get_all(self) -> list[Category]:
         """Retrieves all categories from the repository."""
@@ -0,0 +1,63 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Sequence
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from domain.entities.categories.category_profile import CategoryProfile
+
+
+class EligibilityIndex(ABC):
+    """
+    Precomputed CategoryEligibilityPolicy results over the rows of a
+    CategoryIndex.
+
+    Masks returned by `mask_for` follow the row order given to `build`
+    and can be passed straight to CategoryIndex.search. Rebuild after the
+    category index is reloaded.
+    """
+
+    @abstractmethod
+    def build(
+        self,
+        profiles: Sequence[CategoryProfile],
+        category_ids: Sequence[str],
+    ) -> None:
+        """Precomputes eligibility for the given rows (CategoryIndex order)."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def is_built(self) -> bool:
+        """Returns True once `build` has run."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def category_ids(self) -> List[str]:
+        """Returns the row order the index was built for."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def mask_for(
+        self,
+        gender: str,
+        business_type: str,
+        excluded_ids: Iterable[str] = (),
+    ):
+        """Row mask of categories eligible for the context, minus exclusions."""
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def is_empty(self, mask) -> bool:
+        """Returns True if the mask selects no rows."""
+        raise NotImplementedError
@@ -31,6 +31,18 @@ class EmbeddingRepository(ABC):
         raise NotImplementedError
 
 
+    @abstractmethod
+    def bulk_save(
+        self, embeddings: list[Embedding]
+    ) -> None:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def get_all(self) -> list[Embedding]:
+        raise NotImplementedError
+
+
     @abstractmethod
     def get_by_category_id(
         self, category_id: UUID
@@ -54,6 +66,27 @@ class EmbeddingRepository(ABC):
 
     @abstractmethod
     def search_similar(
-        self, query_vector: list[float], limit: int
-    ) -> list[Embedding]:
-        raise NotImplementedError
\ No newline at end of file
+        self, query_vector: list[float], category_ids: list[str], limit: int
+    ) -> list[tuple[Embedding, float]]:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def search_similar_batch(
+        self,
+        query_vectors: list[list[float]],
+        category_ids: list[list[str] | None] | None,
+        limit: int,
+    ) -> list[list[tuple[Embedding, float]]]:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def search_eligible(
+        self,
+        query_vector: list[float],
+        limit: int,
+        allowed_ids: list[str] | None = None,
+        excluded_ids: list[str] | None = None,
+    ) -> list[tuple[Embedding, float]]:
+        raise NotImplementedError
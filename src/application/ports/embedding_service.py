@@ -22,4 +22,16 @@ class EmbeddingService(ABC):
 
     @abstractmethod
     def generate_batch(self, texts: Sequence[str]) -> List[List[float]]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+
+class AsyncEmbeddingService(ABC):
+
+    @abstractmethod
+    async def agenerate(self, text: str) -> List[float]:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    async def agenerate_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        raise NotImplementedError
@@ -0,0 +1,30 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence, Set
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+
+
+class ExclusionRepository(ABC):
+
+    @abstractmethod
+    def get_excluded_category_ids(
+        self, sku: str
+    ) -> Set[str]:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def get_excluded_category_ids_for_skus(
+        self, skus: Sequence[str]
+    ) -> Dict[str, Set[str]]:
+        """Excluded category IDs per SKU in one round trip; every SKU gets an entry."""
+        raise NotImplementedError
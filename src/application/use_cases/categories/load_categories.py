@@ -1,24 +1,21 @@
 # ---------------------------------------------------------------------
 # Standard library
 # ---------------------------------------------------------------------
-import re
-import json
-import unicodedata
-from typing import List, Dict, Any
+from typing import List, Iterable, Iterator, Set
+from itertools import islice
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
 from sqlalchemy.orm import Session
-import pandas as pd
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
 from domain.entities.categories.category import Category
 from application.ports.category_repository import CategoryRepository
+from application.use_cases.categories.sheet_parser import CategorySheetParser
 
 
 # ---------------------------------------------------------------------
@@ -28,6 +25,11 @@ from application.ports.category_repository import CategoryRepository
 class LoadCategoriesCommand:
     file_path: str
     brand: bool = False  # If True, use sheet name as brand for all categories in that sheet
+    use_processes: bool = False  # Parse sheets in worker processes instead of threads
+    workers: int | None = None  # Defaults to SHEET_WORKERS
+    streaming: bool = False  # Read rows with openpyxl and commit in chunks
+    chunk_size: int = 1000  # Categories per commit when streaming
+    collect_categories: bool = True  # If False, streaming keeps only keywords, not entities
 
 
 # ---------------------------------------------------------------------
@@ -40,14 +42,17 @@ class LoadCategoriesUseCase:
     """
 
     SHEET_WORKERS = 4
+    BULK_THRESHOLD = 2_000  # Sheets above this size use COPY-based bulk_save
 
     def __init__(
         self,
         session: Session,
         category_repository: CategoryRepository,
+        sheet_parser: CategorySheetParser | None = None,
     ):
         self.session = session
         self.category_repository = category_repository
+        self.sheet_parser = sheet_parser or CategorySheetParser()
 
     # =============================================================
     # PUBLIC API
@@ -59,6 +64,10 @@ class LoadCategoriesUseCase:
         Args:
             cmd.file_path: Path to Excel file
             cmd.brand: If True, use sheet name as brand for all categories
+            cmd.use_processes: Parse sheets in a process pool instead of threads
+            cmd.workers: Number of parsing workers (defaults to SHEET_WORKERS)
+            cmd.streaming: Stream rows and commit every cmd.chunk_size categories
+            cmd.collect_categories: Keep saved categories in the result (streaming)
 
         Returns dict with structure:
             {
@@ -68,26 +77,19 @@ class LoadCategoriesUseCase:
                 }
             }
         """
-        xls = pd.ExcelFile(cmd.file_path)
-        all_categories = {}
+        if cmd.streaming:
+            return self._execute_streaming(cmd)
 
-        parsed_results = []
+        all_categories = {}
 
         # -----------------------------
         # Stage 1 — Parallel sheet parsing
         # -----------------------------
-        with ThreadPoolExecutor(max_workers=self.SHEET_WORKERS) as executor:
-            futures = {
-                executor.submit(self._process_sheet, xls, sheet): sheet
-                for sheet in xls.sheet_names
-            }
-
-            for future in as_completed(futures):
-                sheet_name = futures[future]
-                try:
-                    parsed_results.append((sheet_name, future.result()))
-                except Exception as e:
-                    print(f"Error processing sheet {sheet_name}: {e}")
+        parsed_results = self.sheet_parser.parse_workbook(
+            cmd.file_path,
+            workers=cmd.workers or self.SHEET_WORKERS,
+            use_processes=cmd.use_processes,
+        )
 
         # -----------------------------
         # Stage 2 — Sequential commit
@@ -121,197 +123,89 @@ class LoadCategoriesUseCase:
         return all_categories
 
     # =============================================================
-    # SHEET PROCESSING
+    # STREAMING
     # =============================================================
-    def _process_sheet(
-        self,
-        xls: pd.ExcelFile,
-        sheet_name: str,
-        use_brand: bool = False,
-    ) -> List[Category]:
-        """Process a single sheet and return parsed categories."""
-
-        print(f"Processing sheet: {sheet_name}")
-
-        df = self._prepare_dataframe(xls, sheet_name)
-        if df is None:
-            return []
-
-        categories: List[Category] = []
-        last_inserted: Dict[int, str] = {}
-
-        for _, row in df.iterrows():
-
-            row_dict = self._clean_row(row)
-            if not row_dict:
-                continue
-
-            category = self._parse_row(
-                row_dict,
-                last_inserted,
-            )
-            if not category:
-                continue
-
-            categories.append(category)
-
-        categories.sort(key=lambda c: (c.level, c.parent_id or ""))
-
-        print(f"Prepared {len(categories)} categories for {sheet_name}")
-
-        return categories
-
-    # =============================================================
-    # DATAFRAME PREPARATION
-    # =============================================================
-    def _prepare_dataframe(
-        self,
-        xls: pd.ExcelFile,
-        sheet_name: str,
-    ) -> pd.DataFrame | None:
-        """Prepare and validate DataFrame from Excel sheet."""
-
-        df = pd.read_excel(xls, sheet_name=sheet_name)
-
-        if df.empty or len(df.columns) < 3:
-            print(f"Skipping sheet {sheet_name} (invalid structure).")
-            return None
-
-        df.columns = df.columns.map(lambda x: str(x).strip())
+    def _execute_streaming(self, cmd: LoadCategoriesCommand) -> dict:
+        """
+        Stream sheets row by row and commit in bounded chunks.
 
-        lower_cols = [c.lower() for c in df.columns]
-        if not all(col in lower_cols for col in ["catid", "url"]):
-            print(f"Skipping sheet {sheet_name} (no 'catid' or 'url').")
-            return None
+        Memory is bounded by chunk_size plus the set of IDs seen in the
+        current sheet (and the returned categories when
+        cmd.collect_categories is True). Rows are committed in sheet order,
+        so parents always reach the database before their children.
 
-        cat_id_index = lower_cols.index("catid")
-        level_count = cat_id_index
+        Parent integrity is checked against every ID streamed so far in the
+        sheet, as the non-streaming path checks the whole sheet. A category
+        repeated across chunks is saved again (the upsert keeps the last
+        row) and appears once in the result, as with deduplication.
+        """
 
-        levels = [f"level {i}" for i in range(1, level_count + 1)]
-        remaining = list(df.columns[level_count:])
+        if cmd.chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
 
-        df.columns = levels + remaining
+        all_categories = {}
 
-        return df
+        for sheet_name, categories in self.sheet_parser.stream_workbook(cmd.file_path):
 
-    # =============================================================
-    # ROW PARSING
-    # =============================================================
-    def _clean_row(self, row: pd.Series) -> Dict[str, Any]:
-        """Clean and normalize row data."""
-        return {
-            str(k).strip(): v
-            for k, v in row.to_dict().items()
-            if pd.notna(v)
-        }
-
-    def _parse_row(
-        self,
-        row_dict: Dict[str, Any],
-        last_inserted: Dict[int, str],
-    ) -> Category | None:
-        """Parse a single row into a Category entity."""
+            seen_ids: set = set()
+            collected: dict = {}
+            total = 0
 
-        level_key = self._find_key(row_dict, "level")
-        id_key = self._find_key(row_dict, "catid")
+            for chunk in self._chunked(categories, cmd.chunk_size):
 
-        if not level_key or not id_key:
-            return None
+                seen_ids.update(c.id for c in chunk)
+                self._validate_parent_integrity(chunk, known_ids=seen_ids)
 
-        level = self._extract_level(level_key)
-        if not level:
-            return None
+                chunk = self._deduplicate_categories(chunk)
+                saved = self._commit_sheet(sheet_name, chunk)
+                total += len(saved)
 
-        name = str(row_dict.get(level_key)).strip()
-        cat_id = str(row_dict.get(id_key)).strip()
+                if sheet_name not in all_categories:
+                    all_categories[sheet_name] = {
+                        "categories": [],
+                        "all_key_words": set()
+                    }
 
-        if not name or not cat_id:
-            return None
+                if cmd.collect_categories:
+                    for cat in saved:
+                        # Later rows win, as in _deduplicate_categories
+                        collected.pop(cat.id, None)
+                        collected[cat.id] = cat
 
-        parent_id = last_inserted.get(level - 1)
-        last_inserted[level] = cat_id
+                for cat in saved:
+                    if cat.keywords_json:
+                        all_categories[sheet_name]["all_key_words"].update(cat.keywords_json)
 
-        titulo = self._clean_text(row_dict.get(
-            self._find_key(row_dict, "meta") or "", ""
-        ))
+            if sheet_name in all_categories:
+                all_categories[sheet_name]["categories"] = list(collected.values())
 
-        descripcion = self._clean_text(row_dict.get(
-            self._find_key(row_dict, "descripcion") or "", ""
-        ))
+            if total:
+                print(f"Sheet: {sheet_name} | {total} categories")
 
-        palabras = row_dict.get(self._find_key(row_dict, "keyword"), "")
-        keywords = self._extract_keywords(titulo, descripcion, palabras)
-
-        category = Category.create(
-            id=cat_id,
-            name=name,
-            level=level,
-            parent_id=parent_id,
-            description=descripcion,
-            url=row_dict.get(self._find_key(row_dict, "url")),
-            keywords_json=tuple(keywords),
-        )
+        print(f"\n\nTotal categories loaded: {len(all_categories)}")
 
-        return category
+        return all_categories
 
     # =============================================================
     # HELPERS
     # =============================================================
     @staticmethod
-    def _find_key(data: Dict[str, Any], keyword: str) -> str | None:
-        """Find a key in dictionary by keyword (case-insensitive)."""
-        return next(
-            (k for k in data.keys() if keyword in k.lower()),
-            None,
-        )
-
-    @staticmethod
-    def _extract_level(key: str) -> int | None:
-        """Extract level number from key string."""
-        match = re.search(r"\d+", key)
-        return int(match.group()) if match else None
-
-    @staticmethod
-    def _clean_text(text: Any) -> str:
-        """Clean and normalize text content."""
-        text = unicodedata.normalize("NFKD", str(text))
-        text = re.sub(r"http\S+|www\S+|https\S+", "", text)
-        text = re.sub(r"\S*\.com\S*", "", text)
-        text = re.sub(r"[^a-zA-Z0-9\s_-]", "", text)
-        return text.strip()
+    def _chunked(items: Iterable[Category], size: int) -> Iterator[List[Category]]:
+        """Yield lists of at most `size` items."""
+        iterator = iter(items)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
 
     @staticmethod
-    def _extract_keywords(
-        titulo: str,
-        descripcion: str,
-        palabras: Any,
-    ) -> List[str]:
-        """Extract and normalize keywords from various sources."""
-
-        pattern = r"[A-Za-zÁÉÍÓÚáéíóúÑñ]+"
-        extracted = []
-
-        # Parse palabras (can be JSON string, list, etc.)
-        if isinstance(palabras, str):
-            try:
-                palabras = json.loads(palabras)
-            except Exception:
-                palabras = [palabras]
-
-        if isinstance(palabras, (list, tuple, set)):
-            for p in palabras:
-                if isinstance(p, str):
-                    extracted.extend(re.findall(pattern, p.lower()))
-
-        extracted.extend(re.findall(pattern, titulo.lower()))
-        extracted.extend(re.findall(pattern, descripcion.lower()))
-
-        return list(dict.fromkeys(extracted))
-
-    @staticmethod
-    def _validate_parent_integrity(categories: List[Category]) -> None:
-        """Validate that all parent categories exist in the list."""
-        ids_set = {c.id for c in categories}
+    def _validate_parent_integrity(
+        categories: List[Category],
+        known_ids: Set[str] | None = None,
+    ) -> None:
+        """
+        Validate that all parent categories exist in the list (or in
+        known_ids, when validating a streamed chunk).
+        """
+        ids_set = known_ids if known_ids is not None else {c.id for c in categories}
 
         for cat in categories:
             if cat.parent_id and cat.parent_id not in ids_set:
@@ -341,7 +235,10 @@ class LoadCategoriesUseCase:
         """Save categories to database within a transaction."""
 
         try:
-            saved = self.category_repository.save_batch(categories)
+            if len(categories) > self.BULK_THRESHOLD:
+                saved = self.category_repository.bulk_save(categories)
+            else:
+                saved = self.category_repository.save_batch(categories)
             self.session.commit()
             print(f"✓ Sheet {sheet_name}: {len(saved)} categories saved")
             return saved
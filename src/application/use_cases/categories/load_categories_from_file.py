@@ -1,7 +1,10 @@
 # ---------------------------------------------------------------------
 # Standard library
 # ---------------------------------------------------------------------
+import json
+from typing import Any, Dict, List
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------------------------------------------------
 # Third-party libraries
@@ -26,6 +29,7 @@ from application.use_cases.embeddings.load_embeddings import (
 
 from application.ports.llm_service import LLMService
 from application.ports.prompt_service import PromptService
+from utils.rate_limiter import estimate_tokens
 
 
 # ---------------------------------------------------------------------
@@ -36,6 +40,7 @@ class LoadCategoriesFromFileCommand:
     file_path: str
     business: str       # Business name to apply to all profiles
     brand: bool = False # If True, use sheet name as brand
+    chunked_metadata: bool = False  # Infer sheet metadata in parallel chunks
 
 
 # ---------------------------------------------------------------------
@@ -50,6 +55,11 @@ class LoadCategoriesFromFileUseCase:
     3. LoadCategoryProfilesUseCase - Create and save profiles
     """
 
+    # Chunked metadata inference (cmd.chunked_metadata)
+    METADATA_TOKEN_BUDGET = 4_000   # Estimated input tokens per request
+    METADATA_WORKERS = 4
+    METADATA_CHUNK_ATTEMPTS = 2
+
     def __init__(
         self,
         session: Session,
@@ -87,6 +97,8 @@ class LoadCategoriesFromFileUseCase:
             cmd.file_path: Path to Excel file
             cmd.business: Business name to apply to all profiles (e.g., "Liverpool")
             cmd.brand: If True, use sheet names as brand names for categories
+            cmd.chunked_metadata: If True, split the metadata prompt into
+                sheet chunks under METADATA_TOKEN_BUDGET and run them concurrently
 
         Returns:
             dict with keys: categories, embeddings, profiles
@@ -105,9 +117,10 @@ class LoadCategoriesFromFileUseCase:
 
             categories = [cat for sheet in sheet_categories.values() for cat in sheet["categories"]]
 
-            # Prepare input data for LLM (keywords by sheet)
+            # Prepare input data for LLM (keywords by sheet). Sorted so the
+            # prompt, and its cache key, are stable across processes
             input_data = {
-                sheet_name: list(sheet_categories[sheet_name]["all_key_words"])
+                sheet_name: sorted(sheet_categories[sheet_name]["all_key_words"])
                 for sheet_name in sheet_categories
             }
 
@@ -120,12 +133,15 @@ class LoadCategoriesFromFileUseCase:
 
             if not cmd.brand:
                 # Only call LLM if not in brand mode
-                prompt = self.prompt_service.get_prompt(input_data=input_data)
-                metadata["data"] = self.llm_service.chat(
-                    prompt,
-                    schema=prompt.get("schema", {}),
-                    mime_type="application/json"
-                )
+                if cmd.chunked_metadata:
+                    metadata["data"] = self._infer_metadata_chunked(input_data)
+                else:
+                    prompt = self.prompt_service.get_prompt(input_data=input_data)
+                    metadata["data"] = self.llm_service.chat(
+                        prompt,
+                        schema=prompt.get("schema", {}),
+                        mime_type="application/json"
+                    )
                 print(f"\nMetadata by sheet: {metadata['data']}\n")
             else:
                 print("\nBrand mode: Using sheet names as brands\n")
@@ -159,4 +175,102 @@ class LoadCategoriesFromFileUseCase:
         except Exception as e:
             self.session.rollback()
             print(f"\n✗ ERROR: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    # =============================================================
+    # METADATA INFERENCE
+    # =============================================================
+    def _infer_metadata_chunked(self, input_data: Dict[str, List[str]]) -> str:
+        """
+        Infer sheet metadata chunk by chunk and merge the JSON results.
+
+        Returns the merged JSON array as a string, like the single-call path.
+        Chunks with invalid JSON get placeholder rows; if every chunk fails
+        the run fails instead of saving placeholders for every sheet.
+        """
+
+        chunks = self._chunk_sheets(input_data, self.METADATA_TOKEN_BUDGET)
+        print(f"Inferring metadata for {len(input_data)} sheets in {len(chunks)} chunks")
+
+        with ThreadPoolExecutor(max_workers=self.METADATA_WORKERS) as executor:
+            results = list(executor.map(self._infer_metadata_chunk, chunks))
+
+        failed = [chunk for chunk, rows in zip(chunks, results) if rows is None]
+
+        if failed and len(failed) == len(chunks):
+            raise ValueError("LLM returned invalid JSON metadata for every chunk")
+
+        merged: List[Dict[str, Any]] = []
+
+        for chunk, rows in zip(chunks, results):
+            if rows is None:
+                # Same placeholder the prompt uses when nothing can be inferred
+                rows = [
+                    {"sheet_name": sheet, "direccion": "Nulo", "genero": "Nulo"}
+                    for sheet in chunk
+                ]
+            merged.extend(rows)
+
+        return json.dumps(merged, ensure_ascii=False)
+
+    # -------------------------------------------------------------
+
+    def _infer_metadata_chunk(self, chunk: Dict[str, List[str]]) -> List[Dict[str, Any]] | None:
+        """
+        Run one chunk, retrying it only when the model returns invalid JSON.
+
+        LLM errors propagate, as in the single-call path: LLMClient already
+        retries transient ones, and filling sheets with placeholders during
+        an outage would save junk profiles without surfacing the failure.
+        Invalid JSON is never cached by LLMClient, so a retry gets a fresh
+        response. Returns None if every attempt returned invalid JSON.
+        """
+
+        prompt = self.prompt_service.get_prompt(input_data=chunk)
+        last_error: Exception | None = None
+
+        for _ in range(self.METADATA_CHUNK_ATTEMPTS):
+            response = self.llm_service.chat(
+                prompt,
+                schema=prompt.get("schema", {}),
+                mime_type="application/json"
+            )
+
+            try:
+                parsed = json.loads(response)
+            except json.JSONDecodeError as e:
+                last_error = e
+                continue
+
+            return parsed if isinstance(parsed, list) else [parsed]
+
+        print(f"✗ Metadata chunk {list(chunk)} returned invalid JSON: {last_error}")
+        return None
+
+    # -------------------------------------------------------------
+
+    @staticmethod
+    def _chunk_sheets(
+        input_data: Dict[str, List[str]],
+        token_budget: int,
+    ) -> List[Dict[str, List[str]]]:
+        """Group sheets so each chunk stays under token_budget (a larger sheet goes alone)."""
+
+        chunks: List[Dict[str, List[str]]] = []
+        current: Dict[str, List[str]] = {}
+        current_tokens = 0
+
+        for sheet, keywords in input_data.items():
+            tokens = estimate_tokens([json.dumps({sheet: keywords}, ensure_ascii=False)])
+
+            if current and current_tokens + tokens > token_budget:
+                chunks.append(current)
+                current, current_tokens = {}, 0
+
+            current[sheet] = keywords
+            current_tokens += tokens
+
+        if current:
+            chunks.append(current)
+
+        return chunks
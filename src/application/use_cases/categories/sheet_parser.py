@@ -0,0 +1,509 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import re
+import json
+import unicodedata
+from typing import List, Any, Dict, Iterable, Iterator, Sequence, Tuple
+from dataclasses import dataclass, fields
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    as_completed,
+)
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from domain.entities.categories.category import Category
+
+
+_URL_RE = re.compile(r"http\S+|www\S+|https\S+")
+_DOMAIN_RE = re.compile(r"\S*\.com\S*")
+_SYMBOLS_RE = re.compile(r"[^a-zA-Z0-9\s_-]")
+_WORD_RE = re.compile(r"[A-Za-zÁÉÍÓÚáéíóúÑñ]+")
+
+_CATEGORY_FIELDS = tuple(f.name for f in fields(Category))
+
+
+# ---------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class SheetLayout:
+    """
+    Column positions resolved once per sheet.
+
+    Sheets look like: level columns..., CatID, <meta/descripcion/keyword/url...>.
+    Every column before CatID is a level column (level 1, level 2, ...).
+    Other fields may match several columns; the first non-empty one wins.
+    """
+    level_count: int
+    catid: int
+    meta: Tuple[int, ...]
+    descripcion: Tuple[int, ...]
+    keyword: Tuple[int, ...]
+    url: Tuple[int, ...]
+
+    @classmethod
+    def from_header(cls, header: Sequence[Any]) -> "SheetLayout | None":
+
+        names = [str(c).strip().lower() for c in header]
+
+        if "catid" not in names or "url" not in names:
+            return None
+
+        level_count = names.index("catid")
+
+        def find(keyword: str) -> Tuple[int, ...]:
+            return tuple(
+                i for i, name in enumerate(names)
+                if i >= level_count and keyword in name
+            )
+
+        return cls(
+            level_count=level_count,
+            catid=level_count,
+            meta=find("meta"),
+            descripcion=find("descripcion"),
+            keyword=find("keyword"),
+            url=find("url"),
+        )
+
+
+# ---------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------
+class CategorySheetParser:
+    """
+    Parses category sheets into Category entities.
+
+    Column positions are resolved once per sheet (SheetLayout); levels and
+    parent IDs are computed column-wise over the whole sheet, leaving a
+    single Python pass only for building the entities.
+    """
+
+    # =============================================================
+    # PUBLIC API
+    # =============================================================
+    def parse_sheet(
+        self,
+        xls: pd.ExcelFile | str,
+        sheet_name: str,
+    ) -> List[Category]:
+        """Read and parse a single sheet."""
+
+        print(f"Processing sheet: {sheet_name}")
+
+        df = pd.read_excel(xls, sheet_name=sheet_name)
+
+        if df.empty or len(df.columns) < 3:
+            print(f"Skipping sheet {sheet_name} (invalid structure).")
+            return []
+
+        layout = SheetLayout.from_header(df.columns)
+        if layout is None:
+            print(f"Skipping sheet {sheet_name} (no 'catid' or 'url').")
+            return []
+
+        categories = self.parse_frame(df, layout)
+        categories.sort(key=lambda c: (c.level, c.parent_id or ""))
+
+        print(f"Prepared {len(categories)} categories for {sheet_name}")
+
+        return categories
+
+    # -------------------------------------------------------------
+
+    def parse_workbook(
+        self,
+        file_path: str,
+        workers: int = 4,
+        use_processes: bool = False,
+    ) -> List[Tuple[str, List[Category]]]:
+        """
+        Parse every sheet of a workbook in parallel.
+
+        With use_processes=True each worker process opens the workbook
+        itself and sends back plain tuples (see category_to_row), which
+        sidesteps the GIL for the pandas/regex work. Threads share a single
+        pd.ExcelFile instead.
+
+        Returns (sheet_name, categories) pairs in workbook order. Sheets
+        that fail to parse are reported and skipped.
+        """
+
+        xls = pd.ExcelFile(file_path)
+        sheet_names = list(xls.sheet_names)
+        workers = max(1, min(workers, len(sheet_names) or 1))
+
+        if use_processes:
+            xls.close()
+            parsed = self._parse_in_processes(file_path, sheet_names, workers)
+        else:
+            with xls:
+                parsed = self._parse_in_threads(xls, sheet_names, workers)
+
+        return [
+            (sheet, parsed[sheet])
+            for sheet in sheet_names
+            if sheet in parsed
+        ]
+
+    # -------------------------------------------------------------
+
+    def stream_workbook(
+        self,
+        file_path: str,
+    ) -> Iterator[Tuple[str, Iterator[Category]]]:
+        """
+        Stream a workbook sheet by sheet without building DataFrames.
+
+        Uses openpyxl in read-only mode, so only the current row is held in
+        memory. Yields (sheet_name, categories) where categories is a lazy
+        iterator in sheet row order: a parent is always yielded before its
+        children. Consume each sheet's iterator before advancing to the
+        next sheet.
+        """
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+
+        try:
+            for worksheet in workbook.worksheets:
+                print(f"Streaming sheet: {worksheet.title}")
+                yield worksheet.title, self.iter_rows(
+                    worksheet.iter_rows(values_only=True),
+                    sheet_name=worksheet.title,
+                )
+        finally:
+            workbook.close()
+
+    # -------------------------------------------------------------
+
+    def iter_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        sheet_name: str = "",
+    ) -> Iterator[Category]:
+        """Parse a header row followed by data rows, one row at a time."""
+
+        rows = iter(rows)
+        header = next(rows, None)
+
+        if not header or len(header) < 3:
+            print(f"Skipping sheet {sheet_name} (invalid structure).")
+            return
+
+        layout = SheetLayout.from_header(header)
+        if layout is None:
+            print(f"Skipping sheet {sheet_name} (no 'catid' or 'url').")
+            return
+
+        last_inserted: Dict[int, str] = {}
+
+        for row in rows:
+            category = self._parse_row(row, layout, last_inserted)
+            if category is not None:
+                yield category
+
+    # -------------------------------------------------------------
+
+    def parse_frame(
+        self,
+        df: pd.DataFrame,
+        layout: SheetLayout,
+    ) -> List[Category]:
+        """Parse an already loaded sheet."""
+
+        values = df.to_numpy(dtype=object)
+        present = pd.notna(values)
+
+        n_rows = values.shape[0]
+        if n_rows == 0 or layout.level_count == 0:
+            return []
+
+        # -----------------------------
+        # Level = first non-empty level column
+        # -----------------------------
+        level_block = present[:, :layout.level_count]
+        has_level = level_block.any(axis=1)
+        level_pos = level_block.argmax(axis=1)
+
+        names = np.array(
+            [str(v).strip() for v in values[np.arange(n_rows), level_pos]],
+            dtype=object,
+        )
+        ids = np.array(
+            [self._normalize_id(v) for v in values[:, layout.catid]],
+            dtype=object,
+        )
+
+        valid = (
+            has_level
+            & present[:, layout.catid]
+            & (names != "")
+            & (ids != "")
+        )
+        levels = level_pos + 1
+
+        # -----------------------------
+        # Parent = last valid row one level up (forward fill per level)
+        # -----------------------------
+        parents = np.full(n_rows, None, dtype=object)
+
+        for level in range(1, layout.level_count):
+            at_level = valid & (levels == level)
+            if not at_level.any():
+                continue
+
+            last_seen = pd.Series(np.where(at_level, ids, None)).ffill().to_numpy()
+            children = valid & (levels == level + 1)
+            parents[children] = last_seen[children]
+
+        parents[pd.isna(parents)] = None
+
+        # -----------------------------
+        # Build entities
+        # -----------------------------
+        categories: List[Category] = []
+
+        for row in np.flatnonzero(valid):
+            categories.append(
+                self._build_category(
+                    values[row],
+                    present[row],
+                    layout,
+                    cat_id=ids[row],
+                    name=names[row],
+                    level=int(levels[row]),
+                    parent_id=parents[row],
+                )
+            )
+
+        return categories
+
+    # =============================================================
+    # PARALLEL EXECUTION
+    # =============================================================
+    def _parse_in_threads(
+        self,
+        xls: pd.ExcelFile,
+        sheet_names: List[str],
+        workers: int,
+    ) -> dict[str, List[Category]]:
+
+        parsed: dict[str, List[Category]] = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.parse_sheet, xls, sheet): sheet
+                for sheet in sheet_names
+            }
+
+            for future in as_completed(futures):
+                sheet_name = futures[future]
+                try:
+                    parsed[sheet_name] = future.result()
+                except Exception as e:
+                    print(f"Error processing sheet {sheet_name}: {e}")
+
+        return parsed
+
+    # -------------------------------------------------------------
+
+    @staticmethod
+    def _parse_in_processes(
+        file_path: str,
+        sheet_names: List[str],
+        workers: int,
+    ) -> dict[str, List[Category]]:
+
+        # Round-robin so each process opens the workbook only once
+        assignments = [sheet_names[i::workers] for i in range(workers)]
+        parsed: dict[str, List[Category]] = {}
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_parse_sheets_worker, file_path, sheets)
+                for sheets in assignments
+                if sheets
+            ]
+
+            for future in as_completed(futures):
+                for sheet_name, rows, error in future.result():
+                    if error is not None:
+                        print(f"Error processing sheet {sheet_name}: {error}")
+                        continue
+
+                    parsed[sheet_name] = [category_from_row(r) for r in rows]
+
+        return parsed
+
+    # =============================================================
+    # ROW PARSING
+    # =============================================================
+    def _parse_row(
+        self,
+        row: Sequence[Any],
+        layout: SheetLayout,
+        last_inserted: Dict[int, str],
+    ) -> Category | None:
+        """Row-at-a-time counterpart of parse_frame (used when streaming)."""
+
+        if len(row) <= layout.catid:
+            return None
+
+        present = [pd.notna(v) for v in row]
+
+        level_pos = next(
+            (i for i in range(layout.level_count) if present[i]),
+            None,
+        )
+        if level_pos is None or not present[layout.catid]:
+            return None
+
+        name = str(row[level_pos]).strip()
+        cat_id = self._normalize_id(row[layout.catid])
+
+        if not name or not cat_id:
+            return None
+
+        level = level_pos + 1
+        parent_id = last_inserted.get(level - 1)
+        last_inserted[level] = cat_id
+
+        return self._build_category(
+            row,
+            present,
+            layout,
+            cat_id=cat_id,
+            name=name,
+            level=level,
+            parent_id=parent_id,
+        )
+
+    # -------------------------------------------------------------
+
+    def _build_category(
+        self,
+        row: Sequence[Any],
+        present: Sequence[bool],
+        layout: SheetLayout,
+        cat_id: str,
+        name: str,
+        level: int,
+        parent_id: str | None,
+    ) -> Category:
+        """Build a Category from a row whose level/ID are already resolved."""
+
+        def first(positions: Tuple[int, ...], default: Any = None) -> Any:
+            return next(
+                (row[i] for i in positions if i < len(row) and present[i]),
+                default,
+            )
+
+        titulo = self._clean_text(first(layout.meta, ""))
+        descripcion = self._clean_text(first(layout.descripcion, ""))
+        keywords = self._extract_keywords(titulo, descripcion, first(layout.keyword, ""))
+
+        return Category.create(
+            id=cat_id,
+            name=name,
+            level=level,
+            parent_id=parent_id,
+            description=descripcion,
+            url=first(layout.url),
+            keywords_json=tuple(keywords),
+        )
+
+    # =============================================================
+    # HELPERS
+    # =============================================================
+    @staticmethod
+    def _normalize_id(value: Any) -> str:
+        """
+        CatID as text, identical for both read paths: pandas reads an ID
+        column with blanks as float64 (123.0) while openpyxl yields 123.
+        """
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value).strip()
+
+    @staticmethod
+    def _clean_text(text: Any) -> str:
+        """Clean and normalize text content."""
+        text = unicodedata.normalize("NFKD", str(text))
+        text = _URL_RE.sub("", text)
+        text = _DOMAIN_RE.sub("", text)
+        text = _SYMBOLS_RE.sub("", text)
+        return text.strip()
+
+    @staticmethod
+    def _extract_keywords(
+        titulo: str,
+        descripcion: str,
+        palabras: Any,
+    ) -> List[str]:
+        """Extract and normalize keywords from various sources."""
+
+        extracted = []
+
+        # Parse palabras (can be JSON string, list, etc.)
+        if isinstance(palabras, str):
+            try:
+                palabras = json.loads(palabras)
+            except Exception:
+                palabras = [palabras]
+
+        if isinstance(palabras, (list, tuple, set)):
+            for p in palabras:
+                if isinstance(p, str):
+                    extracted.extend(_WORD_RE.findall(p.lower()))
+
+        extracted.extend(_WORD_RE.findall(titulo.lower()))
+        extracted.extend(_WORD_RE.findall(descripcion.lower()))
+
+        return list(dict.fromkeys(extracted))
+
+
+# ---------------------------------------------------------------------
+# Process-pool helpers
+# ---------------------------------------------------------------------
+def category_to_row(category: Category) -> tuple:
+    """Flatten a Category into a plain tuple (cheap to pickle)."""
+    return tuple(getattr(category, name) for name in _CATEGORY_FIELDS)
+
+
+def category_from_row(row: tuple) -> Category:
+    """Rebuild a Category from category_to_row output (no re-hashing)."""
+    return Category(*row)
+
+
+def _parse_sheets_worker(
+    file_path: str,
+    sheet_names: List[str],
+) -> List[Tuple[str, List[tuple], str | None]]:
+    """Runs in a worker process: open the workbook once, parse its sheets."""
+
+    parser = CategorySheetParser()
+    results = []
+
+    with pd.ExcelFile(file_path) as xls:
+        for sheet_name in sheet_names:
+            try:
+                categories = parser.parse_sheet(xls, sheet_name)
+                results.append(
+                    (sheet_name, [category_to_row(c) for c in categories], None)
+                )
+            except Exception as e:
+                results.append((sheet_name, [], str(e)))
+
+    return results
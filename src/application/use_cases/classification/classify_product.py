@@ -2,7 +2,7 @@
 # Standard library
 # ---------------------------------------------------------------------
 from dataclasses import dataclass
-from uuid import UUID
+from typing import Iterable, List, Set, Tuple
 
 # ---------------------------------------------------------------------
 # Third-party libraries
@@ -15,22 +15,38 @@ from application.ports.product_repository import ProductRepository
 from application.ports.category_profile_repository import CategoryProfileRepository
 from application.ports.exclusion_repository import ExclusionRepository
 from application.ports.embedding_repository import EmbeddingRepository
+from application.ports.embedding_service import EmbeddingService
+from application.ports.category_index import CategoryIndex
+from application.ports.eligibility_index import EligibilityIndex
 
+from domain.entities.products.product import Product
 from domain.specifications.eligibility_policy import CategoryEligibilityPolicy
 from domain.entities.products.product_context import ProductContext
 from domain.entities.classification.result import ClassificationResult, CategoryMatch
 from domain.entities.classification.errors import NoEligibleCategoriesError, NoEligibleMatchesError
 
-from domain.value_objects.semantic_hash import SemanticHash
-
 
 @dataclass(frozen=True)
 class ClassifyProductCommand:
-    product_id: UUID
+    sku: str
     top_k: int = 5
 
 
 class ClassifyProductUseCase:
+    """
+    Classifies a product against the in-memory category index.
+
+    The index is loaded from the embedding repository on first use;
+    afterwards each classification is one embedding call plus a
+    masked matrix-vector product. With an EligibilityIndex the
+    eligibility mask is a lookup instead of a policy loop over every
+    profile.
+
+    Without an index, the search runs in the database through
+    EmbeddingRepository.search_eligible, which applies the policy's
+    allow list and the product's exclusions in SQL and returns the
+    top-k eligible categories.
+    """
 
     def __init__(
         self,
@@ -38,32 +54,107 @@ class ClassifyProductUseCase:
         profiles: CategoryProfileRepository,
         exclusions: ExclusionRepository,
         embeddings: EmbeddingRepository,
+        embedding_service: EmbeddingService,
+        index: CategoryIndex | None,
         policy: CategoryEligibilityPolicy,
+        eligibility: EligibilityIndex | None = None,
     ):
         self.products = products
         self.profiles = profiles
         self.exclusions = exclusions
         self.embeddings = embeddings
+        self.embedding_service = embedding_service
+        self.index = index
         self.policy = policy
+        self.eligibility = eligibility
 
 
     def execute(self, cmd: ClassifyProductCommand) -> ClassificationResult:
 
-        product = self.products.get_by_id(cmd.product_id)
+        product = self.products.get_by_sku(cmd.sku)
 
         if not product:
-            raise ValueError(f"Product with ID {cmd.product_id} not found.")
+            raise ValueError(f"Product with SKU {cmd.sku} not found.")
+
+        excluded = set(self.exclusions.get_excluded_category_ids(product.sku))
+        query_text = product.to_embedding_text()
+
+        if self.index is None:
+            matches = self._search_database(product, excluded, query_text, cmd.top_k)
+        else:
+            matches = self._search_index(product, excluded, query_text, cmd.top_k)
+
+        if not matches:
+            raise NoEligibleMatchesError("No eligible matches found")
+
+        best_id, best_score = matches[0]
+
+        return ClassificationResult(
+            product_id=product.sku,
+            best=CategoryMatch(category_id=best_id, score=best_score),
+            top_k=[CategoryMatch(category_id=cid, score=score) for cid, score in matches],
+        )
+
+
+    def _search_index(
+        self,
+        product: Product,
+        excluded: Iterable[str],
+        query_text: str,
+        top_k: int,
+    ) -> List[Tuple[str, float]]:
+
+        self._ensure_index()
+
+        if self.eligibility is not None:
+            mask = self.eligibility.mask_for(product.gender, product.business, excluded)
+
+            if self.eligibility.is_empty(mask):
+                raise NoEligibleCategoriesError("No eligible categories for this product")
+
+        else:
+            mask = self.index.mask_for(self._allowed_ids(product, excluded))
+
+        query_vector = self.embedding_service.generate(query_text)
+
+        return self.index.search(query_vector, top_k=top_k, mask=mask)
+
+
+    def _search_database(
+        self,
+        product: Product,
+        excluded: Iterable[str],
+        query_text: str,
+        top_k: int,
+    ) -> List[Tuple[str, float]]:
+
+        # Policy result only; exclusions are applied by the query itself
+        allowed_ids = self._allowed_ids(product, ())
+
+        if not allowed_ids - set(excluded):
+            raise NoEligibleCategoriesError("No eligible categories for this product")
+
+        query_vector = self.embedding_service.generate(query_text)
+
+        rows = self.embeddings.search_eligible(
+            query_vector,
+            limit=top_k,
+            allowed_ids=list(allowed_ids),
+            excluded_ids=list(excluded),
+        )
+
+        return [(emb.category_id, score) for emb, score in rows]
+
+
+    def _allowed_ids(self, product: Product, excluded: Iterable[str]) -> Set[str]:
 
         ctx = ProductContext(
             gender=product.gender,
-            business_type=product.business_type
+            business_type=product.business
         )
 
-        profiles = self.profiles.list_all_profiles()
-        excluded = self.exclusions.get_excluded_category_ids(product.id)
-
         allowed_ids = set()
-        for prof in profiles:
+        for prof in self.profiles.list_all_profiles():
             cid = prof.category.id
             if cid in excluded:
                 continue
@@ -73,20 +164,20 @@ class ClassifyProductUseCase:
         if not allowed_ids:
             raise NoEligibleCategoriesError("No eligible categories for this product")
 
-        query = SemanticHash.from_text(product.to_embedding_text()).value
+        return allowed_ids
 
-        # Buscamos un top-N grande para que el filtrado no mate resultados
-        raw = self.embeddings
 
-        filtered = [(cid, abs(score)) for cid, score in raw if cid in allowed_ids]
-        if not filtered:
-            raise NoEligibleMatchesError("No eligible matches found")
+    def _ensure_index(self) -> None:
 
-        filtered = filtered[: cmd.top_k]
-        best_id, best_score = filtered[0]
+        if not self.index.is_loaded():
+            self.index.load(self.embeddings.get_all())
 
-        return ClassificationResult(
-            product_id=product.id,
-            best=CategoryMatch(category_id=best_id, score=float(best_score)),
-            top_k=[CategoryMatch(category_id=cid, score=float(score)) for cid, score in filtered],
-        )
\ No newline at end of file
+        if self.eligibility is None:
+            return
+
+        # The category index may have been reloaded by another caller;
+        # bitmaps must follow its current row order
+        row_ids = self.index.category_ids()
+
+        if not self.eligibility.is_built() or self.eligibility.category_ids() != row_ids:
+            self.eligibility.build(self.profiles.list_all_profiles(), row_ids)
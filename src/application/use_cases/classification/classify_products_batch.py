@@ -0,0 +1,250 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from application.ports.product_repository import ProductRepository
+from application.ports.category_profile_repository import CategoryProfileRepository
+from application.ports.exclusion_repository import ExclusionRepository
+from application.ports.embedding_repository import EmbeddingRepository
+from application.ports.embedding_service import EmbeddingService
+from application.ports.category_index import CategoryIndex
+from application.ports.eligibility_index import EligibilityIndex
+
+from domain.entities.products.product import Product
+from domain.specifications.eligibility_policy import CategoryEligibilityPolicy
+from domain.entities.products.product_context import ProductContext
+from domain.entities.classification.result import ClassificationResult, CategoryMatch
+
+
+# ---------------------------------------------------------------------
+# Command
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class ClassifyProductsBatchCommand:
+    skus: List[str]
+    top_k: int = 5
+
+
+@dataclass(frozen=True)
+class ClassifyProductsBatchResult:
+    results: List[ClassificationResult] = field(default_factory=list)
+    missing_skus: List[str] = field(default_factory=list)       # Not found in repository
+    unclassified_skus: List[str] = field(default_factory=list)  # No eligible match
+
+
+# ---------------------------------------------------------------------
+# Use Case
+# ---------------------------------------------------------------------
+class ClassifyProductsBatchUseCase:
+    """
+    Classifies many products per call.
+
+    Products are loaded in one query, embedded in chunks through
+    EmbeddingService.generate_batch and scored against the category
+    index with one matrix-matrix product per scoring block. With an
+    EligibilityIndex, per-product masks come from precomputed bitmaps
+    instead of the policy.
+    """
+
+    EMBEDDING_BATCH_SIZE = 32
+    SCORING_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        products: ProductRepository,
+        profiles: CategoryProfileRepository,
+        exclusions: ExclusionRepository,
+        embeddings: EmbeddingRepository,
+        embedding_service: EmbeddingService,
+        index: CategoryIndex,
+        policy: CategoryEligibilityPolicy,
+        eligibility: EligibilityIndex | None = None,
+    ):
+        self.products = products
+        self.profiles = profiles
+        self.exclusions = exclusions
+        self.embeddings = embeddings
+        self.embedding_service = embedding_service
+        self.index = index
+        self.policy = policy
+        self.eligibility = eligibility
+
+    # =============================================================
+    # PUBLIC API
+    # =============================================================
+    def execute(self, cmd: ClassifyProductsBatchCommand) -> ClassifyProductsBatchResult:
+        """
+        Classify all products in cmd.skus.
+
+        Unknown SKUs and products without any eligible category are
+        reported in the result instead of aborting the whole batch.
+        """
+        skus = list(dict.fromkeys(cmd.skus))
+        if not skus:
+            return ClassifyProductsBatchResult()
+
+        products = [p for p in self.products.get_by_skus(skus) if p]
+
+        found = {p.sku for p in products}
+        missing = [sku for sku in skus if sku not in found]
+
+        if not products:
+            return ClassifyProductsBatchResult(missing_skus=missing)
+
+        self._ensure_index()
+
+        vectors = self._embed_products(products)
+
+        # Policy results per distinct context up front; exclusions and row
+        # masks are resolved per scoring block
+        allowed_by_context = self._allowed_by_context(products) if self.eligibility is None else None
+
+        results: List[ClassificationResult] = []
+        unclassified: List[str] = []
+
+        for start in range(0, len(products), self.SCORING_BATCH_SIZE):
+            block = products[start:start + self.SCORING_BATCH_SIZE]
+
+            # One exclusions query per block
+            excluded_by_sku = self.exclusions.get_excluded_category_ids_for_skus(
+                [p.sku for p in block]
+            )
+
+            matches_by_product = self.index.search_batch(
+                vectors[start:start + self.SCORING_BATCH_SIZE],
+                top_k=cmd.top_k,
+                masks=self._eligibility_masks(block, excluded_by_sku, allowed_by_context),
+            )
+
+            for product, matches in zip(block, matches_by_product):
+                if not matches:
+                    unclassified.append(product.sku)
+                    continue
+
+                results.append(self._to_result(product, matches))
+
+        print(
+            f"Classified {len(results)}/{len(skus)} products "
+            f"({len(missing)} missing, {len(unclassified)} without eligible match)"
+        )
+
+        return ClassifyProductsBatchResult(
+            results=results,
+            missing_skus=missing,
+            unclassified_skus=unclassified,
+        )
+
+    # =============================================================
+    # INDEX
+    # =============================================================
+    def _ensure_index(self) -> None:
+
+        if not self.index.is_loaded():
+            self.index.load(self.embeddings.get_all())
+
+        if self.eligibility is None:
+            return
+
+        # The category index may have been reloaded by another caller;
+        # bitmaps must follow its current row order
+        row_ids = self.index.category_ids()
+
+        if not self.eligibility.is_built() or self.eligibility.category_ids() != row_ids:
+            self.eligibility.build(self.profiles.list_all_profiles(), row_ids)
+
+    # =============================================================
+    # EMBEDDING
+    # =============================================================
+    def _embed_products(self, products: List[Product]) -> List[List[float]]:
+        """Embed product texts in chunks, preserving product order."""
+
+        texts = [p.to_embedding_text() for p in products]
+        vectors: List[List[float]] = []
+
+        for i in range(0, len(texts), self.EMBEDDING_BATCH_SIZE):
+            vectors.extend(
+                self.embedding_service.generate_batch(
+                    texts[i:i + self.EMBEDDING_BATCH_SIZE]
+                )
+            )
+
+        return vectors
+
+    # =============================================================
+    # ELIGIBILITY
+    # =============================================================
+    def _eligibility_masks(
+        self,
+        products: List[Product],
+        excluded_by_sku: Dict[str, Set[str]],
+        allowed_by_context: Dict[Tuple[str, str], Set[str]] | None,
+    ) -> List:
+        """Index row masks per product, in product order."""
+
+        if self.eligibility is None:
+            return [
+                self.index.mask_for(
+                    allowed_by_context[(p.gender, p.business)] - excluded_by_sku.get(p.sku, set())
+                )
+                for p in products
+            ]
+
+        return [
+            self.eligibility.mask_for(
+                product.gender,
+                product.business,
+                excluded_by_sku.get(product.sku, ()),
+            )
+            for product in products
+        ]
+
+
+    def _allowed_by_context(self, products: List[Product]) -> Dict[Tuple[str, str], Set[str]]:
+        """
+        Resolve policy-eligible category IDs per (gender, business).
+
+        The policy is evaluated once per distinct context rather than
+        once per product; exclusions are applied per block.
+        """
+        profiles = self.profiles.list_all_profiles()
+
+        by_context: Dict[Tuple[str, str], Set[str]] = {}
+
+        for product in products:
+            key = (product.gender, product.business)
+
+            if key not in by_context:
+                ctx = ProductContext(gender=product.gender, business_type=product.business)
+                by_context[key] = {
+                    prof.category.id
+                    for prof in profiles
+                    if self.policy.is_allowed(ctx, prof)
+                }
+
+        return by_context
+
+    # =============================================================
+    # HELPERS
+    # =============================================================
+    @staticmethod
+    def _to_result(
+        product: Product,
+        matches: List[Tuple[str, float]],
+    ) -> ClassificationResult:
+
+        best_id, best_score = matches[0]
+
+        return ClassificationResult(
+            product_id=product.sku,
+            best=CategoryMatch(category_id=best_id, score=best_score),
+            top_k=[CategoryMatch(category_id=cid, score=score) for cid, score in matches],
+        )
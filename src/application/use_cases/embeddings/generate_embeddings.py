@@ -54,9 +54,13 @@ class GenerateEmbeddingsUseCase:
         categories_to_generate: List[Tuple[Category, str]] = []
         valid_existing_embeddings: List[Embedding] = []
 
-        for category in categories:
+        current_hashes = SemanticHash.from_texts(
+            category.to_embedding_text() for category in categories
+        )
 
-            current_hash = SemanticHash.from_text(category.to_embedding_text()).value
+        for category, current_hash in zip(categories, current_hashes):
+
+            current_hash = current_hash.value
             existing: Embedding = existing_map.get(category.id)
 
             if not existing:
@@ -3,6 +3,7 @@
 # ---------------------------------------------------------------------
 from typing import List
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------------------------------------------------
 # Third-party libraries
@@ -37,6 +38,7 @@ class LoadEmbeddingsUseCase:
 
     EMBEDDING_WORKERS = 4
     BATCH_SIZE = 32
+    BULK_THRESHOLD = 1_000  # Above this, persist with the binary COPY path
 
     def __init__(
         self,
@@ -89,13 +91,20 @@ class LoadEmbeddingsUseCase:
         if not categories:
             return []
 
-        vectors: List[float] = []
+        batches = [
+            embedding_texts[i:i + self.BATCH_SIZE]
+            for i in range(0, len(embedding_texts), self.BATCH_SIZE)
+        ]
+
+        vectors: List[List[float]] = []
 
-        # Generate vectors in batches
-        for i in range(0, len(categories), self.BATCH_SIZE):
-            batch_texts = embedding_texts[i:i + self.BATCH_SIZE]
-            batch_vectors = self.embedding_service.generate_batch(batch_texts)
-            vectors.extend(batch_vectors)
+        # Dispatch batches concurrently; map() yields results in input order
+        with ThreadPoolExecutor(max_workers=self.EMBEDDING_WORKERS) as executor:
+            for batch_vectors in executor.map(
+                self.embedding_service.generate_batch,
+                batches,
+            ):
+                vectors.extend(batch_vectors)
 
         # Create Embedding entities
         embeddings = []
@@ -144,7 +153,10 @@ class LoadEmbeddingsUseCase:
         """Save embeddings to database within a transaction."""
 
         try:
-            self.embedding_repository.save_batch(embeddings)
+            if len(embeddings) > self.BULK_THRESHOLD:
+                self.embedding_repository.bulk_save(embeddings)
+            else:
+                self.embedding_repository.save_batch(embeddings)
             self.session.commit()
             print(f"✓ {len(embeddings)} embeddings saved")
             return embeddings
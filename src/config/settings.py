@@ -2,6 +2,8 @@
 # Standard libraries
 # ---------------------------------------------------------------------
 import logging
+import threading
+from functools import lru_cache
 
 # ---------------------------------------------------------------------
 # Third-party libraries
@@ -9,8 +11,6 @@ import logging
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from google.auth import default
-
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
@@ -28,15 +28,45 @@ class LLMSettings(BaseModel):
 
     embedding_model: str = "text-multilingual-embedding-002"
 
+    # Client-side quotas, shared by every client in the process (None = unlimited)
+    requests_per_minute: int | None = 60
+    tokens_per_minute: int | None = None
+    embedding_requests_per_minute: int | None = 600
+    embedding_tokens_per_minute: int | None = None
+    embedding_max_batch_size: int = 100
+
+
+_credentials_lock = threading.Lock()
+
 
 class GoogleCredentials(BaseModel):
     credentials: object | None = None
     project_id: str | None = None
+    scopes: list[str] = ["https://www.googleapis.com/auth/cloud-platform"]
 
     @classmethod
     def from_default(cls):
-        credentials, project_id = default()
-        return cls(credentials=credentials, project_id=project_id)
+        google = cls()
+        google.resolve()
+        return google
+
+    def resolve(self) -> tuple[object, str | None]:
+        """
+        Run google.auth discovery on first use and cache the result.
+
+        Discovery may probe the GCE metadata server, which takes seconds on
+        non-GCP hosts, so it must never happen at import time.
+        """
+        if self.credentials is None:
+            with _credentials_lock:
+                if self.credentials is None:
+                    from google.auth import default
+
+                    credentials, project_id = default(scopes=self.scopes)
+                    self.project_id = self.project_id or project_id
+                    self.credentials = credentials
+
+        return self.credentials, self.project_id
 
 
 class GeminiGenerationSettings(BaseSettings):
@@ -48,7 +78,7 @@ class GeminiGenerationSettings(BaseSettings):
     )
 
     location: str = "us-central1"
-    google: GoogleCredentials = GoogleCredentials.from_default()
+    google: GoogleCredentials = GoogleCredentials()  # resolved lazily
 
     llm: LLMSettings = LLMSettings()
 
@@ -103,4 +133,15 @@ class Settings(BaseSettings):
 
 settings = Settings()
 logging_settings = LoggingSettings()
-gemini_settings = GeminiGenerationSettings()
\ No newline at end of file
+
+
+@lru_cache(maxsize=1)
+def get_gemini_settings() -> GeminiGenerationSettings:
+    return GeminiGenerationSettings()
+
+
+def __getattr__(name: str):
+    # `gemini_settings` is built on first access, not at import
+    if name == "gemini_settings":
+        return get_gemini_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,36 +5,65 @@ from __future__ import annotations
 
 import re
 import hashlib
+from functools import lru_cache
+from typing import Iterable
 from dataclasses import dataclass
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
-import nltk
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
+from domain.value_objects.stopwords import SPANISH_STOPWORDS, get_stopwords  # noqa: F401 (re-export)
 
-nltk.download("stopwords", quiet=True)
 
-SPANISH_STOPWORDS = set(nltk.corpus.stopwords.words("spanish"))
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Memo size for raw text -> normalized text / digest
+NORMALIZE_CACHE_SIZE = 65_536
+
 
 def normalize_text(text: str) -> str:
-    text = text.lower()
-    text = re.sub(r"[^\w\s]", "", text)
-    tokens = text.split()
-    tokens = [t for t in tokens if t not in SPANISH_STOPWORDS]
+    return _normalize(text, get_stopwords())
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(text: str, stopwords: frozenset[str]) -> str:
+    # The stopword set is part of the key, so changing it never serves
+    # stale entries (frozenset caches its own hash, so this stays cheap)
+    tokens = [
+        t for t in _PUNCTUATION_RE.sub("", text.lower()).split()
+        if t not in stopwords
+    ]
     tokens.sort()
     return " ".join(tokens)
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _digest(text: str, stopwords: frozenset[str]) -> str:
+    normalized = _normalize(text, stopwords)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def clear_cache() -> None:
+    _normalize.cache_clear()
+    _digest.cache_clear()
+
+
 @dataclass(frozen=True, slots=True)
 class SemanticHash:
     value: str
 
     @classmethod
     def from_text(cls, text: str) -> SemanticHash:
-        normalized = normalize_text(text)
-        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
-        return cls(digest)
\ No newline at end of file
+        return cls(_digest(text, get_stopwords()))
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> list[SemanticHash]:
+        """Hash many texts at once; repeated texts are hashed only once."""
+        texts = list(texts)
+        stopwords = get_stopwords()
+        unique = {text: cls(_digest(text, stopwords)) for text in set(texts)}
+        return [unique[text] for text in texts]
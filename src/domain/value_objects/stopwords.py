@@ -0,0 +1,102 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+
+# Snapshot of nltk.corpus.stopwords.words("spanish") (313 words, NLTK 3.9).
+# Bundled so importing the domain never touches the network or nltk_data.
+SPANISH_STOPWORDS: frozenset[str] = frozenset((
+    "de", "la", "que", "el", "en", "y", "a", "los", "del", "se", "las",
+    "por", "un", "para", "con", "no", "una", "su", "al", "lo", "como",
+    "más", "pero", "sus", "le", "ya", "o", "este", "sí", "porque", "esta",
+    "entre", "cuando", "muy", "sin", "sobre", "también", "me", "hasta",
+    "hay", "donde", "quien", "desde", "todo", "nos", "durante", "todos",
+    "uno", "les", "ni", "contra", "otros", "ese", "eso", "ante", "ellos",
+    "e", "esto", "mí", "antes", "algunos", "qué", "unos", "yo", "otro",
+    "otras", "otra", "él", "tanto", "esa", "estos", "mucho", "quienes",
+    "nada", "muchos", "cual", "poco", "ella", "estar", "estas", "algunas",
+    "algo", "nosotros", "mi", "mis", "tú", "te", "ti", "tu", "tus", "ellas",
+    "nosotras", "vosotros", "vosotras", "os", "mío", "mía", "míos", "mías",
+    "tuyo", "tuya", "tuyos", "tuyas", "suyo", "suya", "suyos", "suyas",
+    "nuestro", "nuestra", "nuestros", "nuestras", "vuestro", "vuestra",
+    "vuestros", "vuestras", "esos", "esas", "estoy", "estás", "está",
+    "estamos", "estáis", "están", "esté", "estés", "estemos", "estéis",
+    "estén", "estaré", "estarás", "estará", "estaremos", "estaréis",
+    "estarán", "estaría", "estarías", "estaríamos", "estaríais", "estarían",
+    "estaba", "estabas", "estábamos", "estabais", "estaban", "estuve",
+    "estuviste", "estuvo", "estuvimos", "estuvisteis", "estuvieron",
+    "estuviera", "estuvieras", "estuviéramos", "estuvierais", "estuvieran",
+    "estuviese", "estuvieses", "estuviésemos", "estuvieseis", "estuviesen",
+    "estando", "estado", "estada", "estados", "estadas", "estad", "he",
+    "has", "ha", "hemos", "habéis", "han", "haya", "hayas", "hayamos",
+    "hayáis", "hayan", "habré", "habrás", "habrá", "habremos", "habréis",
+    "habrán", "habría", "habrías", "habríamos", "habríais", "habrían",
+    "había", "habías", "habíamos", "habíais", "habían", "hube", "hubiste",
+    "hubo", "hubimos", "hubisteis", "hubieron", "hubiera", "hubieras",
+    "hubiéramos", "hubierais", "hubieran", "hubiese", "hubieses",
+    "hubiésemos", "hubieseis", "hubiesen", "habiendo", "habido", "habida",
+    "habidos", "habidas", "soy", "eres", "es", "somos", "sois", "son",
+    "sea", "seas", "seamos", "seáis", "sean", "seré", "serás", "será",
+    "seremos", "seréis", "serán", "sería", "serías", "seríamos", "seríais",
+    "serían", "era", "eras", "éramos", "erais", "eran", "fui", "fuiste",
+    "fue", "fuimos", "fuisteis", "fueron", "fuera", "fueras", "fuéramos",
+    "fuerais", "fueran", "fuese", "fueses", "fuésemos", "fueseis", "fuesen",
+    "sintiendo", "sentido", "sentida", "sentidos", "sentidas", "siente",
+    "sentid", "tengo", "tienes", "tiene", "tenemos", "tenéis", "tienen",
+    "tenga", "tengas", "tengamos", "tengáis", "tengan", "tendré", "tendrás",
+    "tendrá", "tendremos", "tendréis", "tendrán", "tendría", "tendrías",
+    "tendríamos", "tendríais", "tendrían", "tenía", "tenías", "teníamos",
+    "teníais", "tenían", "tuve", "tuviste", "tuvo", "tuvimos", "tuvisteis",
+    "tuvieron", "tuviera", "tuvieras", "tuviéramos", "tuvierais",
+    "tuvieran", "tuviese", "tuvieses", "tuviésemos", "tuvieseis",
+    "tuviesen", "teniendo", "tenido", "tenida", "tenidos", "tenidas",
+    "tened",
+))
+
+_override: frozenset[str] | None = None
+_override_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_stopwords() -> frozenset[str]:
+    """Active stopword set: the bundled list unless overridden."""
+    return _override if _override is not None else SPANISH_STOPWORDS
+
+
+def set_stopwords(words: frozenset[str] | set[str] | None) -> None:
+    """
+    Replace the active stopword set (None restores the bundled list).
+
+    Changing stopwords changes every SemanticHash computed afterwards.
+    """
+    global _override
+
+    with _override_lock:
+        _override = frozenset(words) if words is not None else None
+        get_stopwords.cache_clear()
+
+
+def use_nltk_stopwords(download: bool = False) -> frozenset[str]:
+    """
+    Opt in to loading the stopword list from NLTK instead of the bundled
+    snapshot. With download=True the corpus is fetched if missing.
+    """
+    import nltk
+
+    if download:
+        nltk.download("stopwords", quiet=True)
+
+    words = frozenset(nltk.corpus.stopwords.words("spanish"))
+    set_stopwords(words)
+    return words
@@ -0,0 +1,186 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from application.ports.embedding_service import EmbeddingService
+from application.ports.embedding_repository import EmbeddingRepository
+from domain.value_objects.semantic_hash import SemanticHash
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    memory_hits: int = 0
+    store_hits: int = 0
+    misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.memory_hits + self.store_hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        if not self.requests:
+            return 0.0
+        return (self.memory_hits + self.store_hits) / self.requests
+
+    def __str__(self) -> str:
+        return (
+            f"hit ratio {self.hit_ratio:.1%} "
+            f"(memory {self.memory_hits}, store {self.store_hits}, misses {self.misses})"
+        )
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """
+    Content-addressed cache in front of another EmbeddingService.
+
+    Texts are keyed by SemanticHash and resolved in order:
+    1. In-memory LRU
+    2. Embeddings table (find_by_hashes), when a repository is given
+    3. The wrapped service, for the remaining misses only
+    """
+
+    DEFAULT_MAX_ENTRIES = 20_000
+
+    def __init__(
+        self,
+        inner: EmbeddingService,
+        repository: EmbeddingRepository | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.inner = inner
+        self.repository = repository
+        self.max_entries = max_entries
+
+        # float32 arrays keep ~3 KB per 768-d vector instead of ~25 KB of floats
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._memory_hits = 0
+        self._store_hits = 0
+        self._misses = 0
+
+    # ============================================================
+    # Public API
+    # ============================================================
+
+    def generate(self, text: str) -> List[float]:
+        return self.generate_batch([text])[0]
+
+
+    def generate_batch(self, texts: Sequence[str]) -> List[List[float]]:
+
+        if not texts:
+            return []
+
+        keys = [h.value for h in SemanticHash.from_texts(texts)]
+        found = self._lookup_memory(keys)
+
+        # Unique missing keys -> first text seen for that key
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in pending:
+                pending[key] = text
+
+        from_store = self._lookup_store(list(pending)) if pending else {}
+        for key in from_store:
+            del pending[key]
+
+        generated: Dict[str, List[float]] = {}
+        if pending:
+            vectors = self.inner.generate_batch(list(pending.values()))
+            generated = dict(zip(pending.keys(), vectors))
+
+        self._store({**from_store, **generated})
+
+        memory_hits = store_hits = misses = 0
+        results: List[List[float]] = []
+
+        for key in keys:
+            if key in found:
+                memory_hits += 1
+                results.append(list(found[key]))
+            elif key in from_store:
+                store_hits += 1
+                results.append(list(from_store[key]))
+            else:
+                misses += 1
+                results.append(list(generated[key]))
+
+        with self._lock:
+            self._memory_hits += memory_hits
+            self._store_hits += store_hits
+            self._misses += misses
+
+        return results
+
+    # -------------------------------------------------------------
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(
+                memory_hits=self._memory_hits,
+                store_hits=self._store_hits,
+                misses=self._misses,
+            )
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # ============================================================
+    # Cache tiers
+    # ============================================================
+
+    def _lookup_memory(self, keys: Sequence[str]) -> Dict[str, array]:
+        found: Dict[str, array] = {}
+
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+
+        return found
+
+    # -------------------------------------------------------------
+
+    def _lookup_store(self, keys: List[str]) -> Dict[str, List[float]]:
+        if self.repository is None:
+            return {}
+
+        found: Dict[str, List[float]] = {}
+
+        for embedding in self.repository.find_by_hashes(keys):
+            if embedding.content_hash not in found:
+                found[embedding.content_hash] = [float(v) for v in embedding.vector]
+
+        return found
+
+    # -------------------------------------------------------------
+
+    def _store(self, vectors: Dict[str, Sequence[float]]) -> None:
+        if not vectors or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            for key, vector in vectors.items():
+                self._entries[key] = array("f", vector)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,239 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import time
+import queue
+import asyncio
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from application.ports.embedding_service import EmbeddingService, AsyncEmbeddingService
+
+
+_STOP = object()
+
+
+class CoalescingEmbeddingService(EmbeddingService, AsyncEmbeddingService):
+    """
+    Merges concurrent single-text generate() calls into batched requests.
+
+    A background thread collects pending texts until `max_batch_size` are
+    waiting or `max_wait_ms` has passed since the first one, sends them as
+    one inner.generate_batch call, and resolves each caller's future. Up to
+    `max_in_flight` batches run at once; while they are busy, new texts keep
+    accumulating, so batches grow under load.
+
+    generate_batch() is already batched and goes straight to the inner
+    service.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingService,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        max_in_flight: int = 4,
+    ):
+        if max_batch_size <= 0 or max_in_flight <= 0:
+            raise ValueError("max_batch_size and max_in_flight must be > 0")
+
+        self.inner = inner
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_in_flight = max_in_flight
+
+        self._queue: "queue.Queue[Tuple[str, Future] | object]" = queue.Queue()
+        self._slots = threading.Semaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight,
+            thread_name_prefix="embedding-coalescer",
+        )
+
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+        self._stats_lock = threading.Lock()
+        self._texts = 0
+        self._batches = 0
+
+    # ============================================================
+    # Public API
+    # ============================================================
+
+    def generate(self, text: str) -> List[float]:
+        return self._submit(text).result()
+
+
+    def generate_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        return self.inner.generate_batch(texts)
+
+
+    async def agenerate(self, text: str) -> List[float]:
+        return await asyncio.wrap_future(self._submit(text))
+
+
+    async def agenerate_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return list(await asyncio.gather(*(self.agenerate(t) for t in texts)))
+
+    # -------------------------------------------------------------
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            texts, batches = self._texts, self._batches
+
+        return {
+            "texts": texts,
+            "batches": batches,
+            "avg_batch_size": texts / batches if batches else 0.0,
+        }
+
+
+    def close(self) -> None:
+        """Flush pending texts and stop the background thread."""
+
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+        self._executor.shutdown(wait=True)
+
+    # ============================================================
+    # Internals
+    # ============================================================
+
+    def _submit(self, text: str) -> Future:
+
+        future: Future = Future()
+
+        # Enqueued under the lock so nothing can land behind close()'s _STOP
+        with self._start_lock:
+            if self._closed:
+                raise RuntimeError("CoalescingEmbeddingService is closed")
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="embedding-coalescer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+            self._queue.put((text, future))
+
+        return future
+
+    # -------------------------------------------------------------
+
+    def _run(self) -> None:
+
+        stopping = False
+
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+
+            # Collect until the batch is full or the window closes
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if item is _STOP:
+                    stopping = True
+                    break
+
+                batch.append(item)
+
+            self._slots.acquire()
+            self._executor.submit(self._dispatch, batch)
+
+        self._fail_pending()
+
+    # -------------------------------------------------------------
+
+    def _dispatch(self, batch: List[Tuple[str, Future]]) -> None:
+
+        try:
+            # Identical texts in one window are embedded once
+            unique = list(dict.fromkeys(text for text, _ in batch))
+
+            vectors = self.inner.generate_batch(unique)
+
+            if len(vectors) != len(unique):
+                raise RuntimeError(
+                    f"Inner service returned {len(vectors)} vectors for {len(unique)} texts"
+                )
+
+            by_text = dict(zip(unique, vectors))
+
+            for text, future in batch:
+                self._resolve(future, result=by_text[text])
+
+            with self._stats_lock:
+                self._texts += len(batch)
+                self._batches += 1
+
+        except BaseException as exc:
+            # Never leave a caller waiting, whatever failed above
+            for _, future in batch:
+                self._resolve(future, exc=exc)
+
+        finally:
+            self._slots.release()
+
+    # -------------------------------------------------------------
+
+    def _fail_pending(self) -> None:
+        """Fail anything still queued once the dispatcher has stopped."""
+
+        exc = RuntimeError("CoalescingEmbeddingService is closed")
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if item is not _STOP:
+                self._resolve(item[1], exc=exc)
+
+    # -------------------------------------------------------------
+
+    @staticmethod
+    def _resolve(future: Future, result=None, exc: BaseException | None = None) -> None:
+
+        # Cancelled futures (e.g. a cancelled agenerate) are already done
+        if future.done():
+            return
+
+        try:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            # Cancelled between the done() check and here
+            pass
@@ -6,5 +6,9 @@ class TransientEmbeddingError(EmbeddingError):
     pass
 
 
+class RateLimitedEmbeddingError(TransientEmbeddingError):
+    pass
+
+
 class PermanentEmbeddingError(EmbeddingError):
     pass
\ No newline at end of file
@@ -0,0 +1,223 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import asyncio
+import threading
+import weakref
+from typing import List, Sequence
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from config.settings import gemini_settings
+from application.ports.embedding_service import AsyncEmbeddingService
+from infrastructure.embeddings.gemini.client import EmbeddingClient
+from infrastructure.embeddings.errors import (
+    TransientEmbeddingError,
+    RateLimitedEmbeddingError,
+    PermanentEmbeddingError,
+)
+from utils.retry import async_exponential_backoff_retry_async
+from utils.circuit_breaker import CircuitOpenError
+from utils.rate_limiter import estimate_tokens
+
+
+# ================================================================
+# Embedding Client (ASYNC, BOUNDED CONCURRENCY)
+# ================================================================
+
+class AsyncEmbeddingClient(EmbeddingClient, AsyncEmbeddingService):
+    """
+    Asyncio variant of EmbeddingClient.
+
+    agenerate_batch splits the input into chunks of `batch_size` and
+    dispatches them concurrently, with at most `max_concurrency` requests
+    in flight per client. Output order always matches input order.
+
+    The sync API (generate / generate_batch) runs the same coroutine on a
+    private event loop thread, so it is safe to call from worker threads
+    and from code that already runs inside another event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 32,
+        max_concurrency: int = 4,
+        **kwargs,
+    ):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+
+        super().__init__(**kwargs)
+
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
+        # One semaphore per event loop: asyncio primitives bind to the
+        # first loop that waits on them
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semaphores_lock = threading.Lock()
+
+    # ============================================================
+    # Core API Call
+    # ============================================================
+
+    async def _aembed_batch(self, texts: Sequence[str]) -> List[List[float]]:
+
+        if not texts:
+            raise ValueError("texts must not be empty")
+
+        tokens = estimate_tokens(texts)
+
+        async def do_request():
+            await self._rate_limiter.acquire_async(tokens)
+
+            try:
+                response = await self._client.aio.models.embed_content(
+                    model=gemini_settings.llm.embedding_model,
+                    contents=list(texts),
+                )
+                result = self._parse_response(response)
+
+            except RateLimitedEmbeddingError:
+                self._batch_sizer.record_throttle()
+                raise
+
+            except (TransientEmbeddingError, PermanentEmbeddingError):
+                raise
+
+            except Exception as e:
+                error = self._map_error(e)
+                if isinstance(error, RateLimitedEmbeddingError):
+                    self._batch_sizer.record_throttle()
+                raise error from e
+
+            self._batch_sizer.record_success()
+            return result
+
+        return await async_exponential_backoff_retry_async(
+            do_request,
+            attempts=self.retry_attempts,
+            base_delay=0.4,
+            max_delay=4.0,
+            retry_on=(TransientEmbeddingError,),
+            deadline=self.deadline_seconds,
+            budget=self._retry_budget,
+        )
+
+    # -------------------------------------------------------------
+
+    async def _aembed_chunk(self, texts: Sequence[str]) -> List[List[float]]:
+
+        async with self._get_semaphore():
+            try:
+                return await self._breaker.call_async(self._aembed_batch, texts)
+            except CircuitOpenError as e:
+                raise PermanentEmbeddingError("Circuit breaker open") from e
+
+    # ============================================================
+    # Async API
+    # ============================================================
+
+    async def agenerate(self, text: str) -> List[float]:
+        result = await self.agenerate_batch([text])
+        return result[0]
+
+
+    async def agenerate_batch(self, texts: Sequence[str]) -> List[List[float]]:
+
+        if not texts:
+            return []
+
+        if self.enable_fallback:
+            return [self._fallback_embedding(t) for t in texts]
+
+        # Adaptive size (shrunk by recent 429s), capped by batch_size
+        size = min(self.batch_size, self._batch_sizer.current)
+        chunks = [
+            texts[i:i + size]
+            for i in range(0, len(texts), size)
+        ]
+
+        # gather preserves submission order
+        results = await asyncio.gather(
+            *(self._aembed_chunk(chunk) for chunk in chunks)
+        )
+
+        return [vector for chunk in results for vector in chunk]
+
+    # ============================================================
+    # Sync API (bridged onto the private loop)
+    # ============================================================
+
+    def generate_batch(self, texts: Sequence[str]) -> List[List[float]]:
+
+        if not texts:
+            return []
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.agenerate_batch(texts),
+            self._ensure_loop(),
+        )
+
+        return future.result()
+
+    # -------------------------------------------------------------
+
+    def close(self) -> None:
+
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5.0)
+            loop.close()
+
+        super().close()
+
+    # ============================================================
+    # Event Loop
+    # ============================================================
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="async-embedding-client",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+
+            return self._loop
+
+    # -------------------------------------------------------------
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+
+            return semaphore
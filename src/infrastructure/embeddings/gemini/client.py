@@ -1,9 +1,7 @@
 # ---------------------------------------------------------------------
 # Standard libraries
 # ---------------------------------------------------------------------
-import time
 import hashlib
-import threading
 from typing import List, Sequence
 
 # ---------------------------------------------------------------------
@@ -16,13 +14,17 @@ from google import genai
 # Internal application imports
 # ---------------------------------------------------------------------
 from config.settings import gemini_settings
-from utils.circuit_breaker import CircuitBreaker
+from infrastructure.gemini.client_registry import get_genai_client
+from utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from application.ports.embedding_service import EmbeddingService
 from infrastructure.embeddings.errors import (
     TransientEmbeddingError,
+    RateLimitedEmbeddingError,
     PermanentEmbeddingError,
 )
-from utils.retry import sync_exponential_backoff_retry_sync
+from utils.retry import sync_exponential_backoff_retry_sync, get_retry_budget
+from utils.rate_limiter import get_rate_limiter, estimate_tokens
+from utils.adaptive_batch import AdaptiveBatchSizer
 
 
 # ================================================================
@@ -35,24 +37,47 @@ class EmbeddingClient(EmbeddingService):
         self,
         timeout_seconds: float = 15.0,
         retry_attempts: int = 3,
+        deadline_seconds: float | None = 30.0,
         embedding_dim: int = 768,
         enable_fallback: bool = False,
+        max_batch_size: int | None = None,
     ):
         self.timeout_seconds = timeout_seconds
         self.retry_attempts = retry_attempts
+        self.deadline_seconds = deadline_seconds
         self.embedding_dim = embedding_dim
         self.enable_fallback = enable_fallback
 
-        self._breaker = CircuitBreaker()
-        self._lock = threading.Lock()  # protect breaker updates
+        # Shared per model; transient errors count only once retries are exhausted
+        self._breaker = get_circuit_breaker(
+            f"gemini:{gemini_settings.llm.embedding_model}",
+            failure_on=(TransientEmbeddingError, PermanentEmbeddingError),
+        )
+
+        # Retries across all Gemini clients are capped to a share of requests
+        self._retry_budget = get_retry_budget("gemini")
+
+        # Quota is per model and per process: every client shares one limiter
+        self._rate_limiter = get_rate_limiter(
+            f"gemini:{gemini_settings.llm.embedding_model}",
+            requests_per_minute=gemini_settings.llm.embedding_requests_per_minute,
+            tokens_per_minute=gemini_settings.llm.embedding_tokens_per_minute,
+        )
 
-        self._client = genai.Client(
-            vertexai=True,
-            credentials=gemini_settings.google.credentials,
-            project=gemini_settings.google.project_id,
-            location=gemini_settings.location,
+        # Shrinks on 429s, grows back on success
+        self._batch_sizer = AdaptiveBatchSizer(
+            initial=max_batch_size or gemini_settings.llm.embedding_max_batch_size,
         )
 
+    # ============================================================
+    # Client
+    # ============================================================
+
+    @property
+    def _client(self) -> genai.Client:
+        # Shared per (project, location); created on first request
+        return get_genai_client(location=gemini_settings.location)
+
     # ============================================================
     # Fallback Embedding
     # ============================================================
@@ -72,55 +97,33 @@ class EmbeddingClient(EmbeddingService):
         if not texts:
             raise ValueError("texts must not be empty")
 
-        if self._breaker.is_open():
-            if self.enable_fallback:
-                return [self._fallback_embedding(t) for t in texts]
-            raise PermanentEmbeddingError("Circuit breaker open")
+        tokens = estimate_tokens(texts)
 
         def do_request():
+            self._rate_limiter.acquire(tokens)
+
             try:
                 response = self._client.models.embed_content(
                     model=gemini_settings.llm.embedding_model,
                     contents=list(texts),
                 )
+                result = self._parse_response(response)
 
-                embeddings = getattr(response, "embeddings", None)
-                if not embeddings:
-                    raise TransientEmbeddingError("No embeddings returned")
-
-                normalized: List[List[float]] = []
-
-                for e in embeddings:
-                    values = getattr(e, "values", None) or getattr(e, "embedding", None)
-
-                    if values is None:
-                        raise TransientEmbeddingError(
-                            "Embedding vector missing values"
-                        )
-
-                    vector = list(values)
-
-                    if len(vector) != self.embedding_dim:
-                        raise PermanentEmbeddingError(
-                            f"Unexpected embedding dimension: {len(vector)} "
-                            f"(expected {self.embedding_dim})"
-                        )
-
-                    normalized.append(vector)
-
-                return normalized
-
-            except httpx.ReadTimeout as e:
-                raise TransientEmbeddingError(str(e)) from e
-
-            except httpx.NetworkError as e:
-                raise TransientEmbeddingError(str(e)) from e
+            except RateLimitedEmbeddingError:
+                self._batch_sizer.record_throttle()
+                raise
 
-            except TransientEmbeddingError:
+            except (TransientEmbeddingError, PermanentEmbeddingError):
                 raise
 
             except Exception as e:
-                raise PermanentEmbeddingError(str(e)) from e
+                error = self._map_error(e)
+                if isinstance(error, RateLimitedEmbeddingError):
+                    self._batch_sizer.record_throttle()
+                raise error from e
+
+            self._batch_sizer.record_success()
+            return result
 
         return sync_exponential_backoff_retry_sync(
             do_request,
@@ -128,8 +131,61 @@ class EmbeddingClient(EmbeddingService):
             base_delay=0.4,
             max_delay=4.0,
             retry_on=(TransientEmbeddingError,),
+            deadline=self.deadline_seconds,
+            budget=self._retry_budget,
         )
 
+    # ============================================================
+    # Response Handling
+    # ============================================================
+
+    def _parse_response(self, response) -> List[List[float]]:
+
+        embeddings = getattr(response, "embeddings", None)
+        if not embeddings:
+            raise TransientEmbeddingError("No embeddings returned")
+
+        normalized: List[List[float]] = []
+
+        for e in embeddings:
+            values = getattr(e, "values", None) or getattr(e, "embedding", None)
+
+            if values is None:
+                raise TransientEmbeddingError(
+                    "Embedding vector missing values"
+                )
+
+            vector = list(values)
+
+            if len(vector) != self.embedding_dim:
+                raise PermanentEmbeddingError(
+                    f"Unexpected embedding dimension: {len(vector)} "
+                    f"(expected {self.embedding_dim})"
+                )
+
+            normalized.append(vector)
+
+        return normalized
+
+    # -------------------------------------------------------------
+
+    @staticmethod
+    def _map_error(exc: Exception) -> Exception:
+
+        if isinstance(exc, (httpx.ReadTimeout, httpx.NetworkError)):
+            return TransientEmbeddingError(str(exc))
+
+        # genai APIError / api_core exceptions carry the HTTP status in `code`
+        code = getattr(exc, "code", None)
+
+        if code == 429:
+            return RateLimitedEmbeddingError(str(exc))
+
+        if isinstance(code, int) and code >= 500:
+            return TransientEmbeddingError(str(exc))
+
+        return PermanentEmbeddingError(str(exc))
+
     # ============================================================
     # Public API
     # ============================================================
@@ -143,31 +199,28 @@ class EmbeddingClient(EmbeddingService):
         if self.enable_fallback:
             return [self._fallback_embedding(t) for t in texts]
 
-        start = time.monotonic()
+        if not texts:
+            return []
 
         try:
-            result = self._embed_batch(texts)
+            return self._breaker.call(self._embed_all, texts)
+        except CircuitOpenError as e:
+            raise PermanentEmbeddingError("Circuit breaker open") from e
 
-            # Record success only once per batch
-            with self._lock:
-                self._breaker.record_success()
 
-            return result
+    def _embed_all(self, texts: Sequence[str]) -> List[List[float]]:
 
-        except TransientEmbeddingError:
-            # DO NOT open circuit for transient errors
-            raise
+        result: List[List[float]] = []
 
-        except PermanentEmbeddingError:
-            # Permanent errors open circuit
-            with self._lock:
-                self._breaker.record_failure()
-            raise
+        # Re-read the batch size per chunk so a 429 shrinks the rest
+        start_index = 0
+        while start_index < len(texts):
+            chunk = texts[start_index:start_index + self._batch_sizer.current]
+            result.extend(self._embed_batch(chunk))
+            start_index += len(chunk)
 
-        finally:
-            latency = time.monotonic() - start
-            # optionally log latency here
+        return result
 
     def close(self) -> None:
-        if hasattr(self._client, "close"):
-            self._client.close()
\ No newline at end of file
+        # The genai.Client is shared process-wide; see close_all_clients()
+        pass
\ No newline at end of file
@@ -1,27 +1,192 @@
 # ---------------------------------------------------------------------
 # Standard library
 # ---------------------------------------------------------------------
+import threading
+from typing import Any, Dict, List, Sequence
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
+import numpy as np
 
 # ---------------------------------------------------------------------
 # Internal application imports
 # ---------------------------------------------------------------------
 from application.ports.embedding_service import EmbeddingService
+from infrastructure.embeddings.errors import PermanentEmbeddingError
+
+
+# Dynamic int8 export shipped with most sentence-transformers hub models
+DEFAULT_QUANTIZED_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Multilingual, 768-d: matches EmbeddingModel.vector and the Gemini client
+DEFAULT_MODEL = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
+DEFAULT_DIMENSION = 768
 
 
 class SentenceTransformersEmbeddingService(EmbeddingService):
+    """
+    Local CPU embeddings through sentence-transformers.
+
+    backend: "torch" or "onnx" (ONNX Runtime, needs `optimum[onnxruntime]`).
+    quantize: with the ONNX backend, load the int8 model file
+        (`onnx_file_name`, or DEFAULT_QUANTIZED_FILE).
+    num_threads: intra-op threads for the ONNX Runtime session; None keeps
+        the library default. torch only has a process-wide setting, so it
+        is applied there only with set_torch_threads=True.
+    expected_dimension: checked against the model when it loads and against
+        every batch it returns. Defaults to the dimension of the stored
+        embeddings, so a mismatched model fails at load time instead of on
+        insert; pass None to accept any model.
+
+    The model loads on first use.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        batch_size: int = 32,
+        num_threads: int | None = None,
+        backend: str = "torch",
+        quantize: bool = False,
+        onnx_file_name: str | None = None,
+        expected_dimension: int | None = DEFAULT_DIMENSION,
+        normalize: bool = True,
+        set_torch_threads: bool = False,
+    ):
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Unsupported backend: {backend!r}")
+
+        if quantize and backend != "onnx":
+            raise ValueError("quantize requires backend='onnx'")
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+
+        if set_torch_threads and (backend != "torch" or not num_threads):
+            raise ValueError("set_torch_threads requires backend='torch' and num_threads")
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.backend = backend
+        self.quantize = quantize
+        self.onnx_file_name = onnx_file_name or (DEFAULT_QUANTIZED_FILE if quantize else None)
+        self.expected_dimension = expected_dimension
+        self.normalize = normalize
+        self.set_torch_threads = set_torch_threads
+
+        self._model = None
+        self._lock = threading.Lock()
+
+    # ============================================================
+    # EmbeddingService
+    # ============================================================
+
+    def generate(self, text: str) -> List[float]:
+        return self.generate_batch([text])[0]
+
+
+    def generate_batch(self, texts: Sequence[str]) -> List[List[float]]:
+
+        if not texts:
+            return []
+
+        vectors = self.model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            normalize_embeddings=self.normalize,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+
+        if vectors.ndim != 2 or vectors.shape[0] != len(texts):
+            raise PermanentEmbeddingError(
+                f"Model returned shape {vectors.shape} for {len(texts)} texts"
+            )
+
+        if vectors.shape[1] != self.dimension():
+            raise PermanentEmbeddingError(
+                f"Model returned dimension {vectors.shape[1]}, expected {self.dimension()}"
+            )
+
+        return vectors.tolist()
+
+
+    def embed_text(self, text: str) -> list[float]:
+        # Kept for older callers; same as generate()
+        return self.generate(text)
+
+
+    def dimension(self) -> int:
+        return self.expected_dimension or self.model.get_sentence_embedding_dimension()
+
+    # ============================================================
+    # Model loading
+    # ============================================================
+
+    @property
+    def model(self):
+
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._load()
+
+        return self._model
+
+
+    def _load(self):
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
         try:
             from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(model_name)
         except ImportError:
             raise ImportError("Please install the 'sentence-transformers' package.")
 
+        if self.set_torch_threads:
+            # Process-wide: affects every torch model in this process
+            import torch
+            torch.set_num_threads(self.num_threads)
 
-    def embed_text(self, text: str) -> list[float]:
-        vector = self.model.encode([text], normalize_embeddings=True)[0]
-        return [float(x) for x in vector]
\ No newline at end of file
+        model = SentenceTransformer(
+            self.model_name,
+            device="cpu",
+            backend=self.backend,
+            model_kwargs=self._model_kwargs(),
+        )
+
+        actual = model.get_sentence_embedding_dimension()
+
+        if self.expected_dimension is not None and actual != self.expected_dimension:
+            raise ValueError(
+                f"Model {self.model_name!r} produces {actual}-d vectors, "
+                f"expected {self.expected_dimension}"
+            )
+
+        return model
+
+
+    def _model_kwargs(self) -> Dict[str, Any]:
+
+        if self.backend != "onnx":
+            return {}
+
+        kwargs: Dict[str, Any] = {"provider": "CPUExecutionProvider"}
+
+        if self.onnx_file_name:
+            kwargs["file_name"] = self.onnx_file_name
+
+        if self.num_threads:
+            try:
+                import onnxruntime as ort
+            except ImportError:
+                raise ImportError("Please install 'optimum[onnxruntime]' for the ONNX backend.")
+
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = self.num_threads
+            options.inter_op_num_threads = 1
+            kwargs["session_options"] = options
+
+        return kwargs
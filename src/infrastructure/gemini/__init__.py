@@ -0,0 +1,7 @@
+# Process-wide genai.Client registry shared by the Gemini LLM and embedding clients
+from .client_registry import get_genai_client, close_all_clients
+
+__all__ = [
+    "get_genai_client",
+    "close_all_clients",
+]
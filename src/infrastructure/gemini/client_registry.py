@@ -0,0 +1,96 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import atexit
+import threading
+from typing import Dict, Sequence, Tuple
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+from google import genai
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from config.settings import gemini_settings
+
+
+ClientKey = Tuple[str | None, str, Tuple[str, ...] | None]
+
+_clients: Dict[ClientKey, genai.Client] = {}
+_lock = threading.Lock()
+
+
+def get_genai_client(
+    location: str | None = None,
+    project: str | None = None,
+    scopes: Sequence[str] | None = None,
+) -> genai.Client:
+    """
+    Return the genai.Client shared by every caller in this process for
+    (project, location[, scopes]).
+
+    Credentials are discovered once (see GoogleCredentials.resolve) and the
+    client's HTTP connection pool is reused, so constructing LLM/embedding
+    clients per job does not redo auth or TLS handshakes.
+    """
+    location = location or gemini_settings.location
+    scope_key = tuple(scopes) if scopes else None
+
+    with _lock:
+        credentials, default_project = _resolve_credentials(scope_key)
+        project = project or default_project
+
+        key = (project, location, scope_key)
+        client = _clients.get(key)
+
+        if client is None:
+            client = genai.Client(
+                vertexai=True,
+                credentials=credentials,
+                project=project,
+                location=location,
+            )
+            _clients[key] = client
+
+        return client
+
+
+def close_all_clients() -> None:
+    """Close every shared client. Registered with atexit; safe to call twice."""
+
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        close = getattr(client, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+
+_scoped_credentials: Dict[Tuple[str, ...], Tuple[object, str | None]] = {}
+
+
+def _resolve_credentials(scopes: Tuple[str, ...] | None) -> Tuple[object, str | None]:
+    # Called with _lock held
+
+    if scopes is None:
+        return gemini_settings.google.resolve()
+
+    if scopes not in _scoped_credentials:
+        from google.auth import default
+        _scoped_credentials[scopes] = default(scopes=list(scopes))
+
+    return _scoped_credentials[scopes]
+
+
+atexit.register(close_all_clients)
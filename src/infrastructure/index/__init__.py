@@ -0,0 +1,8 @@
+# In-process category indexes
+from .numpy_category_index import NumpyCategoryIndex
+from .bitmap_eligibility_index import BitmapEligibilityIndex
+
+__all__ = [
+    "NumpyCategoryIndex",
+    "BitmapEligibilityIndex",
+]
@@ -0,0 +1,162 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import numpy as np
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from application.ports.eligibility_index import EligibilityIndex
+from domain.entities.categories.category_profile import CategoryProfile
+
+
+class BitmapEligibilityIndex(EligibilityIndex):
+    """
+    Features:
+    - One boolean row mask per gender and per business type, plus masks
+      for rows without that constraint
+    - (gender, business_type) masks built as one AND and memoized
+    - Exclusions cleared on a copy of the memoized mask
+    - Same semantics as CategoryEligibilityPolicy: an empty allowed set
+      means "no constraint"
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built = False
+
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._unconstrained_gender = np.zeros(0, dtype=bool)
+        self._unconstrained_business = np.zeros(0, dtype=bool)
+        self._by_gender: Dict[str, np.ndarray] = {}
+        self._by_business: Dict[str, np.ndarray] = {}
+        self._pairs: Dict[Tuple[str, str], np.ndarray] = {}
+
+    # =============================================================
+    # BUILD
+    # =============================================================
+
+    def build(
+        self,
+        profiles: Sequence[CategoryProfile],
+        category_ids: Sequence[str],
+    ) -> None:
+        """
+        Index the profiles of the given rows.
+
+        Rows without a profile are never eligible; profiles for
+        categories outside `category_ids` are ignored.
+        """
+        ids = list(category_ids)
+        positions = {cid: i for i, cid in enumerate(ids)}
+        n = len(positions)
+
+        unconstrained_gender = np.zeros(n, dtype=bool)
+        unconstrained_business = np.zeros(n, dtype=bool)
+
+        gender_rows: Dict[str, List[int]] = {}
+        business_rows: Dict[str, List[int]] = {}
+
+        for prof in profiles:
+            row = positions.get(prof.category.id)
+            if row is None:
+                continue
+
+            c = prof.constraints
+
+            if c.allowed_genders:
+                for gender in c.allowed_genders:
+                    gender_rows.setdefault(gender, []).append(row)
+            else:
+                unconstrained_gender[row] = True
+
+            if c.allowed_business_types:
+                for business in c.allowed_business_types:
+                    business_rows.setdefault(business, []).append(row)
+            else:
+                unconstrained_business[row] = True
+
+        by_gender = {
+            gender: self._rows_mask(n, rows) | unconstrained_gender
+            for gender, rows in gender_rows.items()
+        }
+        by_business = {
+            business: self._rows_mask(n, rows) | unconstrained_business
+            for business, rows in business_rows.items()
+        }
+
+        with self._lock:
+            self._ids = ids
+            self._positions = positions
+            self._unconstrained_gender = unconstrained_gender
+            self._unconstrained_business = unconstrained_business
+            self._by_gender = by_gender
+            self._by_business = by_business
+            self._pairs = {}
+            self._built = True
+
+    # -------------------------------------------------------------
+
+    def is_built(self) -> bool:
+        return self._built
+
+
+    def category_ids(self) -> List[str]:
+        return list(self._ids)
+
+    # =============================================================
+    # MASKS
+    # =============================================================
+
+    def mask_for(
+        self,
+        gender: str,
+        business_type: str,
+        excluded_ids: Iterable[str] = (),
+    ) -> np.ndarray:
+        """
+        Eligible rows for the context. The returned array is a fresh copy
+        and may be modified by the caller.
+        """
+        key = (gender, business_type)
+
+        with self._lock:
+            base = self._pairs.get(key)
+
+            if base is None:
+                base = (
+                    self._by_gender.get(gender, self._unconstrained_gender)
+                    & self._by_business.get(business_type, self._unconstrained_business)
+                )
+                self._pairs[key] = base
+
+            positions = self._positions
+
+        mask = base.copy()
+
+        rows = [positions[cid] for cid in excluded_ids if cid in positions]
+        if rows:
+            mask[rows] = False
+
+        return mask
+
+
+    def is_empty(self, mask: np.ndarray) -> bool:
+        return not mask.any()
+
+    # =============================================================
+    # HELPERS
+    # =============================================================
+
+    @staticmethod
+    def _rows_mask(n: int, rows: List[int]) -> np.ndarray:
+        mask = np.zeros(n, dtype=bool)
+        mask[rows] = True
+        return mask
@@ -0,0 +1,235 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+import numpy as np
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from domain.entities.embeddings.embedding import Embedding
+from application.ports.category_index import CategoryIndex
+
+
+class NumpyCategoryIndex(CategoryIndex):
+    """
+    Features:
+    - Contiguous float32 matrix, one L2-normalized row per category
+    - Top-k cosine search as one matrix-vector product + argpartition
+    - Batched search as one matrix-matrix product
+    - Eligibility applied as a boolean row mask
+    - Thread-safe reloads (readers keep the snapshot they started with)
+    """
+
+    def __init__(self, expected_dimension: int | None = None):
+        self.expected_dimension = expected_dimension
+
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        # (ids, positions, matrix) swapped atomically on reload
+        self._snapshot: Tuple[List[str], Dict[str, int], np.ndarray] = (
+            [],
+            {},
+            np.empty((0, expected_dimension or 0), dtype=np.float32),
+        )
+
+    # =============================================================
+    # LOADING
+    # =============================================================
+
+    def load(self, embeddings: Sequence[Embedding]) -> None:
+        """
+        Build the matrix from embeddings.
+
+        If a category has several embeddings (one per content hash),
+        the most recently created one wins.
+        """
+        latest: Dict[str, Embedding] = {}
+
+        for emb in embeddings:
+            current = latest.get(emb.category_id)
+            if current is None or emb.created_at >= current.created_at:
+                latest[emb.category_id] = emb
+
+        ids = list(latest.keys())
+
+        if ids:
+            matrix = np.asarray(
+                [latest[cid].vector for cid in ids],
+                dtype=np.float32,
+            )
+        else:
+            matrix = np.empty((0, self.expected_dimension or 0), dtype=np.float32)
+
+        if self.expected_dimension and matrix.shape[1] != self.expected_dimension:
+            raise ValueError(
+                f"Embedding dimension mismatch. "
+                f"Expected {self.expected_dimension}, got {matrix.shape[1]}"
+            )
+
+        matrix = np.ascontiguousarray(self._normalize_rows(matrix))
+
+        positions = {cid: i for i, cid in enumerate(ids)}
+
+        with self._lock:
+            self._snapshot = (ids, positions, matrix)
+            self._loaded = True
+
+    # -------------------------------------------------------------
+
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+
+    def category_ids(self) -> List[str]:
+        return list(self._snapshot[0])
+
+
+    def __len__(self) -> int:
+        return len(self._snapshot[0])
+
+    # =============================================================
+    # MASKS
+    # =============================================================
+
+    def mask_for(self, category_ids: Iterable[str]) -> np.ndarray:
+        """Boolean row mask; unknown category IDs are ignored."""
+
+        positions = self._snapshot[1]
+        mask = np.zeros(len(positions), dtype=bool)
+
+        rows = [positions[cid] for cid in category_ids if cid in positions]
+        if rows:
+            mask[rows] = True
+
+        return mask
+
+    # =============================================================
+    # SEARCH
+    # =============================================================
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        top_k: int = 5,
+        mask: np.ndarray | None = None,
+    ) -> List[Tuple[str, float]]:
+
+        if top_k <= 0:
+            raise ValueError("top_k must be > 0")
+
+        ids, _, matrix = self._snapshot
+
+        query = np.asarray(query_vector, dtype=np.float32)
+
+        if query.ndim != 1 or query.shape[0] != matrix.shape[1]:
+            raise ValueError(
+                f"Query dimension mismatch. "
+                f"Expected {matrix.shape[1]}, got {query.shape[-1]}"
+            )
+
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+
+        scores = matrix @ query
+
+        if mask is not None:
+            if mask.shape[0] != scores.shape[0]:
+                raise ValueError("mask length does not match index size")
+            scores = np.where(mask, scores, -np.inf)
+            candidates = int(np.count_nonzero(mask))
+        else:
+            candidates = scores.shape[0]
+
+        k = min(top_k, candidates)
+        if k == 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [(ids[i], self._clamp(scores[i])) for i in top]
+
+    # -------------------------------------------------------------
+
+    def search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        top_k: int = 5,
+        masks: Sequence[np.ndarray] | np.ndarray | None = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Score every query with a single matrix-matrix product.
+
+        `masks`, when given, holds one boolean row mask per query.
+        """
+
+        if top_k <= 0:
+            raise ValueError("top_k must be > 0")
+
+        ids, _, matrix = self._snapshot
+
+        queries = np.asarray(query_vectors, dtype=np.float32)
+
+        if queries.size == 0:
+            return []
+
+        if queries.ndim != 2 or queries.shape[1] != matrix.shape[1]:
+            raise ValueError(
+                f"Query dimension mismatch. "
+                f"Expected {matrix.shape[1]}, got {queries.shape[-1]}"
+            )
+
+        scores = self._normalize_rows(queries) @ matrix.T
+
+        if masks is not None:
+            masks = np.asarray(masks, dtype=bool)
+            if masks.shape != scores.shape:
+                raise ValueError("masks shape does not match (queries, index size)")
+            scores = np.where(masks, scores, -np.inf)
+            candidates = np.count_nonzero(masks, axis=1)
+        else:
+            candidates = np.full(scores.shape[0], scores.shape[1])
+
+        k = min(top_k, scores.shape[1])
+        if k == 0:
+            return [[] for _ in range(scores.shape[0])]
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        return [
+            [
+                (ids[i], self._clamp(score))
+                for i, score in zip(row[:n], row_scores[:n])
+            ]
+            for row, row_scores, n in zip(
+                top, top_scores, np.minimum(candidates, k)
+            )
+        ]
+
+    # =============================================================
+    # HELPERS
+    # =============================================================
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+
+    @staticmethod
+    def _clamp(score: float) -> float:
+        return max(0.0, min(1.0, float(score)))
@@ -0,0 +1,13 @@
+# Response caches for LLMClient.chat
+from .base import LLMResponseCache, build_cache_key
+from .memory import InMemoryLLMCache
+from .sqlite import SQLiteLLMCache
+from .tiered import TieredLLMCache
+
+__all__ = [
+    "LLMResponseCache",
+    "build_cache_key",
+    "InMemoryLLMCache",
+    "SQLiteLLMCache",
+    "TieredLLMCache",
+]
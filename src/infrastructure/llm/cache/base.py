@@ -0,0 +1,70 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import json
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+
+
+class LLMResponseCache(ABC):
+    """Key/value store for LLM responses. Keys come from build_cache_key."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+def build_cache_key(
+    model: str,
+    system: str,
+    user: str,
+    schema: Any = None,
+    config: Dict[str, Any] | None = None,
+) -> str:
+    """
+    SHA-256 over the model, rendered prompt text, response schema and
+    generation config. Anything that can change the response must be in
+    the key.
+    """
+
+    payload = {
+        "model": model,
+        "system": system or "",
+        "user": user or "",
+        "schema": _to_jsonable(schema),
+        "config": {k: _to_jsonable(v) for k, v in (config or {}).items() if v is not None},
+    }
+
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _to_jsonable(value: Any) -> Any:
+    # Pydantic model classes used as response schemas
+    if isinstance(value, type) and hasattr(value, "model_json_schema"):
+        return value.model_json_schema()
+
+    # Pydantic instances (e.g. genai.types.Schema): their own field values
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+
+    return value
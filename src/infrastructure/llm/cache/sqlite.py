@@ -0,0 +1,140 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import os
+import time
+import sqlite3
+import threading
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from infrastructure.llm.cache.base import LLMResponseCache
+
+
+class SQLiteLLMCache(LLMResponseCache):
+    """
+    On-disk cache that survives restarts.
+
+    Entries older than ttl_seconds are ignored and purged; when more than
+    max_entries are stored, the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/llm_responses.sqlite3",
+        max_entries: int = 10_000,
+        ttl_seconds: float | None = 7 * 24 * 3600,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_responses_accessed_at "
+            "ON llm_responses (accessed_at)"
+        )
+        self._conn.commit()
+
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, created_at = row
+
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+
+            return value
+
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO llm_responses (key, value, created_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (key, value, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+    def _evict(self, now: float) -> None:
+        # Called with _lock held
+
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+
+        self._conn.execute(
+            """
+            DELETE FROM llm_responses WHERE key IN (
+                SELECT key FROM llm_responses
+                ORDER BY accessed_at DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
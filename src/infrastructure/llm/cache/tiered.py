@@ -0,0 +1,42 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from infrastructure.llm.cache.base import LLMResponseCache
+
+
+class TieredLLMCache(LLMResponseCache):
+    """Memory in front of a persistent store; store hits are promoted."""
+
+    def __init__(self, memory: LLMResponseCache, store: LLMResponseCache):
+        self.memory = memory
+        self.store = store
+
+
+    def get(self, key: str) -> str | None:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        value = self.store.get(key)
+        if value is not None:
+            self.memory.set(key, value)
+
+        return value
+
+
+    def set(self, key: str, value: str) -> None:
+        self.memory.set(key, value)
+        self.store.set(key, value)
+
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.store.clear()
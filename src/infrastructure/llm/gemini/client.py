@@ -1,14 +1,16 @@
 # ---------------------------------------------------------------------
 # Standard libraries
 # ---------------------------------------------------------------------
-import threading
+import json
+import time
+import logging
 from typing import Dict, Any, List
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
+import httpx
 from google import genai
-from google.auth import default
 from google.genai.types import Content, Part, GenerateContentConfig
 from google.api_core import exceptions as google_exceptions
 
@@ -16,15 +18,23 @@ from google.api_core import exceptions as google_exceptions
 # Internal application imports
 # ---------------------------------------------------------------------
 from config.settings import gemini_settings
-from utils.circuit_breaker import CircuitBreaker
+from infrastructure.gemini.client_registry import get_genai_client
+from utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from application.ports.llm_service import LLMService
 from infrastructure.llm.errors import (
+    LLMError,
     TransientLLMError,
     ValidationLLMError,
     ProviderLLMError,
     PermanentLLMError,
 )
-from utils.retry import sync_exponential_backoff_retry_sync
+from infrastructure.llm.cache import LLMResponseCache, build_cache_key
+from infrastructure.llm.metrics import LLMCallMetrics, LLMMetrics
+from utils.retry import sync_exponential_backoff_retry_sync, get_retry_budget
+from utils.rate_limiter import get_rate_limiter, estimate_tokens
+
+
+logger = logging.getLogger(__name__)
 
 
 class LLMClient(LLMService):
@@ -47,9 +57,12 @@ class LLMClient(LLMService):
         scope: list[str] | None = None,
         timeout_seconds: float = 30.0,
         retry_attempts: int = 3,
+        deadline_seconds: float | None = 90.0,
         temperature: float | None = None,
         max_tokens: int | None = None,
         enable_fallback: bool = False,
+        cache: LLMResponseCache | None = None,
+        metrics: LLMMetrics | None = None,
     ) -> None:
         """
         Initialize Gemini LLM client.
@@ -60,36 +73,52 @@ class LLMClient(LLMService):
             scope: OAuth2 scopes for authentication
             timeout_seconds: Request timeout
             retry_attempts: Number of retry attempts
+            deadline_seconds: Overall time allowed for a call, retries included
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
             enable_fallback: Enable model fallback on failure
+            cache: Optional response cache consulted before calling the API
+            metrics: Aggregated per-call metrics (a new LLMMetrics by default)
         """
         self.model = model or gemini_settings.llm.model_fast or self.DEFAULT_MODEL
         self.timeout_seconds = timeout_seconds
         self.retry_attempts = retry_attempts
+        self.deadline_seconds = deadline_seconds
         self.temperature = temperature or self.DEFAULT_TEMPERATURE
         self.max_tokens = max_tokens
         self.enable_fallback = enable_fallback
+        self.cache = cache
+        self.metrics = metrics or LLMMetrics()
 
-        self._breaker = CircuitBreaker(
+        # Shared per model: a dead upstream fails fast for every client
+        self._breaker = get_circuit_breaker(
+            f"gemini:{self.model}",
             failure_threshold=5,
-            reset_timeout=60
+            reset_timeout=60,
+            failure_on=(TransientLLMError, PermanentLLMError, ProviderLLMError),
         )
-        self._lock = threading.Lock()
 
-        # Authenticate with Google Cloud
-        self._credentials, self._project = default(
-            scopes=scope or ["https://www.googleapis.com/auth/cloud-platform"]
+        # Retries across all Gemini clients are capped to a share of requests
+        self._retry_budget = get_retry_budget("gemini")
+
+        # Quota is per model and per process: every client shares one limiter
+        self._rate_limiter = get_rate_limiter(
+            f"gemini:{self.model}",
+            requests_per_minute=gemini_settings.llm.requests_per_minute,
+            tokens_per_minute=gemini_settings.llm.tokens_per_minute,
         )
+
+        self._scope = scope
         self._location = location or gemini_settings.location or "us-central1"
 
-        # Initialize Gemini client
-        self._client = genai.Client(
-            vertexai=True,
-            project=self._project,
-            location=self._location,
-            credentials=self._credentials,
-        )
+    # =============================================================
+    # CLIENT
+    # =============================================================
+
+    @property
+    def _client(self) -> genai.Client:
+        # Shared per (project, location, scopes); created on first request
+        return get_genai_client(location=self._location, scopes=self._scope)
 
     # =============================================================
     # PUBLIC API
@@ -121,55 +150,94 @@ class LLMClient(LLMService):
         if 'user' not in prompt:
             raise ValidationLLMError("prompt must contain 'user' field")
 
-        # Check circuit breaker
-        with self._lock:
-            self._breaker.record_success()
+        call = LLMCallMetrics(model=self.model)
+
+        # Serve unchanged prompts from cache
+        cache_key = self._cache_key(prompt, kwargs) if self.cache else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                call.cached = call.success = True
+                self._record(call)
+                return cached
 
-        # Generate response with retry
+        # Generate response with retry, through the circuit breaker
+        start = time.perf_counter()
         try:
-            return self._generate_with_retry(prompt, **kwargs)
+            result = self._breaker.call(self._generate_with_retry, prompt, call, **kwargs)
+        except CircuitOpenError as e:
+            self._record(call)
+            raise PermanentLLMError(f"Circuit breaker open for {self.model}") from e
         except Exception:
-            with self._lock:
-                self._breaker.record_failure()
+            call.latency_seconds = time.perf_counter() - start
+            self._record(call)
             raise
 
+        call.latency_seconds = time.perf_counter() - start
+        call.success = True
+        self._record(call)
+
+        if cache_key is not None and self._is_cacheable(result, prompt, kwargs):
+            self.cache.set(cache_key, result)
+
+        return result
+
+    @staticmethod
+    def _is_cacheable(result: str, prompt: Dict[str, Any], kwargs: Dict[str, Any]) -> bool:
+        """JSON responses are only cached when they parse, so a retry gets a fresh answer."""
+
+        mime_type = kwargs.get("mime_type", prompt.get("mime_type"))
+        if mime_type != "application/json":
+            return True
+
+        try:
+            json.loads(result)
+        except (TypeError, ValueError):
+            logger.warning("Not caching invalid JSON response")
+            return False
+
+        return True
+
     # =============================================================
     # GENERATION
     # =============================================================
 
-    def _generate_with_retry(self, prompt: Dict[str, Any], **kwargs) -> str:
+    def _generate_with_retry(
+        self,
+        prompt: Dict[str, Any],
+        call: LLMCallMetrics,
+        **kwargs,
+    ) -> str:
         """Generate response with exponential backoff retry."""
 
         def do_request():
-            return self._generate(prompt, **kwargs)
+            call.attempts += 1
+            return self._generate(prompt, call, **kwargs)
 
+        # Only transient errors are retried; permanent ones fail at once
         try:
-            result = sync_exponential_backoff_retry_sync(
+            return sync_exponential_backoff_retry_sync(
                 do_request,
                 attempts=self.retry_attempts,
                 base_delay=1.0,
                 max_delay=10.0,
-                retry_on=(TransientLLMError, PermanentLLMError)
+                retry_on=(TransientLLMError,),
+                deadline=self.deadline_seconds,
+                budget=self._retry_budget,
             )
 
-            with self._lock:
-                self._breaker.record_success()
-
-            return result
-
-        except google_exceptions.ResourceExhausted as e:
-            raise TransientLLMError(f"Rate limit exceeded: {e}") from e
-        except google_exceptions.ServiceUnavailable as e:
-            raise TransientLLMError(f"Service unavailable: {e}") from e
-        except google_exceptions.DeadlineExceeded as e:
-            raise TransientLLMError(f"Request timeout: {e}") from e
-        except google_exceptions.InvalidArgument as e:
-            raise ValidationLLMError(f"Invalid request: {e}") from e
+        except LLMError:
+            raise
         except Exception as e:
             raise PermanentLLMError(f"LLM generation failed: {e}") from e
 
 
-    def _generate(self, prompt: Dict[str, Any], **kwargs) -> str:
+    def _generate(
+        self,
+        prompt: Dict[str, Any],
+        call: LLMCallMetrics,
+        **kwargs,
+    ) -> str:
         """Generate response from Gemini."""
 
         # Build contents from prompt
@@ -181,21 +249,34 @@ class LLMClient(LLMService):
         if 'mime_type' in prompt and 'mime_type' not in kwargs:
             kwargs['mime_type'] = prompt['mime_type']
 
-        # Debug output
-        print(f"\n{'='*10} LLM | Client Debug {'='*10}")
-        print(f"Schema in kwargs: {kwargs.get('schema', 'NOT SET')}")
-        print(f"MIME type in kwargs: {kwargs.get('mime_type', 'NOT SET')}")
-        print(f"{'='*40}\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "LLM request model=%s mime_type=%s schema=%s",
+                self.model,
+                kwargs.get("mime_type"),
+                "set" if kwargs.get("schema") else "not set",
+            )
 
         config = self._build_config(**kwargs)
 
-        response = self._client.models.generate_content(
-            model=self.model,
-            contents=contents,
-            config=config,
+        prompt_text = "".join(
+            part.text for content in contents for part in content.parts
         )
+        self._rate_limiter.acquire(estimate_tokens([prompt_text]))
+
+        try:
+            response = self._client.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config=config,
+            )
+        except Exception as e:
+            raise self._map_error(e) from e
 
-        print(f"Response: {response}")
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            call.prompt_tokens = getattr(usage, "prompt_token_count", None)
+            call.output_tokens = getattr(usage, "candidates_token_count", None)
 
         if not response.candidates:
             raise ProviderLLMError("No candidates in response")
@@ -246,6 +327,69 @@ class LLMClient(LLMService):
         return contents
 
 
+    @staticmethod
+    def _map_error(exc: Exception) -> Exception:
+        """Classify provider errors so only transient ones are retried."""
+
+        if isinstance(exc, (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)):
+            return TransientLLMError(f"Rate limit exceeded: {exc}")
+        if isinstance(exc, (google_exceptions.ServiceUnavailable, google_exceptions.InternalServerError)):
+            return TransientLLMError(f"Service unavailable: {exc}")
+        if isinstance(exc, google_exceptions.DeadlineExceeded):
+            return TransientLLMError(f"Request timeout: {exc}")
+        if isinstance(exc, google_exceptions.InvalidArgument):
+            return ValidationLLMError(f"Invalid request: {exc}")
+        if isinstance(exc, (httpx.TimeoutException, httpx.NetworkError)):
+            return TransientLLMError(f"Network error: {exc}")
+
+        # genai APIError carries the HTTP status in `code`
+        code = getattr(exc, "code", None)
+
+        if code == 429:
+            return TransientLLMError(f"Rate limit exceeded: {exc}")
+        if isinstance(code, int) and code >= 500:
+            return TransientLLMError(f"Provider error {code}: {exc}")
+        if code == 400:
+            return ValidationLLMError(f"Invalid request: {exc}")
+
+        return PermanentLLMError(f"LLM generation failed: {exc}")
+
+
+    def _record(self, call: LLMCallMetrics) -> None:
+        self.metrics.record(call)
+
+        if call.success:
+            logger.debug(
+                "LLM call model=%s cached=%s latency=%.3fs prompt_tokens=%s output_tokens=%s retries=%d",
+                call.model, call.cached, call.latency_seconds,
+                call.prompt_tokens, call.output_tokens, call.retries,
+            )
+        else:
+            logger.warning(
+                "LLM call failed model=%s latency=%.3fs attempts=%d",
+                call.model, call.latency_seconds, call.attempts,
+            )
+
+
+    def _cache_key(self, prompt: Dict[str, Any], kwargs: Dict[str, Any]) -> str:
+        """Key over everything that shapes the response (see build_cache_key)."""
+
+        return build_cache_key(
+            model=self.model,
+            system=prompt.get("system", ""),
+            user=prompt.get("user", ""),
+            schema=kwargs.get("schema", prompt.get("schema")),
+            config={
+                "temperature": kwargs.get("temperature", self.temperature),
+                "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+                "top_p": kwargs.get("top_p"),
+                "top_k": kwargs.get("top_k"),
+                "stop_sequences": kwargs.get("stop_sequences"),
+                "mime_type": kwargs.get("mime_type", prompt.get("mime_type")),
+            },
+        )
+
+
     def _build_config(self, **kwargs) -> GenerateContentConfig:
 
         temperature = kwargs.get("temperature", self.temperature)
@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import threading
+from dataclasses import dataclass, asdict
+from typing import Dict, Any
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+
+
+@dataclass
+class LLMCallMetrics:
+    """Per-call measurements, filled in as the call progresses."""
+    model: str
+    attempts: int = 0
+    prompt_tokens: int | None = None
+    output_tokens: int | None = None
+    latency_seconds: float = 0.0
+    cached: bool = False
+    success: bool = False
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+class LLMMetrics:
+    """Thread-safe running totals over LLMCallMetrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+
+    def record(self, call: LLMCallMetrics) -> None:
+        with self._lock:
+            self._totals["calls"] += 1
+            self._totals["cache_hits"] += int(call.cached)
+            self._totals["failures"] += int(not call.success)
+            self._totals["retries"] += call.retries
+            self._totals["prompt_tokens"] += call.prompt_tokens or 0
+            self._totals["output_tokens"] += call.output_tokens or 0
+            self._totals["latency_seconds"] += call.latency_seconds
+            self._last = call
+
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            totals = dict(self._totals)
+            last = asdict(self._last) if self._last else None
+
+        api_calls = totals["calls"] - totals["cache_hits"]
+        totals["avg_latency_seconds"] = (
+            totals["latency_seconds"] / api_calls if api_calls else 0.0
+        )
+        totals["last_call"] = last
+
+        return totals
+
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals: Dict[str, Any] = {
+                "calls": 0,
+                "cache_hits": 0,
+                "failures": 0,
+                "retries": 0,
+                "prompt_tokens": 0,
+                "output_tokens": 0,
+                "latency_seconds": 0.0,
+            }
+            self._last: LLMCallMetrics | None = None
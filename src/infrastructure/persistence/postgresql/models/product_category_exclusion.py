@@ -0,0 +1,32 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from infrastructure.persistence.postgresql.base import Base
+
+
+class ProductCategoryExclusionModel(Base):
+    __tablename__ = "product_category_exclusions"
+
+    sku: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("products.sku"),
+        primary_key=True,
+    )
+
+    category_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("categories.id"),
+        primary_key=True,
+    )
+
+    reason: Mapped[str | None] = mapped_column(Text, nullable=True)
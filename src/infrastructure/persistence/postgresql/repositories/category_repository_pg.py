@@ -7,9 +7,10 @@ from dataclasses import fields
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
-from sqlalchemy import select
+from sqlalchemy import select, text, table, column
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from psycopg.types.json import Jsonb
 
 # ---------------------------------------------------------------------
 # Internal application imports
@@ -23,6 +24,10 @@ from infrastructure.persistence.postgresql.models.category_model import (
 
 class CategoryRepositoryPG(CategoryRepository):
 
+    # Rows per COPY + merge round in bulk_save
+    BULK_CHUNK_SIZE = 5_000
+    STAGING_TABLE = "categories_staging"
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -73,6 +78,47 @@ class CategoryRepositoryPG(CategoryRepository):
 
         return [self._to_entity(r) for r in results]
 
+    # -------------------------------------------------------------
+
+    def bulk_save(
+        self,
+        categories: list[Category],
+        chunk_size: int | None = None,
+    ) -> list[Category]:
+        """
+        Upsert large batches via COPY into a temp staging table, then a
+        single INSERT ... SELECT ... ON CONFLICT per chunk.
+
+        Avoids the bind-parameter limit of the multi-row VALUES insert.
+        Chunks are merged in input order, so parents listed before their
+        children are always inserted first.
+        """
+
+        if not categories:
+            return []
+
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+
+        # Same conflict key twice in one INSERT is an error; last one wins
+        unique = {(c.id, c.semantic_hash): c for c in categories}
+        rows = list(unique.values())
+
+        self.session.flush()
+        self._create_staging_table()
+
+        saved: list[Category] = []
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+
+            self.session.execute(text(f"TRUNCATE {self.STAGING_TABLE}"))
+            self._copy_to_staging(chunk)
+            saved.extend(self._merge_staging())
+
+        self.session.flush()
+
+        return saved
+
     # ============================================================
     # Queries
     # ============================================================
@@ -99,6 +145,68 @@ class CategoryRepositoryPG(CategoryRepository):
         results = self.session.execute(stmt).scalars().all()
         return self._to_entities(results)
 
+    # ============================================================
+    # Bulk helpers
+    # ============================================================
+
+    @staticmethod
+    def _columns() -> list[str]:
+        return [c.name for c in CategoryModel.__table__.columns]
+
+    # -------------------------------------------------------------
+
+    def _create_staging_table(self) -> None:
+        # Lives until the surrounding transaction ends
+        self.session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.STAGING_TABLE} "
+            f"(LIKE {CategoryModel.__tablename__} INCLUDING DEFAULTS) "
+            f"ON COMMIT DROP"
+        ))
+
+    # -------------------------------------------------------------
+
+    def _copy_to_staging(self, categories: list[Category]) -> None:
+
+        columns = self._columns()
+
+        # Raw psycopg connection bound to the session's transaction
+        connection = self.session.connection().connection.driver_connection
+
+        with connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY {self.STAGING_TABLE} ({', '.join(columns)}) FROM STDIN"
+            ) as copy:
+                for category in categories:
+                    row = self._build_row(category)
+                    row["keywords"] = Jsonb(list(row.get("keywords") or []))
+                    copy.write_row([row.get(name) for name in columns])
+
+    # -------------------------------------------------------------
+
+    def _merge_staging(self) -> list[Category]:
+
+        columns = self._columns()
+        staging = table(self.STAGING_TABLE, *[column(name) for name in columns])
+
+        stmt = insert(CategoryModel).from_select(
+            columns,
+            select(*[staging.c[name] for name in columns]),
+        )
+
+        stmt = (
+            stmt.on_conflict_do_update(
+                constraint="uq_categories_id_semantic_hash",
+                set_=self._build_update_map(stmt),
+            )
+            .returning(CategoryModel)
+        )
+
+        results = self.session.execute(
+            select(CategoryModel).from_statement(stmt)
+        ).scalars().all()
+
+        return self._to_entities(results)
+
     # ============================================================
     # Helpers
     # ============================================================
@@ -2,15 +2,19 @@
 # Standard library
 # ---------------------------------------------------------------------
 from uuid import UUID
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Sequence
+from datetime import timezone
 from dataclasses import fields
 
 # ---------------------------------------------------------------------
 # Third-party libraries
 # ---------------------------------------------------------------------
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy import select, values, column, cast, func, or_, and_, any_, all_, exists, true, text, table, Integer, String
+from sqlalchemy.dialects.postgresql import insert, ARRAY
+from sqlalchemy.orm import Session, aliased
+from pgvector.sqlalchemy import Vector
+from pgvector.psycopg import register_vector
 
 # ---------------------------------------------------------------------
 # Internal application imports
@@ -20,22 +24,42 @@ from application.ports.embedding_repository import EmbeddingRepository
 from infrastructure.persistence.postgresql.models.embedding_model import (
     EmbeddingModel,
 )
+from infrastructure.persistence.postgresql.vector_index import apply_search_settings
 
 
 class EmbeddingRepositoryPG(EmbeddingRepository):
 
     DEFAULT_BATCH_SIZE = 1000
 
+    # Rows per binary COPY + merge round in bulk_save
+    BULK_CHUNK_SIZE = 10_000
+    STAGING_TABLE = "embeddings_staging"
+
+    # Column order and PostgreSQL types for the binary COPY
+    _COPY_COLUMNS = ("id", "category_id", "vector", "content_hash", "dimension", "created_at")
+    _COPY_TYPES = ("uuid", "varchar", "vector", "varchar", "int4", "timestamptz")
+
     def __init__(
         self,
         session: Session,
         expected_dimension: int,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        iterative_scan: str | None = "relaxed_order",
     ):
         self.session = session
         self.expected_dimension = expected_dimension
         self.batch_size = batch_size
 
+        # Default ANN query settings (None = server default)
+        self.ef_search = ef_search
+        self.probes = probes
+
+        # Used by search_eligible only when the server has pgvector >= 0.8
+        self.iterative_scan = iterative_scan
+        self._pgvector_version: Tuple[int, ...] | None = None
+
     # ============================================================
     # Persistence
     # ============================================================
@@ -91,10 +115,60 @@ class EmbeddingRepositoryPG(EmbeddingRepository):
 
         self.session.flush()
 
+    # -------------------------------------------------------------
+
+    def bulk_save(self, embeddings: list[Embedding]) -> None:
+        """
+        Upsert large batches with a binary COPY into a temp staging table,
+        then merge on uq_embeddings_category_hash.
+
+        Vectors are packed into a float32 NumPy matrix and sent in pgvector's
+        binary format, skipping the per-float text serialization of the
+        INSERT path.
+        """
+
+        if not embeddings:
+            return
+
+        unique = {(e.category_id, e.content_hash): e for e in embeddings}
+        rows = list(unique.values())
+
+        self.session.flush()
+        self._create_staging_table()
+
+        # Raw psycopg connection bound to the session's transaction
+        connection = self.session.connection().connection.driver_connection
+        register_vector(connection)
+
+        for i in range(0, len(rows), self.BULK_CHUNK_SIZE):
+            chunk = rows[i : i + self.BULK_CHUNK_SIZE]
+
+            matrix = np.asarray([e.vector for e in chunk], dtype=np.float32)
+            if matrix.ndim != 2 or matrix.shape[1] != self.expected_dimension:
+                raise ValueError(
+                    f"Expected vectors of dimension {self.expected_dimension}, "
+                    f"got shape {matrix.shape}"
+                )
+
+            self.session.execute(text(f"TRUNCATE {self.STAGING_TABLE}"))
+            self._copy_to_staging(connection, chunk, matrix)
+            self._merge_staging()
+
+        self.session.flush()
+
     # ============================================================
     # Retrieval
     # ============================================================
 
+    def get_all(self) -> list[Embedding]:
+        stmt = select(EmbeddingModel)
+
+        results = self.session.execute(stmt).scalars().all()
+
+        return [self._to_entity(r) for r in results]
+
+    # -------------------------------------------------------------
+
     def get_by_category_id(self, category_id: UUID) -> Optional[Embedding]:
         stmt = select(EmbeddingModel).where(
             EmbeddingModel.category_id == category_id
@@ -150,7 +224,16 @@ class EmbeddingRepositoryPG(EmbeddingRepository):
         query_vector: list[float],
         category_ids: list[UUID],
         limit: int = 10,
+        ef_search: int | None = None,
+        probes: int | None = None,
     ) -> List[Tuple[Embedding, float]]:
+        """
+        Top-k embeddings by cosine similarity.
+
+        ef_search / probes tune the HNSW / IVFFlat index for this query
+        only (falling back to the repository defaults). Keep ef_search
+        >= limit, otherwise HNSW may return fewer rows.
+        """
 
         if not query_vector:
             raise ValueError("query_vector cannot be empty")
@@ -160,8 +243,16 @@ class EmbeddingRepositoryPG(EmbeddingRepository):
 
         self._validate_dimension(query_vector)
 
+        apply_search_settings(
+            self.session,
+            ef_search=ef_search or self.ef_search,
+            probes=probes or self.probes,
+        )
+
+        distance_expr = EmbeddingModel.vector.cosine_distance(query_vector)
+
         similarity_expr = (
-            (1.0 - EmbeddingModel.vector.cosine_distance(query_vector))
+            (1.0 - distance_expr)
             .label("similarity")
         )
 
@@ -174,7 +265,7 @@ class EmbeddingRepositoryPG(EmbeddingRepository):
 
         stmt = (
             stmt
-            .order_by(similarity_expr.desc())
+            .order_by(distance_expr)
             .limit(limit)
         )
 
@@ -188,6 +279,316 @@ class EmbeddingRepositoryPG(EmbeddingRepository):
 
         return results
 
+    # -------------------------------------------------------------
+
+    def search_similar_batch(
+        self,
+        query_vectors: Sequence[list[float]],
+        category_ids: Sequence[list[str] | None] | None = None,
+        limit: int = 10,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> List[List[Tuple[Embedding, float]]]:
+        """
+        Top-k search for N query vectors in a single statement.
+
+        Queries are sent as a VALUES list and each one is resolved by a
+        LATERAL subquery, so every query keeps its own ORDER BY ... LIMIT
+        (and can use the ANN index). category_ids[i] restricts query i;
+        None or an empty list means no filter.
+        """
+
+        if not query_vectors:
+            return []
+
+        if limit <= 0:
+            raise ValueError("limit must be > 0")
+
+        if category_ids is None:
+            category_ids = [None] * len(query_vectors)
+
+        if len(category_ids) != len(query_vectors):
+            raise ValueError("category_ids must have one entry per query vector")
+
+        for vector in query_vectors:
+            self._validate_dimension(vector)
+
+        apply_search_settings(
+            self.session,
+            ef_search=ef_search or self.ef_search,
+            probes=probes or self.probes,
+        )
+
+        queries = values(
+            column("ord", Integer),
+            column("query_vector", Vector(self.expected_dimension)),
+            column("category_ids", ARRAY(String)),
+            name="queries",
+        ).data([
+            (
+                i,
+                vector.tolist() if hasattr(vector, "tolist") else list(vector),
+                list(ids or []),
+            )
+            for i, (vector, ids) in enumerate(zip(query_vectors, category_ids))
+        ])
+
+        query_vector = cast(queries.c.query_vector, Vector(self.expected_dimension))
+        allowed_ids = cast(queries.c.category_ids, ARRAY(String))
+
+        distance_expr = EmbeddingModel.vector.cosine_distance(query_vector)
+
+        nearest = (
+            select(EmbeddingModel, (1.0 - distance_expr).label("similarity"))
+            .where(
+                or_(
+                    func.cardinality(allowed_ids) == 0,
+                    EmbeddingModel.category_id == any_(allowed_ids),
+                )
+            )
+            .order_by(distance_expr)
+            .limit(limit)
+            .lateral("nearest")
+        )
+
+        embedding = aliased(EmbeddingModel, nearest)
+
+        stmt = (
+            select(queries.c.ord, embedding, nearest.c.similarity)
+            .select_from(queries)
+            .join(nearest, true())
+            .order_by(queries.c.ord, nearest.c.similarity.desc())
+        )
+
+        results: List[List[Tuple[Embedding, float]]] = [[] for _ in query_vectors]
+
+        for ord_, model, similarity in self.session.execute(stmt).all():
+            score = max(0.0, min(1.0, float(similarity)))
+            results[ord_].append((self._to_entity(model), score))
+
+        return results
+
+    # -------------------------------------------------------------
+
+    def search_eligible(
+        self,
+        query_vector: list[float],
+        limit: int = 10,
+        allowed_ids: Sequence[str] | None = None,
+        excluded_ids: Sequence[str] | None = None,
+        ef_search: int | None = None,
+        iterative_scan: str | None = None,
+        max_scan_tuples: int | None = None,
+    ) -> List[Tuple[Embedding, float]]:
+        """
+        Top-k eligible categories, one row per category.
+
+        The allow list (None = every category), the exclusions and the
+        latest-embedding-per-category rule (as in NumpyCategoryIndex) are
+        applied inside the ANN query, so LIMIT counts distinct categories.
+
+        iterative_scan (default: the repository setting) keeps the HNSW
+        scan going until `limit` rows pass the filter; it is only applied
+        on pgvector >= 0.8. If the ANN query still returns fewer than
+        `limit` rows (older servers, selective filters), an exact query
+        over the filtered rows runs instead, so the result is always the
+        true top-k eligible set.
+        """
+
+        if not query_vector:
+            raise ValueError("query_vector cannot be empty")
+
+        if limit <= 0:
+            raise ValueError("limit must be > 0")
+
+        if allowed_ids is not None and not allowed_ids:
+            return []
+
+        self._validate_dimension(query_vector)
+
+        iterative_scan = iterative_scan or self.iterative_scan
+        if iterative_scan is not None and not self._supports_iterative_scan():
+            iterative_scan = None
+
+        apply_search_settings(
+            self.session,
+            ef_search=ef_search or self.ef_search,
+            iterative_scan=iterative_scan,
+            max_scan_tuples=max_scan_tuples if iterative_scan else None,
+        )
+
+        distance_expr = EmbeddingModel.vector.cosine_distance(query_vector)
+
+        stmt = (
+            select(EmbeddingModel, (1.0 - distance_expr).label("similarity"))
+            .where(*self._eligible_filters(EmbeddingModel, allowed_ids, excluded_ids))
+            .order_by(distance_expr)
+            .limit(limit)
+        )
+
+        rows = self.session.execute(stmt).all()
+
+        if len(rows) < limit:
+            rows = self._search_eligible_exact(query_vector, limit, allowed_ids, excluded_ids)
+
+        results = [
+            (self._to_entity(model), max(0.0, min(1.0, float(similarity))))
+            for model, similarity in rows
+        ]
+
+        # relaxed_order may return rows slightly out of order
+        results.sort(key=lambda pair: pair[1], reverse=True)
+        return results
+
+    # -------------------------------------------------------------
+
+    def _search_eligible_exact(
+        self,
+        query_vector: list[float],
+        limit: int,
+        allowed_ids: Sequence[str] | None,
+        excluded_ids: Sequence[str] | None,
+    ):
+        """
+        Exact top-k over the eligible rows. The MATERIALIZED CTE keeps the
+        planner from walking the ANN index, so no candidate is lost.
+        """
+
+        candidates = (
+            select(EmbeddingModel)
+            .where(*self._eligible_filters(EmbeddingModel, allowed_ids, excluded_ids))
+            .cte("eligible")
+            .prefix_with("MATERIALIZED")
+        )
+
+        embedding = aliased(EmbeddingModel, candidates)
+        distance_expr = embedding.vector.cosine_distance(query_vector)
+
+        stmt = (
+            select(embedding, (1.0 - distance_expr).label("similarity"))
+            .order_by(distance_expr)
+            .limit(limit)
+        )
+
+        return self.session.execute(stmt).all()
+
+    # -------------------------------------------------------------
+
+    @staticmethod
+    def _eligible_filters(
+        model,
+        allowed_ids: Sequence[str] | None,
+        excluded_ids: Sequence[str] | None,
+    ) -> list:
+
+        filters = []
+
+        if allowed_ids is not None:
+            filters.append(model.category_id == any_(cast(list(allowed_ids), ARRAY(String))))
+
+        if excluded_ids:
+            filters.append(model.category_id != all_(cast(list(excluded_ids), ARRAY(String))))
+
+        # One row per category: skip embeddings superseded by a newer one
+        newer = aliased(EmbeddingModel)
+
+        filters.append(
+            ~exists().where(
+                newer.category_id == model.category_id,
+                or_(
+                    newer.created_at > model.created_at,
+                    and_(
+                        newer.created_at == model.created_at,
+                        newer.id > model.id,
+                    ),
+                ),
+            )
+        )
+
+        return filters
+
+    # -------------------------------------------------------------
+
+    def _supports_iterative_scan(self) -> bool:
+        """hnsw.iterative_scan exists from pgvector 0.8; checked once per repository."""
+
+        if self._pgvector_version is None:
+            version = self.session.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            ).scalar()
+
+            self._pgvector_version = tuple(
+                int(part) for part in (version or "0").split(".") if part.isdigit()
+            )
+
+        return self._pgvector_version >= (0, 8)
+
+    # ============================================================
+    # Bulk Helpers
+    # ============================================================
+
+    def _create_staging_table(self) -> None:
+        # Lives until the surrounding transaction ends
+        self.session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.STAGING_TABLE} "
+            f"(LIKE {EmbeddingModel.__tablename__} INCLUDING DEFAULTS) "
+            f"ON COMMIT DROP"
+        ))
+
+    # -------------------------------------------------------------
+
+    def _copy_to_staging(
+        self,
+        connection,
+        embeddings: list[Embedding],
+        matrix: np.ndarray,
+    ) -> None:
+
+        dimension = matrix.shape[1]
+
+        with connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY {self.STAGING_TABLE} ({', '.join(self._COPY_COLUMNS)}) "
+                f"FROM STDIN WITH (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(list(self._COPY_TYPES))
+
+                for embedding, vector in zip(embeddings, matrix):
+                    created_at = embedding.created_at
+                    if created_at.tzinfo is None:
+                        created_at = created_at.replace(tzinfo=timezone.utc)
+
+                    copy.write_row((
+                        embedding.id,
+                        embedding.category_id,
+                        vector,
+                        embedding.content_hash,
+                        dimension,
+                        created_at,
+                    ))
+
+    # -------------------------------------------------------------
+
+    def _merge_staging(self) -> None:
+
+        columns = list(self._COPY_COLUMNS)
+        staging = table(self.STAGING_TABLE, *[column(name) for name in columns])
+
+        stmt = insert(EmbeddingModel).from_select(
+            columns,
+            select(*[staging.c[name] for name in columns]),
+        )
+
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_embeddings_category_hash",
+            set_={
+                "vector": stmt.excluded.vector,
+                "dimension": stmt.excluded.dimension,
+            },
+        )
+
+        self.session.execute(stmt)
+
     # ============================================================
     # Internal Helpers
     # ============================================================
@@ -229,7 +630,7 @@ class EmbeddingRepositoryPG(EmbeddingRepository):
 
     @staticmethod
     def _to_entity(model: EmbeddingModel) -> Embedding:
-        field_names = {f.name for f in fields(Embedding)}
+        field_names = {f.name for f in fields(Embedding) if f.init}
 
         return Embedding(
             **{field: getattr(model, field) for field in field_names}
@@ -0,0 +1,58 @@
+# ---------------------------------------------------------------------
+# Standard library
+# ---------------------------------------------------------------------
+from typing import Dict, Sequence, Set
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+from sqlalchemy import select, cast, any_, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from application.ports.exclusion_repository import ExclusionRepository
+from infrastructure.persistence.postgresql.models.product_category_exclusion import (
+    ProductCategoryExclusionModel,
+)
+
+
+class ExclusionRepositoryPG(ExclusionRepository):
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # ============================================================
+    # Queries
+    # ============================================================
+
+    def get_excluded_category_ids(self, sku: str) -> Set[str]:
+
+        stmt = select(ProductCategoryExclusionModel.category_id).where(
+            ProductCategoryExclusionModel.sku == sku
+        )
+
+        return set(self.session.execute(stmt).scalars().all())
+
+    # -------------------------------------------------------------
+
+    def get_excluded_category_ids_for_skus(self, skus: Sequence[str]) -> Dict[str, Set[str]]:
+
+        excluded: Dict[str, Set[str]] = {sku: set() for sku in skus}
+
+        if not excluded:
+            return excluded
+
+        stmt = select(
+            ProductCategoryExclusionModel.sku,
+            ProductCategoryExclusionModel.category_id,
+        ).where(
+            ProductCategoryExclusionModel.sku == any_(cast(list(excluded), ARRAY(String)))
+        )
+
+        for sku, category_id in self.session.execute(stmt).all():
+            excluded[sku].add(category_id)
+
+        return excluded
@@ -0,0 +1,268 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Any
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+from sqlalchemy import select, func, text
+from sqlalchemy.orm import Session
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+from infrastructure.persistence.postgresql.models.embedding_model import (
+    EmbeddingModel,
+)
+
+
+VECTOR_INDEX_METHODS = ("hnsw", "ivfflat")
+
+
+@dataclass(frozen=True)
+class VectorIndexConfig:
+    """
+    ANN index parameters for embeddings.vector.
+
+    - hnsw: m / ef_construction (build), hnsw.ef_search (query)
+    - ivfflat: lists (build), ivfflat.probes (query). Build it after
+      the table is loaded; lists ~ rows / 1000 is a good starting point.
+    """
+    method: str = "hnsw"
+    m: int = 16
+    ef_construction: int = 64
+    lists: int = 100
+
+    @property
+    def index_name(self) -> str:
+        return f"ix_embeddings_vector_{self.method}"
+
+
+HNSW_ITERATIVE_SCAN_MODES = ("off", "strict_order", "relaxed_order")
+
+
+def apply_search_settings(
+    session: Session,
+    ef_search: int | None = None,
+    probes: int | None = None,
+    iterative_scan: str | None = None,
+    max_scan_tuples: int | None = None,
+) -> None:
+    """
+    Set ANN query parameters for the current transaction only
+    (equivalent to SET LOCAL).
+
+    iterative_scan / max_scan_tuples need pgvector >= 0.8: with filtered
+    queries the HNSW scan keeps going until LIMIT rows pass the filter
+    (or max_scan_tuples are visited).
+    """
+    if ef_search is not None:
+        if ef_search <= 0:
+            raise ValueError("ef_search must be > 0")
+        session.execute(select(func.set_config("hnsw.ef_search", str(ef_search), True)))
+
+    if probes is not None:
+        if probes <= 0:
+            raise ValueError("probes must be > 0")
+        session.execute(select(func.set_config("ivfflat.probes", str(probes), True)))
+
+    if iterative_scan is not None:
+        if iterative_scan not in HNSW_ITERATIVE_SCAN_MODES:
+            raise ValueError(
+                f"Unsupported iterative_scan '{iterative_scan}'. "
+                f"Must be one of: {', '.join(HNSW_ITERATIVE_SCAN_MODES)}"
+            )
+        session.execute(select(func.set_config("hnsw.iterative_scan", iterative_scan, True)))
+
+    if max_scan_tuples is not None:
+        if max_scan_tuples <= 0:
+            raise ValueError("max_scan_tuples must be > 0")
+        session.execute(select(func.set_config("hnsw.max_scan_tuples", str(max_scan_tuples), True)))
+
+
+class VectorIndexManager:
+    """
+    Create, rebuild, drop and inspect the ANN index on embeddings.vector.
+
+    All statements run on the given session; callers commit.
+    """
+
+    TABLE = EmbeddingModel.__tablename__
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # ============================================================
+    # DDL
+    # ============================================================
+
+    def create(self, config: VectorIndexConfig = VectorIndexConfig()) -> str:
+        """Replace any existing ANN index with one built from config."""
+
+        if config.method not in VECTOR_INDEX_METHODS:
+            raise ValueError(
+                f"Unsupported index method '{config.method}'. "
+                f"Must be one of: {', '.join(VECTOR_INDEX_METHODS)}"
+            )
+
+        self.drop()
+
+        if config.method == "hnsw":
+            options = f"m = {int(config.m)}, ef_construction = {int(config.ef_construction)}"
+        else:
+            options = f"lists = {int(config.lists)}"
+
+        self.session.execute(text(
+            f"CREATE INDEX {config.index_name} ON {self.TABLE} "
+            f"USING {config.method} (vector vector_cosine_ops) "
+            f"WITH ({options})"
+        ))
+
+        return config.index_name
+
+    # -------------------------------------------------------------
+
+    def rebuild(self) -> List[str]:
+        """REINDEX every ANN index on the table."""
+
+        names = self.list_indexes()
+
+        for name in names:
+            self.session.execute(text(f"REINDEX INDEX {name}"))
+
+        return names
+
+    # -------------------------------------------------------------
+
+    def drop(self) -> List[str]:
+
+        names = self.list_indexes()
+
+        for name in names:
+            self.session.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        return names
+
+    # ============================================================
+    # Inspection
+    # ============================================================
+
+    def list_indexes(self) -> List[str]:
+        rows = self.session.execute(
+            text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = :table "
+                "AND indexdef ILIKE '%vector_cosine_ops%'"
+            ),
+            {"table": self.TABLE},
+        ).scalars().all()
+
+        return list(rows)
+
+    # -------------------------------------------------------------
+
+    def report(
+        self,
+        k: int = 10,
+        sample_size: int = 100,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Index sizes plus recall@k of ANN search against exact search,
+        using stored vectors as sample queries.
+        """
+
+        indexes = {
+            name: self.session.execute(
+                select(func.pg_relation_size(name))
+            ).scalar_one()
+            for name in self.list_indexes()
+        }
+
+        rows = self.session.execute(select(func.count()).select_from(EmbeddingModel)).scalar_one()
+
+        recall = self.measure_recall(
+            k=k,
+            sample_size=sample_size,
+            ef_search=ef_search,
+            probes=probes,
+        )
+
+        return {
+            "rows": rows,
+            "indexes": indexes,
+            **recall,
+        }
+
+    # -------------------------------------------------------------
+
+    def measure_recall(
+        self,
+        k: int = 10,
+        sample_size: int = 100,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> Dict[str, float]:
+
+        queries = self.session.execute(
+            select(EmbeddingModel.vector)
+            .order_by(func.random())
+            .limit(sample_size)
+        ).scalars().all()
+
+        if not queries:
+            return {"recall": 0.0, "ann_ms": 0.0, "exact_ms": 0.0, "samples": 0}
+
+        apply_search_settings(self.session, ef_search=ef_search, probes=probes)
+
+        hits = 0
+        relevant = 0
+        ann_time = 0.0
+        exact_time = 0.0
+
+        for query in queries:
+            start = time.perf_counter()
+            approx = self._top_ids(query, k)
+            ann_time += time.perf_counter() - start
+
+            self._set_exact(True)
+            try:
+                start = time.perf_counter()
+                exact = self._top_ids(query, k)
+                exact_time += time.perf_counter() - start
+            finally:
+                self._set_exact(False)
+
+            hits += len(set(approx) & set(exact))
+            relevant += len(exact)
+
+        return {
+            # Exact results may be fewer than k on small tables
+            "recall": hits / relevant if relevant else 0.0,
+            "ann_ms": 1000 * ann_time / len(queries),
+            "exact_ms": 1000 * exact_time / len(queries),
+            "samples": len(queries),
+        }
+
+    # ============================================================
+    # Helpers
+    # ============================================================
+
+    def _top_ids(self, query, k: int) -> List[Any]:
+        stmt = (
+            select(EmbeddingModel.id)
+            .order_by(EmbeddingModel.vector.cosine_distance(query))
+            .limit(k)
+        )
+        return list(self.session.execute(stmt).scalars().all())
+
+    # -------------------------------------------------------------
+
+    def _set_exact(self, exact: bool) -> None:
+        """Toggle index scans for the current transaction."""
+        value = "off" if exact else "on"
+        self.session.execute(select(func.set_config("enable_indexscan", value, True)))
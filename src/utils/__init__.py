@@ -1,13 +1,30 @@
-from .circuit_breaker import CircuitBreaker
+from .adaptive_batch import AdaptiveBatchSizer
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, get_circuit_breaker
 from .hash import compute_hash
 from .json import json_to_set, set_to_json
-from .retry import sync_exponential_backoff_retry_sync, async_exponential_backoff_retry_async
+from .rate_limiter import RateLimiter, TokenBucket, get_rate_limiter, estimate_tokens
+from .retry import (
+    RetryBudget,
+    get_retry_budget,
+    sync_exponential_backoff_retry_sync,
+    async_exponential_backoff_retry_async,
+)
 
 __all__ = [
+    "AdaptiveBatchSizer",
     "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "get_circuit_breaker",
     "compute_hash",
     "json_to_set",
     "set_to_json",
+    "RateLimiter",
+    "TokenBucket",
+    "get_rate_limiter",
+    "estimate_tokens",
+    "RetryBudget",
+    "get_retry_budget",
     "sync_exponential_backoff_retry_sync",
     "async_exponential_backoff_retry_async"
 ]
\ No newline at end of file
@@ -0,0 +1,61 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import threading
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+
+
+class AdaptiveBatchSizer:
+    """
+    AIMD batch sizing: halve on throttling, grow back by `step` after
+    `grow_after` consecutive successes.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int | None = None,
+        step: int = 8,
+        grow_after: int = 5,
+        decrease_factor: float = 0.5,
+    ):
+        if minimum <= 0 or initial < minimum:
+            raise ValueError("batch sizes must satisfy 0 < minimum <= initial")
+
+        self.minimum = minimum
+        self.maximum = maximum or initial
+        self.step = step
+        self.grow_after = grow_after
+        self.decrease_factor = decrease_factor
+
+        self._size = min(initial, self.maximum)
+        self._successes = 0
+        self._lock = threading.Lock()
+
+
+    @property
+    def current(self) -> int:
+        return self._size
+
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+
+            if self._successes >= self.grow_after:
+                self._size = min(self.maximum, self._size + self.step)
+                self._successes = 0
+
+
+    def record_throttle(self) -> None:
+        with self._lock:
+            self._size = max(self.minimum, int(self._size * self.decrease_factor))
+            self._successes = 0
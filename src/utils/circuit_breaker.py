@@ -2,7 +2,9 @@
 # Standard libraries
 # ---------------------------------------------------------------------
 import time
-from typing import Optional
+import threading
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
 
 # ---------------------------------------------------------------------
 # Third-party libraries
@@ -12,39 +14,240 @@ from typing import Optional
 # Internal application imports
 # ---------------------------------------------------------------------
 
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while the circuit is open."""
+    pass
+
 
 class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker.
+
+    - CLOSED: requests pass; `failure_threshold` consecutive failures open it.
+    - OPEN: requests are rejected until `reset_timeout` seconds have passed.
+    - HALF_OPEN: up to `half_open_max_calls` probes run concurrently; a probe
+      success closes the circuit, a probe failure re-opens it.
+
+    All state lives behind an internal lock that is never held across a
+    call or an await, so one instance is safe to share between threads and
+    coroutines. Callers should not add their own locking.
+
+    `clock` returns monotonic seconds; tests can inject a fake one.
+    """
 
     def __init__(
         self,
         failure_threshold: int = 5,
-        reset_timeout: float = 60.0
+        reset_timeout: float = 60.0,
+        half_open_max_calls: int = 1,
+        failure_on: Tuple[Type[BaseException], ...] = (Exception,),
+        clock: Callable[[], float] = time.monotonic,
     ):
+        if failure_threshold <= 0 or half_open_max_calls <= 0:
+            raise ValueError("failure_threshold and half_open_max_calls must be > 0")
+
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
-        self.failure_count = 0
-        self.opened_at: Optional[float] = None
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_on = failure_on
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+
+        self._counters = {
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    # ============================================================
+    # State
+    # ============================================================
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            return self._state
+
+
+    def is_open(self) -> bool:
+        return self.state is CircuitState.OPEN
+
+    # ============================================================
+    # Manual API
+    # ============================================================
+
+    def allow_request(self) -> bool:
+        """
+        Reserve a slot for one request. Every True must be followed by
+        exactly one record_success() or record_failure().
+        """
+        with self._lock:
+            self._maybe_half_open(self._clock())
+
+            if self._state is CircuitState.CLOSED:
+                return True
+
+            if (
+                self._state is CircuitState.HALF_OPEN
+                and self._probes_in_flight < self.half_open_max_calls
+            ):
+                self._probes_in_flight += 1
+                return True
+
+            self._counters["rejected"] += 1
+            return False
 
 
     def record_success(self) -> None:
-        self.failure_count = 0
-        self.opened_at = None
+        with self._lock:
+            self._counters["successes"] += 1
+            self._failure_count = 0
+
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._state = CircuitState.CLOSED
+                self._opened_at = None
 
 
     def record_failure(self) -> None:
-        self.failure_count += 1
+        with self._lock:
+            self._counters["failures"] += 1
 
-        if self.failure_count >= self.failure_threshold:
-            self.opened_at = time.monotonic()
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._open(self._clock())
+                return
 
+            self._failure_count += 1
+
+            if self._state is CircuitState.CLOSED and self._failure_count >= self.failure_threshold:
+                self._open(self._clock())
+
+    # ============================================================
+    # Wrapped calls
+    # ============================================================
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run fn through the breaker; raises CircuitOpenError when rejected."""
+
+        if not self.allow_request():
+            raise CircuitOpenError("Circuit breaker open")
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            self._record_exception(exc)
+            raise
+
+        self.record_success()
+        return result
+
+
+    async def call_async(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Async variant of call()."""
+
+        if not self.allow_request():
+            raise CircuitOpenError("Circuit breaker open")
+
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as exc:
+            self._record_exception(exc)
+            raise
+
+        self.record_success()
+        return result
+
+    # ============================================================
+    # Metrics
+    # ============================================================
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._failure_count,
+                "probes_in_flight": self._probes_in_flight,
+                **self._counters,
+            }
+
+    # ============================================================
+    # Internals (called with _lock held)
+    # ============================================================
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._failure_count = 0
+        self._counters["opened"] += 1
+
+
+    def _maybe_half_open(self, now: float) -> None:
+        if (
+            self._state is CircuitState.OPEN
+            and self._opened_at is not None
+            and now - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+
+
+    def _record_exception(self, exc: BaseException) -> None:
+        if isinstance(exc, self.failure_on):
+            self.record_failure()
+        elif isinstance(exc, Exception):
+            # The upstream answered (e.g. a validation error): not an outage
+            self.record_success()
+        else:
+            # Cancelled / interrupted: says nothing about the upstream
+            with self._lock:
+                if self._state is CircuitState.HALF_OPEN:
+                    self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+
+# ---------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs: Any) -> CircuitBreaker:
+    """
+    Return the breaker shared by every caller using `name` in this
+    process. The settings given by the first caller win.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+
+        if breaker is None:
+            breaker = CircuitBreaker(**kwargs)
+            _breakers[name] = breaker
+
+        return breaker
 
-    def is_open(self) -> bool:
 
-        if self.opened_at is not None:
-            elapsed = time.monotonic() - self.opened_at
-            if elapsed >= self.reset_timeout:
-                self.failure_count = 0
-                self.opened_at = None
-                return False
+def circuit_breaker_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics of every registered breaker, keyed by name."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
 
-        return self.failure_count >= self.failure_threshold
\ No newline at end of file
+    return {name: breaker.metrics() for name, breaker in breakers.items()}
@@ -0,0 +1,147 @@
+# ---------------------------------------------------------------------
+# Standard libraries
+# ---------------------------------------------------------------------
+import time
+import asyncio
+import threading
+from typing import Callable, Dict, Iterable
+
+# ---------------------------------------------------------------------
+# Third-party libraries
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Internal application imports
+# ---------------------------------------------------------------------
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    `reserve` deducts immediately (the balance may go negative) and
+    returns how long the caller must wait, so concurrent callers queue
+    up fairly instead of all waking at once. `clock` returns monotonic
+    seconds; tests can inject a fake one.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be > 0")
+
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+
+    def reserve(self, amount: float = 1.0) -> float:
+
+        # A single request larger than the bucket would never fit
+        amount = min(float(amount), self.capacity)
+
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+            self._updated_at = now
+
+            self._tokens -= amount
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.refill_per_second
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter.
+
+    Either limit may be None (unlimited).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0, clock)
+            if requests_per_minute else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0, clock)
+            if tokens_per_minute else None
+        )
+
+
+    def _reserve(self, tokens: int) -> float:
+        wait = 0.0
+
+        if self._requests is not None:
+            wait = max(wait, self._requests.reserve(1))
+
+        if self._tokens is not None and tokens > 0:
+            wait = max(wait, self._tokens.reserve(tokens))
+
+        return wait
+
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until the request may be sent. Returns the time waited."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+# ---------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+) -> RateLimiter:
+    """
+    Return the limiter shared by every caller using `name` in this
+    process. The limits given by the first caller win.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[name] = limiter
+
+        return limiter
+
+
+def estimate_tokens(texts: Iterable[str]) -> int:
+    """Rough token count (~4 characters per token)."""
+    return sum(len(t) // 4 + 1 for t in texts)
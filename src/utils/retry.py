@@ -3,12 +3,120 @@
 # ---------------------------------------------------------------------
 import time
 import random
-from typing import Callable, TypeVar, Tuple, Type, Awaitable
+import threading
+from typing import Callable, Dict, TypeVar, Tuple, Type, Awaitable
 import asyncio
 
 T = TypeVar("T")
 
 
+# ---------------------------------------------------------------------
+# Retry budget
+# ---------------------------------------------------------------------
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of requests.
+
+    Every request deposits `ratio` tokens (up to `max_tokens`); every retry
+    spends one. During an outage the balance drains and callers fail fast
+    instead of multiplying load on the upstream. `min_tokens` is the
+    starting balance, so low-traffic callers can still retry.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_tokens: float = 10.0,
+        max_tokens: float = 100.0,
+    ):
+        if ratio < 0 or min_tokens < 0 or max_tokens < min_tokens:
+            raise ValueError("expected ratio >= 0 and 0 <= min_tokens <= max_tokens")
+
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+
+        self._balance = float(min_tokens)
+        self._lock = threading.Lock()
+
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._balance = min(self.max_tokens, self._balance + self.ratio)
+
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                return True
+            return False
+
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+
+_budgets: Dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(name: str, **kwargs) -> RetryBudget:
+    """
+    Return the budget shared by every caller using `name` in this
+    process. The settings given by the first caller win.
+    """
+    with _budgets_lock:
+        budget = _budgets.get(name)
+
+        if budget is None:
+            budget = RetryBudget(**kwargs)
+            _budgets[name] = budget
+
+        return budget
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+
+def _backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+    delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+    return random.uniform(0, delay)
+
+
+def _should_retry(
+    exc: BaseException,
+    attempt: int,
+    attempts: int,
+    sleep_for: float,
+    deadline_at: float | None,
+    should_retry: Callable[[BaseException], bool] | None,
+    budget: RetryBudget | None,
+) -> bool:
+
+    if attempt >= attempts:
+        return False
+
+    if should_retry is not None and not should_retry(exc):
+        return False
+
+    # Sleeping past the deadline only delays the inevitable failure
+    if deadline_at is not None and time.monotonic() + sleep_for >= deadline_at:
+        return False
+
+    # Checked last: only spend budget on a retry that will happen
+    if budget is not None and not budget.try_acquire():
+        return False
+
+    return True
+
+
+# ---------------------------------------------------------------------
+# Retry loops
+# ---------------------------------------------------------------------
+
 async def async_exponential_backoff_retry_async(
     fn: Callable[[], Awaitable[T]],
     *,
@@ -16,26 +124,38 @@ async def async_exponential_backoff_retry_async(
     base_delay: float = 0.5,
     max_delay: float = 10.0,
     retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    deadline: float | None = None,
+    should_retry: Callable[[BaseException], bool] | None = None,
+    budget: RetryBudget | None = None,
 ) -> T:
+    """
+    Retry `fn` with full-jitter exponential backoff.
 
-    last_exc: BaseException | None = None
+    deadline: total seconds allowed from the first attempt; no retry is
+        scheduled that would start after it.
+    should_retry: extra classification hook, consulted for exceptions that
+        match `retry_on`.
+    budget: shared RetryBudget; when exhausted, errors are raised at once.
+    """
+
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+    if budget is not None:
+        budget.record_request()
 
     for attempt in range(1, attempts + 1):
         try:
             return await fn()
 
         except retry_on as exc:
-            last_exc = exc
+            sleep_for = _backoff(attempt, base_delay, max_delay)
 
-            if attempt == attempts:
+            if not _should_retry(exc, attempt, attempts, sleep_for, deadline_at, should_retry, budget):
                 raise
 
-            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
-            sleep_for = random.uniform(0, delay)
-
             await asyncio.sleep(sleep_for)
 
-    raise RuntimeError("Retry failed unexpectedly") from last_exc
+    raise RuntimeError("Retry failed unexpectedly")
 
 
 def sync_exponential_backoff_retry_sync(
@@ -45,24 +165,28 @@ def sync_exponential_backoff_retry_sync(
     base_delay: float = 0.5,
     max_delay: float = 10.0,
     retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    deadline: float | None = None,
+    should_retry: Callable[[BaseException], bool] | None = None,
+    budget: RetryBudget | None = None,
 ) -> T:
+    """Blocking variant of async_exponential_backoff_retry_async."""
 
-    last_exc: BaseException | None = None
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+    if budget is not None:
+        budget.record_request()
 
     for attempt in range(1, attempts + 1):
         try:
             return fn()
 
         except retry_on as exc:
-            last_exc = exc
+            sleep_for = _backoff(attempt, base_delay, max_delay)
 
-            if attempt == attempts:
+            if not _should_retry(exc, attempt, attempts, sleep_for, deadline_at, should_retry, budget):
                 raise
 
-            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
-            sleep_for = random.uniform(0, delay)
-
             time.sleep(sleep_for)
 
     # Should never reach here
-    raise RuntimeError("Retry failed unexpectedly") from last_exc
+    raise RuntimeError("Retry failed unexpectedly")
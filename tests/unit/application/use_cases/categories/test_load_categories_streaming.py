@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import pytest
+
+from application.use_cases.categories.load_categories import (
+    LoadCategoriesCommand,
+    LoadCategoriesUseCase,
+)
+
+
+@dataclass(frozen=True)
+class StubCategory:
+    id: str
+    parent_id: str | None = None
+    keywords_json: Tuple[str, ...] = ()
+
+
+class StubParser:
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+
+
+    def stream_workbook(self, file_path):
+        for sheet_name, categories in self.sheets.items():
+            yield sheet_name, iter(categories)
+
+
+class RecordingRepository:
+
+    def __init__(self):
+        self.saved = []
+
+
+    def save_batch(self, categories):
+        self.saved.append(list(categories))
+        return list(categories)
+
+
+    def bulk_save(self, categories):
+        return self.save_batch(categories)
+
+
+class StubSession:
+
+    def commit(self):
+        pass
+
+
+    def rollback(self):
+        pass
+
+
+def run(sheets, chunk_size=2):
+    repository = RecordingRepository()
+    use_case = LoadCategoriesUseCase(StubSession(), repository, sheet_parser=StubParser(sheets))
+
+    result = use_case.execute(
+        LoadCategoriesCommand(file_path="unused.xlsx", streaming=True, chunk_size=chunk_size)
+    )
+    return result, repository
+
+
+def test_parents_from_earlier_chunks_are_accepted():
+    sheet = [
+        StubCategory("1"),
+        StubCategory("2"),
+        StubCategory("3", parent_id="1"),
+        StubCategory("4", parent_id="3"),
+    ]
+
+    result, repository = run({"S": sheet})
+
+    assert len(repository.saved) == 2
+    assert [c.id for c in result["S"]["categories"]] == ["1", "2", "3", "4"]
+
+
+def test_missing_parent_fails_like_the_non_streaming_path():
+    sheet = [StubCategory("1"), StubCategory("2", parent_id="missing")]
+
+    with pytest.raises(ValueError, match="Missing parent missing"):
+        run({"S": sheet})
+
+
+def test_duplicates_across_chunks_appear_once_with_the_last_row():
+    first = StubCategory("1", keywords_json=("old",))
+    last = StubCategory("1", keywords_json=("new",))
+
+    result, _ = run({"S": [first, StubCategory("2"), last]})
+
+    assert result["S"]["categories"] == [StubCategory("2"), last]
@@ -0,0 +1,109 @@
+import pandas as pd
+
+from application.use_cases.categories.sheet_parser import CategorySheetParser, SheetLayout
+
+
+HEADER = ["Level 1", "Level 2", "Level 3", "CatID", "Meta", "Descripcion", "URL"]
+
+
+class RecordingParser(CategorySheetParser):
+    """Records the resolved fields instead of building Category entities."""
+
+    def _build_category(self, row, present, layout, cat_id, name, level, parent_id):
+        url = next((row[i] for i in layout.url if i < len(row) and present[i]), None)
+        return (cat_id, name, level, parent_id, url)
+
+
+def parse_frame(rows, header=HEADER):
+    df = pd.DataFrame(rows, columns=header)
+    return RecordingParser().parse_frame(df, SheetLayout.from_header(df.columns))
+
+
+def parse_streaming(rows, header=HEADER):
+    return list(RecordingParser().iter_rows([tuple(header), *map(tuple, rows)]))
+
+
+def test_catid_is_the_same_for_frame_and_streaming():
+    rows = [
+        ["Ropa", None, None, 10, None, None, "https://x/10"],
+        [None, "Camisas", None, 11, None, None, "https://x/11"],
+        [None, "Sin id", None, None, None, None, "https://x/none"],
+        [None, None, "Polos", 12, None, None, "https://x/12"],
+    ]
+
+    frame = parse_frame(rows)
+
+    # The blank CatID makes pandas read the column as float64
+    assert pd.DataFrame(rows, columns=HEADER)["CatID"].dtype == "float64"
+
+    assert [c[0] for c in frame] == ["10", "11", "12"]
+    assert frame == parse_streaming(rows)
+
+
+def test_non_integral_and_text_ids_are_kept():
+    rows = [
+        ["Ropa", None, None, "A-1", None, None, "u"],
+        [None, "Camisas", None, 1.5, None, None, "u"],
+    ]
+
+    assert [c[0] for c in parse_frame(rows)] == ["A-1", "1.5"]
+    assert [c[0] for c in parse_streaming(rows)] == ["A-1", "1.5"]
+
+
+def baseline_row_loop(rows, header=HEADER):
+    """The pre-vectorization loop: one iterrows() pass with a dict per row."""
+
+    df = pd.DataFrame(rows, columns=header)
+    last_inserted = {}
+    parsed = []
+
+    def find(row_dict, keyword):
+        return next((k for k in row_dict if keyword in k.lower()), None)
+
+    for _, row in df.iterrows():
+        row_dict = {str(k).strip(): v for k, v in row.to_dict().items() if pd.notna(v)}
+
+        level_key, id_key = find(row_dict, "level"), find(row_dict, "catid")
+        if not level_key or not id_key:
+            continue
+
+        level = int(level_key.split()[-1])
+        name = str(row_dict[level_key]).strip()
+        cat_id = str(row_dict[id_key]).strip()
+
+        if not name or not cat_id:
+            continue
+
+        parent_id = last_inserted.get(level - 1)
+        last_inserted[level] = cat_id
+
+        url_key = find(row_dict, "url")
+        parsed.append((cat_id, name, level, parent_id, row_dict.get(url_key) if url_key else None))
+
+    return parsed
+
+
+def test_parse_frame_matches_the_baseline_row_loop():
+    header = ["Level 1", "Level 2", "Level 3", "CatID", "Meta", "URL", "URL Alterna"]
+    rows = [
+        ["Ropa", None, None, "1", "m", "https://x/1", None],
+        [None, "Camisas", None, "2", None, None, "https://alt/2"],
+        [None, None, "Polos", "3", None, "https://x/3", "https://alt/3"],
+        [None, None, "Sin id", None, None, "https://x/none", None],
+        [None, None, None, "4", None, "https://x/4", None],
+        [None, "   ", None, "5", None, None, None],
+        [None, "Pantalones", None, "6", None, None, None],
+        [None, None, "Jeans", "7", None, "https://x/7", None],
+        ["Hogar", None, None, "8", None, None, None],
+        # Stale parent: the last level-2 row is still "Pantalones"
+        [None, None, "Toallas", "9", None, None, None],
+        # Two level columns filled: the first one wins
+        [None, "Cocina", "Ollas", "10", None, None, None],
+        [None, None, "Sartenes", " 11 ", None, None, None],
+    ]
+
+    expected = baseline_row_loop(rows, header)
+
+    assert [c[0] for c in expected] == ["1", "2", "3", "6", "7", "8", "9", "10", "11"]
+    assert parse_frame(rows, header) == expected
+    assert parse_streaming(rows, header) == expected
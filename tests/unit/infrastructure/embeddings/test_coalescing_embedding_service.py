@@ -0,0 +1,159 @@
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from application.ports.embedding_service import EmbeddingService
+from infrastructure.embeddings.coalescing_embedding_service import CoalescingEmbeddingService
+
+
+class RecordingService(EmbeddingService):
+    """Embeds a text as [len(text)] and records every batch it receives."""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+
+    def generate(self, text):
+        return self.generate_batch([text])[0]
+
+
+    def generate_batch(self, texts):
+        self.batches.append(list(texts))
+        self.release.wait(timeout=5)
+        time.sleep(self.delay)
+
+        if self.error is not None:
+            raise self.error
+
+        return [[float(len(t))] for t in texts]
+
+
+def test_concurrent_calls_are_flushed_as_batches():
+    inner = RecordingService(delay=0.02)
+    service = CoalescingEmbeddingService(inner, max_batch_size=16, max_wait_ms=20)
+
+    texts = ["x" * i for i in range(64)]
+
+    with ThreadPoolExecutor(64) as pool:
+        vectors = list(pool.map(service.generate, texts))
+
+    service.close()
+
+    assert vectors == [[float(i)] for i in range(64)]
+    assert len(inner.batches) < len(texts)
+    assert all(len(batch) <= 16 for batch in inner.batches)
+    assert service.stats()["texts"] == 64
+
+
+def test_single_call_is_flushed_after_the_window():
+    inner = RecordingService()
+    service = CoalescingEmbeddingService(inner, max_wait_ms=5)
+
+    assert service.generate("abc") == [3.0]
+    assert inner.batches == [["abc"]]
+
+    service.close()
+
+
+def test_identical_texts_are_embedded_once():
+    inner = RecordingService()
+    service = CoalescingEmbeddingService(inner, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(*(service.agenerate("same") for _ in range(5)))
+
+    assert asyncio.run(run()) == [[4.0]] * 5
+    assert inner.batches == [["same"]]
+
+    service.close()
+
+
+def test_inner_error_is_raised_to_every_caller():
+    inner = RecordingService(error=ValueError("boom"))
+    service = CoalescingEmbeddingService(inner, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(
+            service.agenerate("a"),
+            service.agenerate("b"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert len(inner.batches) == 1
+    assert all(isinstance(r, ValueError) for r in results)
+
+    service.close()
+
+
+def test_short_inner_result_fails_instead_of_hanging():
+
+    class ShortService(RecordingService):
+        def generate_batch(self, texts):
+            return super().generate_batch(texts)[:-1]
+
+    service = CoalescingEmbeddingService(ShortService(), max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(
+            service.agenerate("a"),
+            service.agenerate("bb"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    service.close()
+
+
+def test_cancelled_caller_does_not_block_the_rest_of_the_batch():
+    inner = RecordingService()
+    inner.release.clear()
+    service = CoalescingEmbeddingService(inner, max_wait_ms=20)
+
+    async def run():
+        cancelled = asyncio.ensure_future(service.agenerate("a"))
+        kept = asyncio.ensure_future(service.agenerate("bb"))
+
+        # Both are in the same window; cancel one while the batch is in flight
+        while not inner.batches:
+            await asyncio.sleep(0.005)
+
+        cancelled.cancel()
+        inner.release.set()
+
+        return await asyncio.wait_for(kept, timeout=5)
+
+    assert asyncio.run(run()) == [2.0]
+
+    service.close()
+
+
+def test_generate_after_close_raises():
+    service = CoalescingEmbeddingService(RecordingService())
+
+    assert service.generate("a") == [1.0]
+    service.close()
+
+    with pytest.raises(RuntimeError):
+        service.generate("a")
+
+
+def test_close_flushes_pending_texts():
+    inner = RecordingService()
+    service = CoalescingEmbeddingService(inner, max_wait_ms=1000)
+
+    future = service._submit("abcd")
+    service.close()
+
+    assert future.result(timeout=5) == [4.0]
@@ -0,0 +1,129 @@
+from itertools import product
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from infrastructure.index.bitmap_eligibility_index import BitmapEligibilityIndex
+
+
+GENDERS = ["Hombre", "Mujer", "Unisex"]
+BUSINESSES = ["Liverpool", "Suburbia"]
+
+
+def make_profile(category_id, genders=(), businesses=()):
+    return SimpleNamespace(
+        category=SimpleNamespace(id=category_id),
+        constraints=SimpleNamespace(
+            allowed_genders=set(genders),
+            allowed_business_types=set(businesses),
+        ),
+    )
+
+
+def brute_force(profiles, category_ids, gender, business_type, excluded=()):
+    """CategoryEligibilityPolicy applied row by row."""
+
+    by_id = {p.category.id: p for p in profiles}
+    mask = []
+
+    for cid in category_ids:
+        profile = by_id.get(cid)
+        c = profile.constraints if profile else None
+
+        mask.append(
+            profile is not None
+            and cid not in excluded
+            and (not c.allowed_genders or gender in c.allowed_genders)
+            and (not c.allowed_business_types or business_type in c.allowed_business_types)
+        )
+
+    return np.asarray(mask, dtype=bool)
+
+
+@pytest.fixture
+def profiles():
+    rng = np.random.default_rng(0)
+    profiles = []
+
+    for i in range(40):
+        genders = [g for g in GENDERS if rng.random() < 0.4]
+        businesses = [b for b in BUSINESSES if rng.random() < 0.5]
+        profiles.append(make_profile(f"cat-{i}", genders, businesses))
+
+    # Categories outside the index are ignored
+    profiles.append(make_profile("not-indexed", ["Mujer"]))
+
+    return profiles
+
+
+@pytest.fixture
+def category_ids():
+    # cat-40..41 have no profile and are never eligible
+    return [f"cat-{i}" for i in range(42)]
+
+
+@pytest.fixture
+def index(profiles, category_ids):
+    index = BitmapEligibilityIndex()
+    index.build(profiles, category_ids)
+    return index
+
+
+def test_masks_match_policy_for_every_context(index, profiles, category_ids):
+    assert index.is_built()
+    assert index.category_ids() == category_ids
+
+    for gender, business in product(GENDERS + ["Otro"], BUSINESSES + ["Otro"]):
+        np.testing.assert_array_equal(
+            index.mask_for(gender, business),
+            brute_force(profiles, category_ids, gender, business),
+        )
+
+
+def test_unconstrained_rows_are_eligible_for_any_context():
+    index = BitmapEligibilityIndex()
+    index.build(
+        [make_profile("free"), make_profile("women", ["Mujer"], ["Liverpool"])],
+        ["free", "women"],
+    )
+
+    assert index.mask_for("Hombre", "Suburbia").tolist() == [True, False]
+    assert index.mask_for("Mujer", "Liverpool").tolist() == [True, True]
+
+
+def test_excluded_ids_are_cleared_on_a_copy(index, profiles, category_ids):
+    excluded = {"cat-0", "cat-5", "cat-9", "unknown"}
+
+    first = index.mask_for("Mujer", "Liverpool", excluded_ids=excluded)
+
+    np.testing.assert_array_equal(
+        first,
+        brute_force(profiles, category_ids, "Mujer", "Liverpool", excluded),
+    )
+
+    # The memoized mask is not changed by exclusions or by the caller
+    first[:] = False
+    np.testing.assert_array_equal(
+        index.mask_for("Mujer", "Liverpool"),
+        brute_force(profiles, category_ids, "Mujer", "Liverpool"),
+    )
+
+
+def test_empty_mask(index, category_ids):
+    mask = index.mask_for("Mujer", "Liverpool", excluded_ids=category_ids)
+
+    assert index.is_empty(mask)
+    assert not index.is_empty(index.mask_for("Mujer", "Liverpool"))
+
+
+def test_rebuild_follows_new_row_order(index, profiles, category_ids):
+    index.mask_for("Hombre", "Liverpool")
+
+    reordered = list(reversed(category_ids))
+    index.build(profiles, reordered)
+
+    np.testing.assert_array_equal(
+        index.mask_for("Hombre", "Liverpool"),
+        brute_force(profiles, reordered, "Hombre", "Liverpool"),
+    )
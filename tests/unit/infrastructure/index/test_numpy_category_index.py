@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from domain.entities.embeddings.embedding import Embedding
+from infrastructure.index.numpy_category_index import NumpyCategoryIndex
+
+
+DIM = 8
+T0 = datetime(2024, 1, 1)
+
+
+def make_embeddings(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        Embedding.create(
+            category_id=f"cat-{i}",
+            vector=rng.normal(size=DIM).tolist(),
+            content_hash=f"h{i}",
+            created_at=T0,
+        )
+        for i in range(n)
+    ]
+
+
+def brute_force(embeddings, query, top_k, allowed=None):
+    """Cosine score every eligible category and sort, no numpy tricks."""
+
+    def cosine(a, b):
+        a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+        return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+    scored = [
+        (emb.category_id, cosine(emb.vector, query))
+        for emb in embeddings
+        if allowed is None or emb.category_id in allowed
+    ]
+    scored.sort(key=lambda pair: -pair[1])
+
+    return scored[:top_k]
+
+
+def assert_same_ranking(result, expected):
+    assert [cid for cid, _ in result] == [cid for cid, _ in expected]
+    for (_, score), (_, ref) in zip(result, expected):
+        assert score == pytest.approx(max(0.0, min(1.0, ref)), abs=1e-5)
+
+
+@pytest.fixture
+def embeddings():
+    return make_embeddings(50)
+
+
+@pytest.fixture
+def index(embeddings):
+    index = NumpyCategoryIndex(expected_dimension=DIM)
+    index.load(embeddings)
+    return index
+
+
+@pytest.mark.parametrize("top_k", [1, 5, 50, 80])
+def test_search_matches_brute_force_order(index, embeddings, top_k):
+    rng = np.random.default_rng(1)
+
+    for _ in range(10):
+        query = rng.normal(size=DIM)
+        assert_same_ranking(
+            index.search(query, top_k=top_k),
+            brute_force(embeddings, query, top_k),
+        )
+
+
+def test_mask_limits_search_to_allowed_ids(index, embeddings):
+    allowed = {"cat-3", "cat-7", "cat-11", "cat-40", "unknown"}
+    mask = index.mask_for(allowed)
+
+    assert mask.dtype == bool
+    assert mask.sum() == 4
+
+    query = np.random.default_rng(2).normal(size=DIM)
+
+    assert_same_ranking(
+        index.search(query, top_k=10, mask=mask),
+        brute_force(embeddings, query, 10, allowed=allowed),
+    )
+
+
+def test_mask_with_excluded_ids_cleared(index, embeddings):
+    excluded = {"cat-0", "cat-1", "cat-2"}
+    mask = index.mask_for(cid for cid in index.category_ids() if cid not in excluded)
+
+    query = np.asarray(embeddings[1].vector)
+    result = index.search(query, top_k=5, mask=mask)
+
+    assert not excluded & {cid for cid, _ in result}
+    assert_same_ranking(
+        result,
+        brute_force(embeddings, query, 5, allowed=set(index.category_ids()) - excluded),
+    )
+
+
+def test_empty_mask_returns_no_results(index):
+    mask = index.mask_for([])
+    query = np.ones(DIM)
+
+    assert index.search(query, top_k=5, mask=mask) == []
+    assert index.search_batch([query, -query], top_k=5, masks=[mask, mask]) == [[], []]
+
+
+def test_latest_embedding_per_category_wins():
+    old = Embedding.create(category_id="a", vector=[1.0, 0.0], content_hash="old", created_at=T0)
+    new = Embedding.create(
+        category_id="a", vector=[0.0, 1.0], content_hash="new", created_at=T0 + timedelta(days=1)
+    )
+    other = Embedding.create(category_id="b", vector=[1.0, 1.0], content_hash="b", created_at=T0)
+
+    index = NumpyCategoryIndex()
+    index.load([new, other, old])
+
+    assert len(index) == 2
+    assert sorted(index.category_ids()) == ["a", "b"]
+    assert index.search([0.0, 1.0], top_k=1) == [("a", pytest.approx(1.0))]
+
+
+def test_search_batch_matches_search(index):
+    rng = np.random.default_rng(3)
+    queries = rng.normal(size=(6, DIM))
+
+    masks = [
+        index.mask_for(rng.choice(index.category_ids(), size=size, replace=False))
+        for size in (0, 1, 3, 10, 30, 50)
+    ]
+
+    unmasked = index.search_batch(queries, top_k=7)
+    masked = index.search_batch(queries, top_k=7, masks=masks)
+
+    for query, mask, plain, filtered in zip(queries, masks, unmasked, masked):
+        assert_same_ranking(plain, index.search(query, top_k=7))
+        assert_same_ranking(filtered, index.search(query, top_k=7, mask=mask))
+
+
+def test_dimension_mismatch_raises():
+    index = NumpyCategoryIndex(expected_dimension=DIM)
+
+    with pytest.raises(ValueError):
+        index.load(make_embeddings(3)[:1] + [
+            Embedding.create(category_id="x", vector=[1.0, 2.0], content_hash="x")
+        ])
+
+    index.load(make_embeddings(3))
+
+    with pytest.raises(ValueError):
+        index.search([1.0, 2.0])
@@ -0,0 +1,194 @@
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from infrastructure.llm.cache import (
+    InMemoryLLMCache,
+    SQLiteLLMCache,
+    TieredLLMCache,
+    build_cache_key,
+)
+from infrastructure.llm.cache import memory, sqlite
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1_000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(memory, "time", SimpleNamespace(time=clock.time))
+    monkeypatch.setattr(sqlite, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def store(tmp_path):
+    cache = SQLiteLLMCache(path=str(tmp_path / "llm.sqlite3"), max_entries=3, ttl_seconds=60)
+    yield cache
+    cache.close()
+
+
+# ---------------------------------------------------------------------
+# In-memory LRU
+# ---------------------------------------------------------------------
+
+def test_memory_evicts_least_recently_used(clock):
+    cache = InMemoryLLMCache(max_entries=2)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert len(cache) == 2
+
+
+def test_memory_ttl_expiry(clock):
+    cache = InMemoryLLMCache(ttl_seconds=10)
+    cache.set("a", "1")
+
+    clock.advance(10)
+    assert cache.get("a") == "1"
+
+    clock.advance(0.1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+# ---------------------------------------------------------------------
+# SQLite
+# ---------------------------------------------------------------------
+
+def test_sqlite_ttl_expiry(clock, store):
+    store.set("a", "1")
+
+    clock.advance(60)
+    assert store.get("a") == "1"
+
+    clock.advance(0.1)
+    assert store.get("a") is None
+
+
+def test_sqlite_evicts_least_recently_used(clock, store):
+    for key in "abc":
+        store.set(key, key.upper())
+        clock.advance(1)
+
+    assert store.get("a") == "A"
+    clock.advance(1)
+
+    store.set("d", "D")
+
+    assert store.get("b") is None
+    assert [store.get(key) for key in "acd"] == ["A", "C", "D"]
+
+
+def test_sqlite_survives_reopening(clock, tmp_path):
+    path = str(tmp_path / "llm.sqlite3")
+
+    first = SQLiteLLMCache(path=path)
+    first.set("a", "1")
+    first.close()
+
+    second = SQLiteLLMCache(path=path)
+    assert second.get("a") == "1"
+    second.close()
+
+
+# ---------------------------------------------------------------------
+# Tiered
+# ---------------------------------------------------------------------
+
+def test_tiered_promotes_store_hits_to_memory(clock, store):
+    memory_cache = InMemoryLLMCache()
+    cache = TieredLLMCache(memory=memory_cache, store=store)
+
+    store.set("a", "1")
+    assert memory_cache.get("a") is None
+
+    assert cache.get("a") == "1"
+    assert memory_cache.get("a") == "1"
+
+    # Served from memory even once the store has dropped it
+    store.clear()
+    assert cache.get("a") == "1"
+
+
+def test_tiered_writes_and_clears_both_tiers(clock, store):
+    memory_cache = InMemoryLLMCache()
+    cache = TieredLLMCache(memory=memory_cache, store=store)
+
+    cache.set("a", "1")
+    assert memory_cache.get("a") == "1"
+    assert store.get("a") == "1"
+
+    cache.clear()
+    assert cache.get("a") is None
+    assert store.get("a") is None
+
+
+# ---------------------------------------------------------------------
+# Cache keys
+# ---------------------------------------------------------------------
+
+class Category(BaseModel):
+    name: str
+    level: int
+
+
+class SchemaNode(BaseModel):
+    type: str
+    description: str | None = None
+
+
+def test_key_is_stable_for_equal_inputs():
+    config = {"temperature": 0.0, "top_p": None, "mime_type": "application/json"}
+
+    first = build_cache_key("m", "sys", "user", Category, config)
+    second = build_cache_key("m", "sys", "user", Category, dict(reversed(config.items())))
+
+    assert first == second
+    assert first == build_cache_key("m", "sys", "user", Category, {
+        "temperature": 0.0, "mime_type": "application/json",
+    })
+
+
+@pytest.mark.parametrize("change", [
+    {"model": "other"},
+    {"system": "other"},
+    {"user": "other"},
+    {"schema": SchemaNode},
+    {"config": {"temperature": 0.5}},
+])
+def test_key_changes_with_every_input(change):
+    base = {"model": "m", "system": "sys", "user": "user", "schema": Category, "config": {}}
+
+    assert build_cache_key(**base) != build_cache_key(**{**base, **change})
+
+
+def test_schema_instances_are_keyed_by_their_values():
+    string = build_cache_key("m", "", "u", SchemaNode(type="STRING"))
+    same = build_cache_key("m", "", "u", SchemaNode(type="STRING"))
+    array = build_cache_key("m", "", "u", SchemaNode(type="ARRAY"))
+    described = build_cache_key("m", "", "u", SchemaNode(type="STRING", description="x"))
+
+    assert string == same
+    assert len({string, array, described}) == 3
+
+    # The class is keyed by its JSON schema, not by any instance
+    assert build_cache_key("m", "", "u", SchemaNode) not in {string, array, described}
@@ -0,0 +1,61 @@
+import pytest
+
+from utils.adaptive_batch import AdaptiveBatchSizer
+
+
+def test_throttle_halves_down_to_minimum():
+    sizer = AdaptiveBatchSizer(initial=64, minimum=5)
+
+    sizes = []
+    for _ in range(6):
+        sizer.record_throttle()
+        sizes.append(sizer.current)
+
+    assert sizes == [32, 16, 8, 5, 5, 5]
+
+
+def test_grows_by_step_after_consecutive_successes_up_to_maximum():
+    sizer = AdaptiveBatchSizer(initial=16, minimum=1, maximum=40, step=8, grow_after=3)
+    sizer.record_throttle()
+    assert sizer.current == 8
+
+    sizes = []
+    for _ in range(15):
+        sizer.record_success()
+        sizes.append(sizer.current)
+
+    assert sizes == [8, 8, 16, 16, 16, 24, 24, 24, 32, 32, 32, 40, 40, 40, 40]
+
+
+def test_throttle_resets_the_success_streak():
+    sizer = AdaptiveBatchSizer(initial=32, maximum=64, step=8, grow_after=3)
+
+    sizer.record_success()
+    sizer.record_success()
+    sizer.record_throttle()
+    sizer.record_success()
+    sizer.record_success()
+
+    assert sizer.current == 16
+
+    sizer.record_success()
+    assert sizer.current == 24
+
+
+def test_maximum_defaults_to_initial():
+    sizer = AdaptiveBatchSizer(initial=10, grow_after=1)
+
+    for _ in range(5):
+        sizer.record_success()
+
+    assert sizer.current == 10
+
+
+def test_initial_is_clamped_to_maximum():
+    assert AdaptiveBatchSizer(initial=100, maximum=50).current == 50
+
+
+@pytest.mark.parametrize("initial, minimum", [(4, 0), (2, 3)])
+def test_invalid_bounds_raise(initial, minimum):
+    with pytest.raises(ValueError):
+        AdaptiveBatchSizer(initial=initial, minimum=minimum)
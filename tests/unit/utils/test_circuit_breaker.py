@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+
+from utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breaker,
+)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def fail():
+    raise ConnectionError("down")
+
+
+def make_breaker(**kwargs):
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=3,
+        reset_timeout=10.0,
+        clock=clock,
+        **kwargs,
+    )
+    return breaker, clock
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+
+def test_opens_after_consecutive_failures():
+    breaker, _ = make_breaker()
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+    assert breaker.state is CircuitState.CLOSED
+
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+
+    assert breaker.metrics()["rejected"] == 1
+
+
+def test_success_resets_the_failure_count():
+    breaker, _ = make_breaker()
+
+    for _ in range(5):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+        breaker.call(lambda: "ok")
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_success_closes():
+    breaker, clock = make_breaker()
+    trip(breaker)
+
+    clock.advance(9.9)
+    assert breaker.state is CircuitState.OPEN
+
+    clock.advance(0.1)
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_failure_reopens_for_a_full_timeout():
+    breaker, clock = make_breaker()
+    trip(breaker)
+
+    clock.advance(10.0)
+
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.metrics()["opened"] == 2
+
+    clock.advance(5.0)
+    assert breaker.state is CircuitState.OPEN
+
+    clock.advance(5.0)
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+def test_half_open_limits_concurrent_probes():
+    breaker, clock = make_breaker(half_open_max_calls=2)
+    trip(breaker)
+    clock.advance(10.0)
+
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_errors_outside_failure_on_do_not_open():
+    breaker, _ = make_breaker(failure_on=(ConnectionError,))
+
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            breaker.call(lambda: int("x"))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_call_async_follows_the_same_transitions():
+    breaker, clock = make_breaker()
+
+    async def afail():
+        fail()
+
+    async def aok():
+        return "ok"
+
+    async def run():
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await breaker.call_async(afail)
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call_async(aok)
+
+        clock.advance(10.0)
+        return await breaker.call_async(aok)
+
+    assert asyncio.run(run()) == "ok"
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_registry_shares_instances_by_name():
+    first = get_circuit_breaker("test-registry", failure_threshold=2)
+    second = get_circuit_breaker("test-registry", failure_threshold=9)
+
+    assert first is second
+    assert second.failure_threshold == 2
@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter, TokenBucket, estimate_tokens
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # acquire() sleeps through the time module; sleeping advances the clock
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(sleep=clock.advance))
+    return clock
+
+
+def test_bucket_starts_full(clock):
+    bucket = TokenBucket(capacity=5, refill_per_second=1, clock=clock)
+
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+
+def test_bucket_wait_grows_with_the_deficit(clock):
+    bucket = TokenBucket(capacity=2, refill_per_second=2, clock=clock)
+
+    assert bucket.reserve(2) == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    # Queued behind the previous caller
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucket(capacity=4, refill_per_second=2, clock=clock)
+    bucket.reserve(4)
+
+    clock.advance(1.0)
+    assert bucket.reserve(2) == 0.0
+    assert bucket.reserve(1) == pytest.approx(0.5)
+
+    clock.advance(0.5)
+    assert bucket.reserve(1) == pytest.approx(0.5)
+
+
+def test_bucket_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(capacity=3, refill_per_second=1, clock=clock)
+
+    clock.advance(1000.0)
+
+    assert bucket.reserve(3) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+
+def test_oversized_request_is_clamped_to_capacity(clock):
+    bucket = TokenBucket(capacity=10, refill_per_second=1, clock=clock)
+
+    assert bucket.reserve(50) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+
+def test_limiter_waits_for_the_slower_limit(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600, clock=clock)
+
+    assert limiter.acquire(tokens=600) == 0.0
+    # One request token is left, but the token bucket needs 100 / 10 per s
+    assert limiter.acquire(tokens=100) == pytest.approx(10.0)
+    assert clock.now == pytest.approx(10.0)
+
+
+def test_limiter_paces_requests_per_minute(clock):
+    limiter = RateLimiter(requests_per_minute=120, clock=clock)
+
+    waits = [limiter.acquire() for _ in range(122)]
+
+    assert waits[:120] == [0.0] * 120
+    assert waits[120] == pytest.approx(0.5)
+    assert waits[121] == pytest.approx(0.5)
+
+
+def test_unlimited_limiter_never_waits(clock):
+    limiter = RateLimiter(clock=clock)
+
+    assert all(limiter.acquire(tokens=10_000) == 0.0 for _ in range(100))
+
+
+def test_invalid_bucket_settings_raise():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, refill_per_second=1)
+
+
+def test_estimate_tokens():
+    assert estimate_tokens([]) == 0
+    assert estimate_tokens(["abcd" * 10, ""]) == 11 + 1
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from utils import retry
+from utils.retry import (
+    RetryBudget,
+    async_exponential_backoff_retry_async,
+    sync_exponential_backoff_retry_sync,
+)
+
+
+class FakeTime:
+    """Stands in for the time module: sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class Flaky:
+    """Fails `failures` times, then returns "ok"."""
+
+    def __init__(self, failures, error=ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("down")
+        return "ok"
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(retry, "time", fake)
+    # Deterministic backoff: always the full delay
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    return fake
+
+
+def test_retries_until_success(fake_time):
+    fn = Flaky(failures=3)
+
+    assert sync_exponential_backoff_retry_sync(fn, attempts=5, base_delay=1.0) == "ok"
+    assert fn.calls == 4
+    assert fake_time.sleeps == [1.0, 2.0, 4.0]
+
+
+def test_backoff_is_capped_by_max_delay(fake_time):
+    fn = Flaky(failures=4)
+
+    sync_exponential_backoff_retry_sync(fn, attempts=5, base_delay=1.0, max_delay=3.0)
+
+    assert fake_time.sleeps == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_gives_up_after_attempts(fake_time):
+    fn = Flaky(failures=10)
+
+    with pytest.raises(ConnectionError):
+        sync_exponential_backoff_retry_sync(fn, attempts=3, base_delay=1.0)
+
+    assert fn.calls == 3
+
+
+def test_no_retry_is_scheduled_past_the_deadline(fake_time):
+    fn = Flaky(failures=10)
+
+    with pytest.raises(ConnectionError):
+        sync_exponential_backoff_retry_sync(fn, attempts=10, base_delay=1.0, deadline=5.0)
+
+    # Slept 1 + 2 = 3s; the next 4s sleep would end past the 5s deadline
+    assert fn.calls == 3
+    assert fake_time.sleeps == [1.0, 2.0]
+    assert fake_time.now < 5.0
+
+
+def test_only_retry_on_errors_are_retried(fake_time):
+    fn = Flaky(failures=1, error=ValueError)
+
+    with pytest.raises(ValueError):
+        sync_exponential_backoff_retry_sync(fn, retry_on=(ConnectionError,))
+
+    assert fn.calls == 1
+
+
+def test_should_retry_hook_can_refuse(fake_time):
+    fn = Flaky(failures=1)
+
+    with pytest.raises(ConnectionError):
+        sync_exponential_backoff_retry_sync(fn, should_retry=lambda exc: False)
+
+    assert fn.calls == 1
+
+
+def test_budget_deposits_per_request_and_spends_per_retry():
+    budget = RetryBudget(ratio=0.5, min_tokens=1.0, max_tokens=2.0)
+
+    budget.record_request()
+    assert budget.balance == 1.5
+
+    assert budget.try_acquire()
+    assert budget.balance == 0.5
+    assert not budget.try_acquire()
+
+    for _ in range(10):
+        budget.record_request()
+    assert budget.balance == 2.0
+
+
+def test_exhausted_budget_fails_fast(fake_time):
+    budget = RetryBudget(ratio=0.0, min_tokens=2.0, max_tokens=2.0)
+
+    first = Flaky(failures=10)
+    with pytest.raises(ConnectionError):
+        sync_exponential_backoff_retry_sync(first, attempts=5, base_delay=0.0, budget=budget)
+
+    # Two retries were affordable, then the budget ran out
+    assert first.calls == 3
+    assert budget.balance == 0.0
+
+    second = Flaky(failures=1)
+    with pytest.raises(ConnectionError):
+        sync_exponential_backoff_retry_sync(second, attempts=5, base_delay=0.0, budget=budget)
+
+    assert second.calls == 1
+
+
+def test_budget_is_not_spent_on_a_refused_retry(fake_time):
+    budget = RetryBudget(ratio=0.0, min_tokens=5.0, max_tokens=5.0)
+
+    with pytest.raises(ConnectionError):
+        sync_exponential_backoff_retry_sync(Flaky(failures=10), attempts=1, budget=budget)
+
+    assert budget.balance == 5.0
+
+
+def test_async_retry_shares_budget_semantics():
+    budget = RetryBudget(ratio=0.0, min_tokens=1.0, max_tokens=1.0)
+    fn = Flaky(failures=10)
+
+    async def call():
+        return fn()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(
+            async_exponential_backoff_retry_async(call, attempts=5, base_delay=0.0, budget=budget)
+        )
+
+    assert fn.calls == 2
+    assert budget.balance == 0.0